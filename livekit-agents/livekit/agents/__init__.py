@@ -44,12 +44,20 @@ from .version import __version__
 from .voice import Agent, AgentEvent, AgentSession, ModelSettings, RunContext, io
 from .voice.background_audio import AudioConfig, BackgroundAudioPlayer, BuiltinAudioClip
 from .voice.room_io import RoomInputOptions, RoomIO, RoomOutputOptions
-from .worker import SimulateJobInfo, Worker, WorkerOptions, WorkerPermissions, WorkerType
+from .worker import (
+    SimulateJobInfo,
+    Worker,
+    WorkerLoadOptions,
+    WorkerOptions,
+    WorkerPermissions,
+    WorkerType,
+)
 
 __all__ = [
     "__version__",
     "Worker",
     "WorkerOptions",
+    "WorkerLoadOptions",
     "WorkerType",
     "WorkerPermissions",
     "JobProcess",
@@ -1,6 +1,8 @@
+from . import spans
 from .tracing import Tracing, TracingGraph, TracingHandle
 
 __all__ = [
+    "spans",
     "Tracing",
     "TracingGraph",
     "TracingHandle",
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..log import logger
+
+# the spans are timed with time.perf_counter(), converted to unix time for the exports
+_PERF_EPOCH = time.perf_counter()
+_WALL_EPOCH = time.time()
+
+_current_span = contextvars.ContextVar["Span | None"]("current_span", default=None)
+_exporters: list[SpanExporter] = []
+
+
+@dataclass
+class SpanEvent:
+    name: str
+    timestamp: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class Span:
+    """
+    A timed stage of the voice pipeline, e.g the LLM inference of a speech.
+
+    The spans form a tree, the root span is exported to the registered exporters when it ends.
+    The timestamps are from time.perf_counter().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        parent: Span | None = None,
+        trace_id: str | None = None,
+        start_time: float | None = None,
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        self._name = name
+        self._parent = parent
+        self._trace_id = parent.trace_id if parent else (trace_id or os.urandom(16).hex())
+        self._span_id = os.urandom(8).hex()
+        self._start_time = start_time if start_time is not None else time.perf_counter()
+        self._end_time: float | None = None
+        self._attributes = attributes or {}
+        self._events: list[SpanEvent] = []
+        self._children: list[Span] = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def trace_id(self) -> str:
+        return self._trace_id
+
+    @property
+    def span_id(self) -> str:
+        return self._span_id
+
+    @property
+    def parent(self) -> Span | None:
+        return self._parent
+
+    @property
+    def start_time(self) -> float:
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, value: float) -> None:
+        self._start_time = value
+
+    @property
+    def end_time(self) -> float | None:
+        return self._end_time
+
+    @property
+    def duration(self) -> float | None:
+        if self._end_time is None:
+            return None
+
+        return self._end_time - self._start_time
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        return self._attributes
+
+    @property
+    def events(self) -> list[SpanEvent]:
+        return self._events
+
+    @property
+    def children(self) -> list[Span]:
+        return self._children
+
+    def start_child(
+        self,
+        name: str,
+        *,
+        start_time: float | None = None,
+        attributes: dict[str, Any] | None = None,
+    ) -> Span:
+        child = Span(name, parent=self, start_time=start_time, attributes=attributes)
+        self._children.append(child)
+        return child
+
+    def find(self, name: str) -> Span | None:
+        """first span of the tree with the given name"""
+        return next((span for span in self.walk() if span.name == name), None)
+
+    def walk(self) -> Iterator[Span]:
+        yield self
+        for child in self._children:
+            yield from child.walk()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self._attributes[key] = value
+
+    def add_event(
+        self,
+        name: str,
+        *,
+        timestamp: float | None = None,
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        self._events.append(
+            SpanEvent(
+                name=name,
+                timestamp=timestamp if timestamp is not None else time.perf_counter(),
+                attributes=attributes or {},
+            )
+        )
+
+    def end(self, *, end_time: float | None = None) -> None:
+        if self._end_time is not None:
+            return
+
+        self._end_time = end_time if end_time is not None else time.perf_counter()
+        if self._parent is None:
+            for exporter in _exporters:
+                try:
+                    exporter.export(self)
+                except Exception:
+                    logger.exception("failed to export span", extra={"span": self._name})
+
+    def to_dict(self) -> dict[str, Any]:
+        """the span tree with the timestamps relative to the start of the root span"""
+        root = self
+        while root._parent is not None:
+            root = root._parent
+
+        def _rel(t: float | None) -> float | None:
+            return t - root._start_time if t is not None else None
+
+        return {
+            "name": self._name,
+            "span_id": self._span_id,
+            "start": _rel(self._start_time),
+            "end": _rel(self._end_time),
+            "attributes": self._attributes,
+            "events": [
+                {"name": ev.name, "time": _rel(ev.timestamp), "attributes": ev.attributes}
+                for ev in self._events
+            ],
+            "children": [child.to_dict() for child in self._children],
+        }
+
+    def __repr__(self) -> str:
+        return f"Span(name={self._name!r}, duration={self.duration})"
+
+
+def current_span() -> Span | None:
+    """span of the pipeline stage running in the current context"""
+    return _current_span.get()
+
+
+def set_current_span(span: Span | None) -> None:
+    _current_span.set(span)
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """called with the root span of a tree when it ends"""
+
+
+def add_exporter(exporter: SpanExporter) -> None:
+    _exporters.append(exporter)
+
+
+def remove_exporter(exporter: SpanExporter) -> None:
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+class InMemorySpanExporter(SpanExporter):
+    """keep the last finished span trees in memory"""
+
+    def __init__(self, *, max_spans: int = 1000) -> None:
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    @property
+    def spans(self) -> list[Span]:
+        return list(self._spans)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+
+class OTLPFileSpanExporter(SpanExporter):
+    """
+    Append the span trees to a file, one OTLP/JSON ExportTraceServiceRequest per line.
+
+    The file can be loaded by the OpenTelemetry collector (otlpjsonfile receiver) or
+    converted to any tracing backend.
+    """
+
+    def __init__(self, path: str, *, service_name: str = "livekit-agents") -> None:
+        self._path = path
+        self._resource = {"attributes": _otlp_attributes({"service.name": service_name})}
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "livekit.agents"},
+                            "spans": [_otlp_span(s, span.end_time) for s in span.walk()],
+                        }
+                    ],
+                }
+            ]
+        }
+
+        line = json.dumps(request, separators=(",", ":"))
+        with self._lock, open(self._path, "a") as f:
+            f.write(line + "\n")
+
+
+def _unix_nano(t: float) -> str:
+    # int64 values are strings in OTLP/JSON
+    return str(int((t - _PERF_EPOCH + _WALL_EPOCH) * 1e9))
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items() if v is not None]
+
+
+def _otlp_span(span: Span, root_end_time: float | None) -> dict[str, Any]:
+    # the spans still running when the root ends (e.g a cancelled inference) end with the root
+    end_time = span.end_time or root_end_time or span.start_time
+    data: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": _unix_nano(span.start_time),
+        "endTimeUnixNano": _unix_nano(end_time),
+        "attributes": _otlp_attributes(span.attributes),
+        "events": [
+            {
+                "timeUnixNano": _unix_nano(ev.timestamp),
+                "name": ev.name,
+                "attributes": _otlp_attributes(ev.attributes),
+            }
+            for ev in span.events
+        ],
+    }
+    if span.parent is not None:
+        data["parentSpanId"] = span.parent.span_id
+
+    return data
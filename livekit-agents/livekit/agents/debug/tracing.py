@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import time
+from collections import deque
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
@@ -28,26 +30,40 @@ class TracingGraph:
         self._y_range = y_range
         self._max_data_points = max_data_points
         self._x_type = x_type
-        self._data: list[tuple[float | int, float]] = []
+        self._data: deque[tuple[float | int, float]] = deque(maxlen=max_data_points)
+        self._dropped = 0
 
     def plot(self, x: float | int, y: float) -> None:
+        if not Tracing._enabled:
+            return
+
+        if len(self._data) == self._max_data_points:
+            self._dropped += 1
+
         self._data.append((x, y))
-        if len(self._data) > self._max_data_points:
-            self._data.pop(0)
 
 
 class TracingHandle:
-    def __init__(self) -> None:
+    def __init__(self, *, max_events: int = 1000) -> None:
         self._kv = {}
-        self._events: list[dict] = []
+        self._events: deque[dict] = deque(maxlen=max_events)
+        self._dropped_events = 0
         self._graphs: list[TracingGraph] = []
 
     def store_kv(self, key: str, value: str | dict) -> None:
         self._kv[key] = value
 
     def log_event(self, name: str, data: dict | None) -> None:
+        # the oldest events are dropped once the buffer is full
+        if len(self._events) == self._events.maxlen:
+            self._dropped_events += 1
+
         self._events.append({"name": name, "data": data, "timestamp": time.time()})
 
+    def _set_max_events(self, max_events: int) -> None:
+        self._dropped_events += max(len(self._events) - max_events, 0)
+        self._events = deque(self._events, maxlen=max_events)
+
     def add_graph(
         self,
         *,
@@ -65,7 +81,8 @@ class TracingHandle:
     def _export(self) -> dict[str, Any]:
         return {
             "kv": self._kv,
-            "events": self._events,
+            "events": list(self._events),
+            "dropped_events": self._dropped_events,
             "graph": [
                 {
                     "title": chart._title,
@@ -73,7 +90,8 @@ class TracingHandle:
                     "y_label": chart._y_label,
                     "y_range": chart._y_range,
                     "x_type": chart._x_type,
-                    "data": chart._data,
+                    "data": list(chart._data),
+                    "dropped": chart._dropped,
                 }
                 for chart in self._graphs
             ],
@@ -82,17 +100,41 @@ class TracingHandle:
 
 class Tracing:
     _instance = None
+    _enabled = True
+    _max_events = 1000
 
     def __init__(self):
         self._handles: dict[str, TracingHandle] = {}
 
+    @classmethod
+    def configure(cls, *, enabled: bool | None = None, max_events: int | None = None) -> None:
+        """
+        Args:
+            enabled: when disabled, the events, key/values and graph points are dropped
+                without being stored.
+            max_events: number of events kept by each handle, the oldest events are dropped
+                (and counted in ``dropped_events``) once it is reached.
+        """
+        if enabled is not None:
+            cls._enabled = enabled
+
+        if max_events is not None:
+            cls._max_events = max_events
+            if cls._instance is not None:
+                for handle in cls._instance._handles.values():
+                    handle._set_max_events(max_events)
+
+    @staticmethod
+    def enabled() -> bool:
+        return Tracing._enabled
+
     @classmethod
     def with_handle(cls, handle: str) -> TracingHandle:
         if cls._instance is None:
             cls._instance = cls()
 
         if handle not in cls._instance._handles:
-            cls._instance._handles[handle] = TracingHandle()
+            cls._instance._handles[handle] = TracingHandle(max_events=cls._max_events)
 
         return cls._instance._handles[handle]
 
@@ -112,10 +154,16 @@ class Tracing:
 
     @staticmethod
     def store_kv(key: str, value: str | dict) -> None:
+        if not Tracing._enabled:
+            return
+
         Tracing._get_current_handle().store_kv(key, value)
 
     @staticmethod
     def log_event(name: str, data: dict | None = None) -> None:
+        if not Tracing._enabled:
+            return
+
         Tracing._get_current_handle().log_event(name, data)
 
     @staticmethod
@@ -158,6 +206,7 @@ def _create_tracing_app(w: Worker) -> web.Application:
                     "status": runner.status.name,
                     "job_id": runner.running_job.job.id if runner.running_job else None,
                     "room": runner.running_job.job.room.name if runner.running_job else None,
+                    "stats": dataclasses.asdict(runner.stats) if runner.stats else None,
                 }
                 for runner in w._proc_pool.processes
                 if runner.started and runner.running_job
@@ -179,6 +228,22 @@ def _create_tracing_app(w: Worker) -> web.Application:
         info = await asyncio.wait_for(runner.tracing_info(), timeout=5.0)  # proc could be stuck
         return web.json_response({"tracing": info})
 
+    async def runner_stalls(request: web.Request) -> web.Response:
+        runner_id = request.query.get("id")
+        if not runner_id:
+            return web.Response(status=400)
+
+        runner = next((r for r in w._proc_pool.processes if r.id == runner_id), None)
+        if not runner:
+            return web.Response(status=404)
+
+        info = await asyncio.wait_for(runner.tracing_info(), timeout=5.0)
+        if "stall_stacks" not in info:
+            return web.Response(status=404, text="stall profiler disabled")
+
+        # collapsed stacks, e.g `flamegraph.pl stalls.txt > stalls.svg`
+        return web.Response(text=info["stall_stacks"])
+
     async def worker(request: web.Request) -> web.Response:
         return web.json_response(
             {
@@ -187,10 +252,25 @@ def _create_tracing_app(w: Worker) -> web.Application:
             }
         )
 
+    async def load(request: web.Request) -> web.Response:
+        from ..worker import _DefaultLoadCalc
+
+        data: dict[str, Any] = {"load": w._worker_load, "signals": None}
+        if w._opts.load_fnc == _DefaultLoadCalc.get_load:
+            signals, weights = _DefaultLoadCalc.get_signals(w), _DefaultLoadCalc.get_weights(w)
+            data["signals"] = {
+                name: {"usage": usage, "weight": weights[name], "load": usage * weights[name]}
+                for name, usage in signals.items()
+            }
+
+        return web.json_response(data)
+
     app = web.Application()
     app.add_routes([web.get("", tracing_index)])
     app.add_routes([web.get("/", tracing_index)])
     app.add_routes([web.get("/runners/", runners)])
     app.add_routes([web.get("/runner/", runner)])
+    app.add_routes([web.get("/runner/stalls/", runner_stalls)])
     app.add_routes([web.get("/worker/", worker)])
+    app.add_routes([web.get("/load/", load)])
     return app
@@ -72,6 +72,10 @@ class InferenceProcExecutor(SupervisedProc):
                 with contextlib.suppress(asyncio.InvalidStateError):
                     fut.set_result(msg)
 
+    @property
+    def pending_requests(self) -> int:
+        return len(self._active_requests)
+
     async def do_inference(self, method: str, data: bytes) -> bytes | None:
         if not self.started:
             raise RuntimeError("process not started")
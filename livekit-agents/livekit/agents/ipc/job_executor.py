@@ -4,6 +4,7 @@ from enum import Enum
 from typing import Any, Protocol
 
 from ..job import RunningJobInfo
+from .proto import ProcStats
 
 
 class JobExecutor(Protocol):
@@ -25,6 +26,11 @@ class JobExecutor(Protocol):
     @property
     def status(self) -> JobStatus: ...
 
+    @property
+    def stats(self) -> ProcStats | None:
+        """last resource usage reported by the job"""
+        ...
+
     async def start(self) -> None: ...
 
     async def join(self) -> None: ...
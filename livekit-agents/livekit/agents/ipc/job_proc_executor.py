@@ -33,6 +33,7 @@ class ProcJobExecutor(SupervisedProc):
         high_ping_threshold: float,
         mp_ctx: BaseContext,
         loop: asyncio.AbstractEventLoop,
+        stall_profiler_threshold: float = 0.0,
     ) -> None:
         super().__init__(
             initialize_timeout=initialize_timeout,
@@ -44,6 +45,7 @@ class ProcJobExecutor(SupervisedProc):
             high_ping_threshold=high_ping_threshold,
             mp_ctx=mp_ctx,
             loop=loop,
+            stall_profiler_threshold=stall_profiler_threshold,
         )
 
         self._user_args: Any | None = None
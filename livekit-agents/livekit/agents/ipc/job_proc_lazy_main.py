@@ -193,12 +193,11 @@ class _JobProc:
                     except Exception:
                         logger.exception("error while exeuting tracing tasks")
 
-                    await self._client.send(
-                        TracingResponse(
-                            request_id=msg.request_id,
-                            info=tracing.Tracing._get_job_handle(self._job_ctx.job.id)._export(),
-                        )
-                    )
+                    info = tracing.Tracing._get_job_handle(self._job_ctx.job.id)._export()
+                    if self._client.stall_profiler is not None:
+                        info["stall_stacks"] = self._client.stall_profiler.collapsed()
+
+                    await self._client.send(TracingResponse(request_id=msg.request_id, info=info))
 
         read_task = asyncio.create_task(_read_ipc_task(), name="job_ipc_read")
 
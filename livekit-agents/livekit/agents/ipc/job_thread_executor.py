@@ -25,6 +25,7 @@ class _ProcOpts:
     close_timeout: float
     ping_interval: float
     high_ping_threshold: float
+    stall_profiler_threshold: float
 
 
 class ThreadJobExecutor:
@@ -39,6 +40,7 @@ class ThreadJobExecutor:
         ping_interval: float,
         high_ping_threshold: float,
         loop: asyncio.AbstractEventLoop,
+        stall_profiler_threshold: float = 0.0,
     ) -> None:
         self._loop = loop
         self._opts = _ProcOpts(
@@ -48,6 +50,7 @@ class ThreadJobExecutor:
             close_timeout=close_timeout,
             ping_interval=ping_interval,
             high_ping_threshold=high_ping_threshold,
+            stall_profiler_threshold=stall_profiler_threshold,
         )
 
         self._user_args: Any | None = None
@@ -62,6 +65,7 @@ class ThreadJobExecutor:
         self._inference_executor = inference_executor
         self._inference_tasks: list[asyncio.Task[None]] = []
         self._id = utils.shortuuid("THEXEC_")
+        self._stats: proto.ProcStats | None = None
         self._tracing_requests = dict[str, asyncio.Future[proto.TracingResponse]]()
 
     @property
@@ -87,6 +91,10 @@ class ThreadJobExecutor:
 
         return self._job_status
 
+    @property
+    def stats(self) -> proto.ProcStats | None:
+        return self._stats
+
     @property
     def started(self) -> bool:
         return self._main_atask is not None
@@ -152,7 +160,10 @@ class ThreadJobExecutor:
                 await asyncio.shield(self._main_atask)
 
     async def initialize(self) -> None:
-        await channel.asend_message(self._pch, proto.InitializeRequest())
+        await channel.asend_message(
+            self._pch,
+            proto.InitializeRequest(stall_profiler_threshold=self._opts.stall_profiler_threshold),
+        )
 
         try:
             init_res = await asyncio.wait_for(
@@ -276,6 +287,9 @@ class ThreadJobExecutor:
                         extra={"delay": delay, **self.logging_extra()},
                     )
 
+            if isinstance(msg, proto.ProcStats):
+                self._stats = msg
+
             if isinstance(msg, proto.Exiting):
                 logger.debug("job exiting", extra={"reason": msg.reason, **self.logging_extra()})
 
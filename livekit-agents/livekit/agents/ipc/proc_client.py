@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import gc
 import logging
+import os
 import socket
 import sys
+import threading
+import time
 from collections.abc import Coroutine
-from typing import Callable
+from typing import Any, Callable
 
 from ..log import logger
-from ..utils import aio, log_exceptions, time_ms
+from ..utils import MovingPercentile, aio, log_exceptions, time_ms
 from .channel import Message, arecv_message, asend_message, recv_message, send_message
 from .log_queue import LogQueueHandler
 from .proto import (
@@ -18,8 +22,12 @@ from .proto import (
     InitializeResponse,
     PingRequest,
     PongResponse,
+    ProcStats,
 )
 
+LOOP_LAG_INTERVAL = 0.1
+LOOP_LAG_WINDOW = 100  # samples, 10s
+
 
 class _ProcClient:
     def __init__(
@@ -35,6 +43,13 @@ class _ProcClient:
         self._main_task_fnc = main_task_fnc
         self._initialized = False
         self._log_handler: LogQueueHandler | None = None
+        self._stall_profiler: aio.debug.StallProfiler | None = None
+        self._loop_lag = MovingPercentile(LOOP_LAG_WINDOW)
+        self._gc_start = 0.0
+        self._gc_pause = 0.0
+        self._gc_collections = 0
+        self._last_cpu_time = 0.0
+        self._last_stats_time = 0.0
 
     def initialize_logger(self) -> None:
         if self._log_cch is None:
@@ -79,6 +94,12 @@ class _ProcClient:
         loop.slow_callback_duration = 0.1  # 100ms
         aio.debug.hook_slow_callbacks(2.0)
 
+        if self._init_req.stall_profiler_threshold > 0:
+            self._stall_profiler = aio.debug.StallProfiler(
+                loop, threshold=self._init_req.stall_profiler_threshold
+            )
+            self._stall_profiler.start()
+
         try:
             self._task = loop.create_task(self._monitor_task(), name="proc_client_main")
             while not self._task.done():
@@ -94,13 +115,53 @@ class _ProcClient:
             if self._log_handler is not None:
                 self._log_handler.close()
 
+            if self._stall_profiler is not None:
+                self._stall_profiler.stop()
+
             loop.run_until_complete(loop.shutdown_default_executor())
 
+    @property
+    def stall_profiler(self) -> aio.debug.StallProfiler | None:
+        return self._stall_profiler
+
     async def send(self, msg: Message) -> None:
         await asend_message(self._acch, msg)
 
+    def _gc_callback(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif phase == "stop" and self._gc_start:
+            self._gc_pause += time.perf_counter() - self._gc_start
+            self._gc_collections += 1
+
+    def _stats(self) -> ProcStats:
+        cpu_user, cpu_system = _cpu_times()
+        now = time.monotonic()
+        cpu_usage = 0.0
+        if self._last_stats_time:
+            cpu_usage = (cpu_user + cpu_system - self._last_cpu_time) / (
+                now - self._last_stats_time
+            )
+
+        self._last_cpu_time, self._last_stats_time = cpu_user + cpu_system, now
+        return ProcStats(
+            cpu_user=cpu_user,
+            cpu_system=cpu_system,
+            cpu_usage=max(cpu_usage, 0.0),
+            loop_lag_p50=self._loop_lag.get_percentile(50),
+            loop_lag_p95=self._loop_lag.get_percentile(95),
+            loop_lag_p99=self._loop_lag.get_percentile(99),
+            gc_pause=self._gc_pause,
+            gc_collections=self._gc_collections,
+            tasks=len(asyncio.all_tasks()),
+        )
+
     async def _monitor_task(self) -> None:
         self._acch = await aio.duplex_unix._AsyncDuplex.open(self._mp_cch)
+        # gc.callbacks is process-wide, the jobs running in a thread of the worker report 0
+        track_gc = threading.current_thread() is threading.main_thread()
+        if track_gc:
+            gc.callbacks.append(self._gc_callback)
         try:
             exit_flag = asyncio.Event()
             ping_timeout = aio.sleep(self._init_req.ping_timeout)
@@ -123,6 +184,7 @@ class _ProcClient:
                             self._acch,
                             PongResponse(last_timestamp=msg.timestamp, timestamp=time_ms()),
                         )
+                        await asend_message(self._acch, self._stats())
 
                     ipc_ch.send_nowait(msg)
 
@@ -134,7 +196,17 @@ class _ProcClient:
                     file=sys.stderr,
                 )
 
+            @log_exceptions(logger=logger)
+            async def _loop_lag_task() -> None:
+                # how late the loop wakes up a sleeping task, reported to the worker in ProcStats
+                while True:
+                    start = time.perf_counter()
+                    await asyncio.sleep(LOOP_LAG_INTERVAL)
+                    lag = time.perf_counter() - start - LOOP_LAG_INTERVAL
+                    self._loop_lag.add_sample(max(lag, 0.0))
+
             read_task = asyncio.create_task(_read_ipc_task(), name="ipc_read")
+            loop_lag_task = asyncio.create_task(_loop_lag_task(), name="loop_lag")
             health_check_task: asyncio.Task | None = None
             if self._init_req.ping_interval > 0:
                 health_check_task = asyncio.create_task(_self_health_check(), name="health_check")
@@ -155,8 +227,20 @@ class _ProcClient:
             main_task.add_done_callback(_done_cb)
 
             await exit_flag.wait()
-            await aio.cancel_and_wait(read_task, main_task)
+            await aio.cancel_and_wait(read_task, main_task, loop_lag_task)
             if health_check_task is not None:
                 await aio.cancel_and_wait(health_check_task)
         finally:
+            if track_gc:
+                gc.callbacks.remove(self._gc_callback)
             await self._acch.aclose()
+
+
+def _cpu_times() -> tuple[float, float]:
+    """user and system CPU time of the job"""
+    if threading.current_thread() is threading.main_thread():
+        times = os.times()
+        return times.user, times.system
+
+    # the thread executor shares the process with the worker, only the job thread is counted
+    return time.thread_time(), 0.0
@@ -40,6 +40,7 @@ class ProcPool(utils.EventEmitter[EventTypes]):
         memory_warn_mb: float,
         memory_limit_mb: float,
         loop: asyncio.AbstractEventLoop,
+        stall_profiler_threshold: float = 0.0,
     ) -> None:
         super().__init__()
         self._job_executor_type = job_executor_type
@@ -52,6 +53,7 @@ class ProcPool(utils.EventEmitter[EventTypes]):
         self._loop = loop
         self._memory_limit_mb = memory_limit_mb
         self._memory_warn_mb = memory_warn_mb
+        self._stall_profiler_threshold = stall_profiler_threshold
         self._default_num_idle_processes = num_idle_processes
         self._target_idle_processes = num_idle_processes
 
@@ -124,6 +126,7 @@ class ProcPool(utils.EventEmitter[EventTypes]):
                 ping_interval=2.5,
                 high_ping_threshold=0.5,
                 loop=self._loop,
+                stall_profiler_threshold=self._stall_profiler_threshold,
             )
         elif self._job_executor_type == JobExecutorType.PROCESS:
             proc = job_proc_executor.ProcJobExecutor(
@@ -139,6 +142,7 @@ class ProcPool(utils.EventEmitter[EventTypes]):
                 high_ping_threshold=0.5,
                 memory_warn_mb=self._memory_warn_mb,
                 memory_limit_mb=self._memory_limit_mb,
+                stall_profiler_threshold=self._stall_profiler_threshold,
             )
         else:
             raise ValueError(f"unsupported job executor: {self._job_executor_type}")
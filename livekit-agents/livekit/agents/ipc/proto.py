@@ -23,18 +23,21 @@ class InitializeRequest:
     high_ping_threshold: float = (
         0  # if ping is higher than this, process is considered unresponsive
     )
+    stall_profiler_threshold: float = 0  # 0 disables the StallProfiler
 
     def write(self, b: io.BytesIO) -> None:
         channel.write_bool(b, self.asyncio_debug)
         channel.write_float(b, self.ping_interval)
         channel.write_float(b, self.ping_timeout)
         channel.write_float(b, self.high_ping_threshold)
+        channel.write_float(b, self.stall_profiler_threshold)
 
     def read(self, b: io.BytesIO) -> None:
         self.asyncio_debug = channel.read_bool(b)
         self.ping_interval = channel.read_float(b)
         self.ping_timeout = channel.read_float(b)
         self.high_ping_threshold = channel.read_float(b)
+        self.stall_profiler_threshold = channel.read_float(b)
 
 
 @dataclass
@@ -216,6 +219,50 @@ class TracingResponse:
         self.info = pickle.loads(channel.read_bytes(b))
 
 
+@dataclass
+class ProcStats:
+    """resource usage of the subprocess, sent after each PongResponse"""
+
+    MSG_ID: ClassVar[int] = 11
+    cpu_user: float = 0.0
+    """user CPU time in seconds"""
+    cpu_system: float = 0.0
+    """system CPU time in seconds"""
+    cpu_usage: float = 0.0
+    """CPU usage since the previous report, 1.0 is a full core"""
+    loop_lag_p50: float = 0.0
+    loop_lag_p95: float = 0.0
+    loop_lag_p99: float = 0.0
+    gc_pause: float = 0.0
+    """total time spent in the garbage collector in seconds, always 0 for the thread executor
+    (the collector runs for the whole worker process)"""
+    gc_collections: int = 0
+    tasks: int = 0
+    """number of asyncio tasks not done"""
+
+    def write(self, b: io.BytesIO) -> None:
+        channel.write_double(b, self.cpu_user)
+        channel.write_double(b, self.cpu_system)
+        channel.write_double(b, self.cpu_usage)
+        channel.write_double(b, self.loop_lag_p50)
+        channel.write_double(b, self.loop_lag_p95)
+        channel.write_double(b, self.loop_lag_p99)
+        channel.write_double(b, self.gc_pause)
+        channel.write_long(b, self.gc_collections)
+        channel.write_int(b, self.tasks)
+
+    def read(self, b: io.BytesIO) -> None:
+        self.cpu_user = channel.read_double(b)
+        self.cpu_system = channel.read_double(b)
+        self.cpu_usage = channel.read_double(b)
+        self.loop_lag_p50 = channel.read_double(b)
+        self.loop_lag_p95 = channel.read_double(b)
+        self.loop_lag_p99 = channel.read_double(b)
+        self.gc_pause = channel.read_double(b)
+        self.gc_collections = channel.read_long(b)
+        self.tasks = channel.read_int(b)
+
+
 IPC_MESSAGES = {
     InitializeRequest.MSG_ID: InitializeRequest,
     InitializeResponse.MSG_ID: InitializeResponse,
@@ -228,4 +275,5 @@ IPC_MESSAGES = {
     InferenceResponse.MSG_ID: InferenceResponse,
     TracingRequest.MSG_ID: TracingRequest,
     TracingResponse.MSG_ID: TracingResponse,
+    ProcStats.MSG_ID: ProcStats,
 }
@@ -30,6 +30,7 @@ class _ProcOpts:
     ping_interval: float
     ping_timeout: float
     high_ping_threshold: float
+    stall_profiler_threshold: float
 
 
 class SupervisedProc(ABC):
@@ -45,6 +46,7 @@ class SupervisedProc(ABC):
         high_ping_threshold: float,
         mp_ctx: BaseContext,
         loop: asyncio.AbstractEventLoop,
+        stall_profiler_threshold: float = 0.0,
     ) -> None:
         self._loop = loop
         self._mp_ctx = mp_ctx
@@ -56,10 +58,12 @@ class SupervisedProc(ABC):
             ping_interval=ping_interval,
             ping_timeout=ping_timeout,
             high_ping_threshold=high_ping_threshold,
+            stall_profiler_threshold=stall_profiler_threshold,
         )
 
         self._exitcode: int | None = None
         self._pid: int | None = None
+        self._stats: proto.ProcStats | None = None
 
         self._supervise_atask: asyncio.Task[None] | None = None
         self._closing = False
@@ -77,6 +81,11 @@ class SupervisedProc(ABC):
     def exitcode(self) -> int | None:
         return self._exitcode
 
+    @property
+    def stats(self) -> proto.ProcStats | None:
+        """last resource usage reported by the process"""
+        return self._stats
+
     @property
     def killed(self) -> bool:
         return self._kill_sent
@@ -153,6 +162,7 @@ class SupervisedProc(ABC):
                 ping_interval=self._opts.ping_interval,
                 ping_timeout=self._opts.ping_timeout,
                 high_ping_threshold=self._opts.high_ping_threshold,
+                stall_profiler_threshold=self._opts.stall_profiler_threshold,
             ),
         )
 
@@ -304,6 +314,9 @@ class SupervisedProc(ABC):
                 with contextlib.suppress(aio.SleepFinished):
                     pong_timeout.reset()
 
+            if isinstance(msg, proto.ProcStats):
+                self._stats = msg
+
             if isinstance(msg, proto.Exiting):
                 logger.info(
                     "process exiting",
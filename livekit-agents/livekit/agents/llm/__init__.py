@@ -1,4 +1,11 @@
 from . import remote_chat_context, utils
+from .caching_adapter import (
+    CachedChunk,
+    CachingAdapter,
+    LLMCacheBackend,
+    MemoryLLMCache,
+    SqliteLLMCache,
+)
 from .chat_context import (
     AudioContent,
     ChatContent,
@@ -38,6 +45,8 @@ from .tool_context import (
     ToolChoice,
     ToolContext,
     ToolError,
+    ToolExecutor,
+    ToolLatencyHistogram,
     find_function_tools,
     function_tool,
     is_function_tool,
@@ -60,6 +69,11 @@ __all__ = [
     "ChatChunk",
     "CompletionUsage",
     "FallbackAdapter",
+    "CachingAdapter",
+    "CachedChunk",
+    "LLMCacheBackend",
+    "MemoryLLMCache",
+    "SqliteLLMCache",
     "AvailabilityChangedEvent",
     "ToolChoice",
     "is_function_tool",
@@ -68,6 +82,8 @@ __all__ = [
     "FunctionTool",
     "ToolContext",
     "ToolError",
+    "ToolExecutor",
+    "ToolLatencyHistogram",
     "StopResponse",
     "utils",
     "remote_chat_context",
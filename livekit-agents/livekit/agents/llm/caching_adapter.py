@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from ..log import logger
+from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
+from ..utils import is_given
+from . import utils as llm_utils
+from .chat_context import AudioContent, ChatContext, ImageContent
+from .llm import LLM, ChatChunk, LLMStream
+from .tool_context import FunctionTool, ToolChoice
+
+
+@dataclass
+class CachedChunk:
+    offset: float
+    """Seconds elapsed since the first chunk of the response"""
+    chunk: ChatChunk
+
+
+class LLMCacheBackend(ABC):
+    """Storage used by the CachingAdapter"""
+
+    @abstractmethod
+    async def get(self, key: str) -> list[CachedChunk] | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, chunks: list[CachedChunk], *, ttl: float | None) -> None: ...
+
+    async def aclose(self) -> None:
+        """Release the resources held by the backend"""
+        return None
+
+
+class MemoryLLMCache(LLMCacheBackend):
+    """In-memory LRU cache, local to the process"""
+
+    def __init__(self, *, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float | None, list[CachedChunk]]] = OrderedDict()
+
+    async def get(self, key: str) -> list[CachedChunk] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, chunks = entry
+        if expires_at is not None and expires_at < time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return chunks
+
+    async def set(self, key: str, chunks: list[CachedChunk], *, ttl: float | None) -> None:
+        self._entries[key] = (time.time() + ttl if ttl is not None else None, chunks)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class SqliteLLMCache(LLMCacheBackend):
+    """Disk cache backed by sqlite, can be shared by the processes of a node"""
+
+    def __init__(self, path: str, *, max_entries: int = 100_000) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, expires_at REAL, accessed_at REAL, data TEXT)"
+            )
+
+    def _get(self, key: str) -> list[CachedChunk] | None:
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT expires_at, data FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            expires_at, data = row
+            if expires_at is not None and expires_at < now:
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+
+            self._db.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+
+        return [
+            CachedChunk(offset=offset, chunk=ChatChunk.model_validate(chunk))
+            for offset, chunk in json.loads(data)
+        ]
+
+    def _set(self, key: str, chunks: list[CachedChunk], ttl: float | None) -> None:
+        now = time.time()
+        data = json.dumps([[c.offset, c.chunk.model_dump(mode="json")] for c in chunks])
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?)",
+                (key, now + ttl if ttl is not None else None, now, data),
+            )
+            self._db.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,))
+            self._db.execute(
+                "DELETE FROM llm_cache WHERE key NOT IN "
+                "(SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT ?)",
+                (self._max_entries,),
+            )
+
+    async def get(self, key: str) -> list[CachedChunk] | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, chunks: list[CachedChunk], *, ttl: float | None) -> None:
+        await asyncio.to_thread(self._set, key, chunks, ttl)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class CachingAdapter(LLM[Any]):
+    def __init__(
+        self,
+        llm: LLM[Any],
+        *,
+        backend: LLMCacheBackend | None = None,
+        ttl: float | None = 24 * 3600,
+        namespace: str = "",
+        replay_pacing: bool = True,
+    ) -> None:
+        """
+        Cache the responses of an LLM, keyed on the chat context, the tools, the settings of
+        the request and the options of the wrapped LLM (model, temperature, ...). Useful for
+        deterministic prompts (e.g. greetings with fixed instructions).
+
+        Responses containing tool calls and requests containing images or audio are never cached.
+
+        Args:
+            llm: The LLM to wrap.
+            backend: Where the responses are stored, defaults to an in-memory LRU.
+            ttl: Time to live of the cached responses in seconds, None to never expire.
+            namespace: Added to the cache key, change it to invalidate the cached responses
+                (e.g. when the wrapped LLM behaves differently with the same options).
+            replay_pacing: Replay the cached chunks with their original inter-chunk timing
+                (the first chunk is sent immediately).
+        """
+        super().__init__()
+        self._llm = llm
+        self._backend = backend or MemoryLLMCache()
+        self._ttl = ttl
+        self._namespace = namespace
+        self._replay_pacing = replay_pacing
+
+    @property
+    def llm(self) -> LLM[Any]:
+        return self._llm
+
+    def chat(
+        self,
+        *,
+        chat_ctx: ChatContext,
+        tools: list[FunctionTool] | None = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+        parallel_tool_calls: NotGivenOr[bool] = NOT_GIVEN,
+        tool_choice: NotGivenOr[ToolChoice] = NOT_GIVEN,
+        extra_kwargs: NotGivenOr[dict[str, Any]] = NOT_GIVEN,
+    ) -> LLMStream:
+        return CachingLLMStream(
+            self,
+            chat_ctx=chat_ctx,
+            tools=tools or [],
+            conn_options=conn_options,
+            parallel_tool_calls=parallel_tool_calls,
+            tool_choice=tool_choice,
+            extra_kwargs=extra_kwargs,
+        )
+
+    async def aclose(self) -> None:
+        await self._backend.aclose()
+
+    def _cache_key(
+        self,
+        *,
+        chat_ctx: ChatContext,
+        tools: list[FunctionTool],
+        parallel_tool_calls: NotGivenOr[bool],
+        tool_choice: NotGivenOr[ToolChoice],
+        extra_kwargs: NotGivenOr[dict[str, Any]],
+    ) -> str | None:
+        """Canonical hash of the request, None if the request can't be cached"""
+        call_ids: dict[str, int] = {}
+        items = []
+        for item in chat_ctx.items:
+            if item.type == "message" and any(
+                isinstance(c, (ImageContent, AudioContent)) for c in item.content
+            ):
+                return None
+
+            # ids are random, call_ids are generated by the provider
+            item_dict = item.model_dump(mode="json", exclude={"id", "hash"}, exclude_none=True)
+            if "call_id" in item_dict:
+                item_dict["call_id"] = call_ids.setdefault(item_dict["call_id"], len(call_ids))
+
+            items.append(item_dict)
+
+        request = {
+            "namespace": self._namespace,
+            "llm": self._llm.label,
+            "llm_options": _llm_options(self._llm),
+            "items": items,
+            "tools": sorted(
+                (
+                    llm_utils.build_legacy_openai_schema(tool, internally_tagged=True)
+                    for tool in tools
+                ),
+                key=lambda schema: schema["name"],
+            ),
+            "parallel_tool_calls": parallel_tool_calls if is_given(parallel_tool_calls) else None,
+            "tool_choice": tool_choice if is_given(tool_choice) else None,
+            "extra_kwargs": extra_kwargs if is_given(extra_kwargs) else None,
+        }
+        try:
+            serialized = json.dumps(request, sort_keys=True, separators=(",", ":"))
+        except TypeError:
+            return None
+
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _llm_options(llm: LLM[Any]) -> str:
+    # the plugins keep the model and the sampling options of their LLM in an _opts dataclass
+    opts = getattr(llm, "_opts", None)
+    if dataclasses.is_dataclass(opts) and not isinstance(opts, type):
+        options = {f.name: getattr(opts, f.name) for f in dataclasses.fields(opts)}
+    else:
+        options = {"model": getattr(llm, "model", None)}
+
+    # NOT_GIVEN and the enums aren't JSON serializable
+    return json.dumps(options, sort_keys=True, default=repr)
+
+
+class CachingLLMStream(LLMStream):
+    def __init__(
+        self,
+        llm: CachingAdapter,
+        *,
+        chat_ctx: ChatContext,
+        tools: list[FunctionTool],
+        conn_options: APIConnectOptions,
+        parallel_tool_calls: NotGivenOr[bool],
+        tool_choice: NotGivenOr[ToolChoice],
+        extra_kwargs: NotGivenOr[dict[str, Any]],
+    ) -> None:
+        # retries are handled by the wrapped LLM
+        super().__init__(
+            llm,
+            chat_ctx=chat_ctx,
+            tools=tools,
+            conn_options=dataclasses.replace(conn_options, max_retry=0),
+        )
+        self._caching_adapter = llm
+        self._wrapped_conn_options = conn_options
+        self._parallel_tool_calls = parallel_tool_calls
+        self._tool_choice = tool_choice
+        self._extra_kwargs = extra_kwargs
+
+    async def _run(self) -> None:
+        adapter = self._caching_adapter
+        key = adapter._cache_key(
+            chat_ctx=self._chat_ctx,
+            tools=self._tools,
+            parallel_tool_calls=self._parallel_tool_calls,
+            tool_choice=self._tool_choice,
+            extra_kwargs=self._extra_kwargs,
+        )
+
+        if key is not None:
+            try:
+                cached = await adapter._backend.get(key)
+            except Exception:
+                logger.exception("failed to read the LLM cache")
+                cached = None
+
+            if cached is not None:
+                self._cache_hit = True
+                await self._replay(cached)
+                return
+
+            self._cache_hit = False
+
+        chunks: list[CachedChunk] = []
+        first_chunk_time: float | None = None
+        has_tool_calls = False
+        async with adapter._llm.chat(
+            chat_ctx=self._chat_ctx,
+            tools=self._tools,
+            conn_options=self._wrapped_conn_options,
+            parallel_tool_calls=self._parallel_tool_calls,
+            tool_choice=self._tool_choice,
+            extra_kwargs=self._extra_kwargs,
+        ) as stream:
+            async for chunk in stream:
+                now = time.perf_counter()
+                if first_chunk_time is None:
+                    first_chunk_time = now
+
+                if chunk.delta is not None and chunk.delta.tool_calls:
+                    has_tool_calls = True
+
+                chunks.append(CachedChunk(offset=now - first_chunk_time, chunk=chunk))
+                self._event_ch.send_nowait(chunk)
+
+        if key is None or has_tool_calls or not chunks:
+            return
+
+        try:
+            await adapter._backend.set(key, chunks, ttl=adapter._ttl)
+        except Exception:
+            logger.exception("failed to write the LLM cache")
+
+    async def _replay(self, cached: list[CachedChunk]) -> None:
+        start_time = time.perf_counter()
+        for cached_chunk in cached:
+            if self._caching_adapter._replay_pacing:
+                delay = cached_chunk.offset - (time.perf_counter() - start_time)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            # usage isn't replayed, cached responses don't consume tokens
+            self._event_ch.send_nowait(cached_chunk.chunk.model_copy(update={"usage": None}))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import functools
 import time
 from collections.abc import AsyncIterable
 from dataclasses import dataclass
@@ -9,7 +10,9 @@ from typing import Any, Literal
 
 from livekit.agents._exceptions import APIConnectionError, APIError
 
+from .. import utils
 from ..log import logger
+from ..metrics import LLMMetrics
 from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
 from .chat_context import ChatContext
 from .llm import LLM, ChatChunk, LLMStream, ToolChoice
@@ -24,6 +27,7 @@ DEFAULT_FALLBACK_API_CONNECT_OPTIONS = APIConnectOptions(
 class _LLMStatus:
     available: bool
     recovering_task: asyncio.Task | None
+    stats: utils.ProviderStats
 
 
 @dataclass
@@ -42,7 +46,20 @@ class FallbackAdapter(
         attempt_timeout: float = 10.0,
         max_retry_per_llm: int = 1,
         retry_interval: float = 5,
+        dynamic_ranking: bool = False,
+        exploration: float = 0.05,
     ) -> None:
+        """
+        Args:
+            llm: The LLM instances to use, in order of preference.
+            attempt_timeout: Timeout for each generation attempt in seconds.
+            max_retry_per_llm: Maximum number of retries per LLM instance.
+            retry_interval: Interval between the retries in seconds.
+            dynamic_ranking: Try the available LLM instances by their recent time to first token
+                and error rate instead of the list order.
+            exploration: With dynamic ranking, the probability of trying another available LLM
+                first to keep its statistics up to date.
+        """
         if len(llm) < 1:
             raise ValueError("at least one LLM instance must be provided.")
 
@@ -52,10 +69,31 @@ class FallbackAdapter(
         self._attempt_timeout = attempt_timeout
         self._max_retry_per_llm = max_retry_per_llm
         self._retry_interval = retry_interval
-
-        self._status = [
-            _LLMStatus(available=True, recovering_task=None) for _ in self._llm_instances
-        ]
+        self._dynamic_ranking = dynamic_ranking
+        self._exploration = exploration
+
+        self._status: list[_LLMStatus] = []
+        for instance in self._llm_instances:
+            status = _LLMStatus(available=True, recovering_task=None, stats=utils.ProviderStats())
+            self._status.append(status)
+            instance.on("metrics_collected", functools.partial(self._on_metrics_collected, status))
+
+    def _on_metrics_collected(self, status: _LLMStatus, metrics: LLMMetrics) -> None:
+        if metrics.cancelled or metrics.cache_hit or metrics.ttft < 0:
+            return
+
+        status.stats.add_ttfb(metrics.ttft)
+
+    def _ranked(self) -> list[int]:
+        """indices of the LLM instances in the order they should be tried"""
+        if not self._dynamic_ranking:
+            return list(range(len(self._status)))
+
+        return utils.rank_providers(
+            [status.stats for status in self._status],
+            available=[status.available for status in self._status],
+            exploration=self._exploration,
+        )
 
     def chat(
         self,
@@ -207,7 +245,8 @@ class FallbackLLMStream(LLMStream):
         if all_failed:
             logger.error("all LLMs are unavailable, retrying..")
 
-        for i, llm in enumerate(self._fallback_adapter._llm_instances):
+        for i in self._fallback_adapter._ranked():
+            llm = self._fallback_adapter._llm_instances[i]
             llm_status = self._fallback_adapter._status[i]
             if llm_status.available or all_failed:
                 chunk_sent = False
@@ -216,8 +255,10 @@ class FallbackLLMStream(LLMStream):
                         chunk_sent = True
                         self._event_ch.send_nowait(result)
 
+                    llm_status.stats.add_result(error=False)
                     return
                 except Exception:  # exceptions already logged inside _try_synthesize
+                    llm_status.stats.add_result(error=True)
                     if llm_status.available:
                         llm_status.available = False
                         self._fallback_adapter.emit(
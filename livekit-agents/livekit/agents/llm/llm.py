@@ -121,6 +121,7 @@ class LLMStream(ABC):
         self._event_ch = aio.Chan[ChatChunk]()
         self._event_aiter, monitor_aiter = aio.itertools.tee(self._event_ch, 2)
         self._current_attempt_has_error = False
+        self._cache_hit: bool | None = None  # set by streams replaying cached responses
         self._metrics_task = asyncio.create_task(
             self._metrics_monitor_task(monitor_aiter), name="LLM._metrics_task"
         )
@@ -203,7 +204,7 @@ class LLMStream(ABC):
             prompt_tokens=usage.prompt_tokens if usage else 0,
             total_tokens=usage.total_tokens if usage else 0,
             tokens_per_second=usage.completion_tokens / duration if usage else 0.0,
-            error=None,
+            cache_hit=self._cache_hit,
         )
         self._llm.emit("metrics_collected", metrics)
 
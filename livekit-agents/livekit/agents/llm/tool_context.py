@@ -14,9 +14,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import inspect
+import math
+import sys
+import time
+import weakref
 from collections.abc import Awaitable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     Any,
     Callable,
@@ -31,6 +37,9 @@ from typing import (
 
 from typing_extensions import Required, TypedDict, TypeGuard
 
+from ..log import logger
+from ..metrics import ToolMetrics
+
 
 # Used by ToolChoice
 class Function(TypedDict, total=False):
@@ -79,6 +88,11 @@ class StopResponse(Exception):
 class _FunctionToolInfo:
     name: str
     description: str | None
+    timeout: float | None = None
+    max_concurrency: int | None = None
+    blocking: bool = True
+    # derived data (arguments model, provider schemas) computed lazily by llm.utils
+    _cache: dict[Any, Any] = field(default_factory=dict, repr=False, compare=False)
 
 
 @runtime_checkable
@@ -93,19 +107,52 @@ F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
 
 @overload
 def function_tool(
-    f: F, *, name: str | None = None, description: str | None = None
+    f: F,
+    *,
+    name: str | None = None,
+    description: str | None = None,
+    timeout: float | None = None,
+    max_concurrency: int | None = None,
+    blocking: bool = True,
 ) -> FunctionTool: ...
 
 
 @overload
 def function_tool(
-    f: None = None, *, name: str | None = None, description: str | None = None
+    f: None = None,
+    *,
+    name: str | None = None,
+    description: str | None = None,
+    timeout: float | None = None,
+    max_concurrency: int | None = None,
+    blocking: bool = True,
 ) -> Callable[[F], FunctionTool]: ...
 
 
 def function_tool(
-    f: F | None = None, *, name: str | None = None, description: str | None = None
+    f: F | None = None,
+    *,
+    name: str | None = None,
+    description: str | None = None,
+    timeout: float | None = None,
+    max_concurrency: int | None = None,
+    blocking: bool = True,
 ) -> FunctionTool | Callable[[F], FunctionTool]:
+    """
+    Args:
+        timeout: Maximum execution time in seconds, the LLM receives an error when exceeded.
+        max_concurrency: Maximum number of concurrent executions of this tool, shared by every
+            session running on the same event loop (each job runs its own loop).
+        blocking: When False, the follow-up LLM step starts without waiting for this tool, with
+            a placeholder as the tool output. The placeholder is replaced by the output once
+            available, and a new reply is generated.
+    """
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be greater than 0")
+
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
     def deco(func: F) -> FunctionTool:
         from docstring_parser import parse_from_object
 
@@ -113,6 +160,9 @@ def function_tool(
         info = _FunctionToolInfo(
             name=name or func.__name__,
             description=description or docstring.description,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            blocking=blocking,
         )
         setattr(func, "__livekit_agents_ai_callable", info)
         return cast(FunctionTool, func)
@@ -139,16 +189,177 @@ def find_function_tools(cls_or_obj: Any) -> list[FunctionTool]:
     return methods
 
 
+class ToolLatencyHistogram:
+    """Cumulative histogram of the execution time of a function tool"""
+
+    BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf)
+    """Upper bounds of the buckets in seconds"""
+
+    def __init__(self) -> None:
+        self._counts = [0] * len(self.BUCKETS)
+        self._count = 0
+        self._sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def observe(self, duration: float) -> None:
+        self._counts[bisect.bisect_left(self.BUCKETS, duration)] += 1
+        self._count += 1
+        self._sum += duration
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket containing the p-th percentile (0 < p <= 100)"""
+        if self._count == 0:
+            return 0.0
+
+        rank = math.ceil(self._count * p / 100.0)
+        cumulative = 0
+        for bound, count in zip(self.BUCKETS, self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+
+        return math.inf
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "buckets": [
+                {"le": bound, "count": count} for bound, count in zip(self.BUCKETS, self._counts)
+            ],
+            "count": self._count,
+            "sum": self._sum,
+        }
+
+
+class ToolExecutor:
+    """Executes function tools while enforcing their `timeout` and `max_concurrency` options.
+
+    The default executor is shared by every ToolContext of the process. The latency histograms
+    are per process, the concurrency limits are per event loop, so per job when jobs run in
+    threads.
+    """
+
+    def __init__(self) -> None:
+        # asyncio primitives are bound to a loop (thread executors run a loop per job)
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        self._histograms: dict[str, ToolLatencyHistogram] = {}
+
+    def latency_histograms(self) -> dict[str, ToolLatencyHistogram]:
+        return self._histograms.copy()
+
+    def _semaphore(self, info: _FunctionToolInfo) -> asyncio.Semaphore | None:
+        if info.max_concurrency is None:
+            return None
+
+        loop_semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if info.name not in loop_semaphores:
+            loop_semaphores[info.name] = asyncio.Semaphore(info.max_concurrency)
+
+        return loop_semaphores[info.name]
+
+    async def execute(
+        self,
+        tool: FunctionTool,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        speech_id: str | None = None,
+        on_metrics: Callable[[ToolMetrics], None] | None = None,
+    ) -> Any:
+        """Run the tool inside the current task.
+
+        Raises:
+            ToolError: if the tool didn't complete within its timeout.
+        """
+        info = get_function_info(tool)
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+
+        semaphore = self._semaphore(info)
+        if semaphore is not None:
+            await semaphore.acquire()
+
+        started_at = time.perf_counter()
+        timed_out = False
+        error = False
+        timeout_handle: asyncio.TimerHandle | None = None
+        current_task = asyncio.current_task()
+        assert current_task is not None
+        if info.timeout is not None:
+            # don't use asyncio.wait_for, the tool must keep running inside the current task
+
+            def _on_timeout() -> None:
+                nonlocal timed_out
+                timed_out = True
+                current_task.cancel()
+
+            timeout_handle = loop.call_later(info.timeout, _on_timeout)
+
+        try:
+            return await tool(*args, **kwargs)
+        except asyncio.CancelledError:
+            if timed_out:
+                error = True
+                if sys.version_info >= (3, 11):
+                    current_task.uncancel()
+
+                logger.warning(
+                    "function tool timed out",
+                    extra={"function": info.name, "timeout": info.timeout},
+                )
+                raise ToolError(f"`{info.name}` timed out after {info.timeout}s") from None
+
+            raise
+        except StopResponse:
+            raise
+        except Exception:
+            error = True
+            raise
+        finally:
+            if timeout_handle is not None:
+                timeout_handle.cancel()
+
+            if semaphore is not None:
+                semaphore.release()
+
+            duration = time.perf_counter() - started_at
+            self._histograms.setdefault(info.name, ToolLatencyHistogram()).observe(duration)
+            if on_metrics is not None:
+                on_metrics(
+                    ToolMetrics(
+                        label=info.name,
+                        timestamp=time.time(),
+                        duration=duration,
+                        queue_duration=started_at - queued_at,
+                        timed_out=timed_out,
+                        error=error,
+                        speech_id=speech_id,
+                    )
+                )
+
+
+_default_executor = ToolExecutor()
+
+
 class ToolContext:
     """Stateless container for a set of AI functions"""
 
-    def __init__(self, tools: list[FunctionTool]) -> None:
+    def __init__(self, tools: list[FunctionTool], *, executor: ToolExecutor | None = None) -> None:
+        self._executor = executor or _default_executor
         self.update_tools(tools)
 
     @classmethod
     def empty(cls) -> ToolContext:
         return cls([])
 
+    @property
+    def executor(self) -> ToolExecutor:
+        return self._executor
+
     @property
     def function_tools(self) -> dict[str, FunctionTool]:
         return self._tools_map.copy()
@@ -168,4 +379,4 @@ class ToolContext:
             self._tools_map[info.name] = tool
 
     def copy(self) -> ToolContext:
-        return ToolContext(self._tools.copy())
+        return ToolContext(self._tools.copy(), executor=self._executor)
@@ -8,6 +8,7 @@ from typing import (
     Annotated,
     Any,
     Callable,
+    cast,
     get_args,
     get_origin,
     get_type_hints,
@@ -24,7 +25,7 @@ from livekit.agents import llm, utils
 from ..log import logger
 from . import _strict
 from .chat_context import ChatContext
-from .tool_context import FunctionTool, get_function_info
+from .tool_context import FunctionTool, get_function_info, is_function_tool
 
 if TYPE_CHECKING:
     from ..voice.events import RunContext
@@ -168,20 +169,27 @@ def build_legacy_openai_schema(
     function_tool: FunctionTool, *, internally_tagged: bool = False
 ) -> dict[str, Any]:
     """non-strict mode tool description
-    see https://serde.rs/enum-representations.html for the internally tagged representation"""
+    see https://serde.rs/enum-representations.html for the internally tagged representation
+
+    The returned schema is cached on the tool and must not be mutated."""
+    cache = _get_tool_cache(function_tool)
+    cache_key = ("legacy_openai_schema", internally_tagged, inspect.ismethod(function_tool))
+    if cache_key in cache:
+        return cast(dict[str, Any], cache[cache_key])
+
     model = function_arguments_to_pydantic_model(function_tool)
     info = get_function_info(function_tool)
     schema = model.model_json_schema()
 
     if internally_tagged:
-        return {
+        desc = {
             "name": info.name,
             "description": info.description or "",
             "parameters": schema,
             "type": "function",
         }
     else:
-        return {
+        desc = {
             "type": "function",
             "function": {
                 "name": info.name,
@@ -190,16 +198,26 @@ def build_legacy_openai_schema(
             },
         }
 
+    cache[cache_key] = desc
+    return desc
+
 
 def build_strict_openai_schema(
     function_tool: FunctionTool,
 ) -> dict[str, Any]:
-    """strict mode tool description"""
+    """strict mode tool description
+
+    The returned schema is cached on the tool and must not be mutated."""
+    cache = _get_tool_cache(function_tool)
+    cache_key = ("strict_openai_schema", inspect.ismethod(function_tool))
+    if cache_key in cache:
+        return cast(dict[str, Any], cache[cache_key])
+
     model = function_arguments_to_pydantic_model(function_tool)
     info = get_function_info(function_tool)
     schema = _strict.to_strict_json_schema(model)
 
-    return {
+    desc = {
         "type": "function",
         "function": {
             "name": info.name,
@@ -208,6 +226,8 @@ def build_strict_openai_schema(
             "parameters": schema,
         },
     }
+    cache[cache_key] = desc
+    return desc
 
 
 ResponseFormatT = TypeVar("ResponseFormatT", default=None)
@@ -266,9 +286,30 @@ def to_openai_response_format(response_format: type | dict) -> dict:
     }
 
 
-def function_arguments_to_pydantic_model(func: Callable) -> type[BaseModel]:
-    """Create a Pydantic model from a function’s signature. (excluding context types)"""
+def _get_tool_cache(func: Callable[..., Any]) -> dict[Any, Any]:
+    """Return the cache holding the data derived from a function tool.
+
+    Bound methods don't expose `self` in their signature, so cache keys must also include
+    `inspect.ismethod(func)`. Plain callables get a throwaway dict (nothing is cached)."""
+    if is_function_tool(func):
+        return get_function_info(func)._cache
 
+    return {}
+
+
+def function_arguments_to_pydantic_model(func: Callable[..., Any]) -> type[BaseModel]:
+    """Create a Pydantic model from a function’s signature. (excluding context types)
+
+    For function tools, the model is only built once and then reused."""
+    cache = _get_tool_cache(func)
+    cache_key = ("args_model", inspect.ismethod(func))
+    if cache_key not in cache:
+        cache[cache_key] = _build_arguments_model(func)
+
+    return cast(type[BaseModel], cache[cache_key])
+
+
+def _build_arguments_model(func: Callable[..., Any]) -> type[BaseModel]:
     from docstring_parser import parse_from_object
 
     fnc_name = func.__name__.split("_")
@@ -314,7 +355,7 @@ def function_arguments_to_pydantic_model(func: Callable) -> type[BaseModel]:
 
 def pydantic_model_to_function_arguments(
     *,
-    function_tool: Callable,
+    function_tool: Callable[..., Any],
     model: BaseModel,
     call_ctx: RunContext | None = None,
 ) -> tuple[tuple[Any, ...], dict[str, Any]]:
@@ -322,14 +363,23 @@ def pydantic_model_to_function_arguments(
     Convert a model’s fields into function args/kwargs.
     Raises TypeError if required params are missing
     """
-    signature = inspect.signature(function_tool)
-    type_hints = get_type_hints(function_tool, include_extras=True)
+    cache = _get_tool_cache(function_tool)
+    cache_key = ("call_signature", inspect.ismethod(function_tool))
+    if cache_key not in cache:
+        signature = inspect.signature(function_tool)
+        type_hints = get_type_hints(function_tool, include_extras=True)
+        context_params = [
+            param_name
+            for param_name in signature.parameters
+            if is_context_type(type_hints[param_name])
+        ]
+        cache[cache_key] = (signature, context_params)
+
+    signature, context_params = cache[cache_key]
 
     context_dict = {}
-    for param_name, _ in signature.parameters.items():
-        type_hint = type_hints[param_name]
-        if is_context_type(type_hint) and call_ctx is not None:
-            context_dict[param_name] = call_ctx
+    if call_ctx is not None:
+        context_dict = dict.fromkeys(context_params, call_ctx)
 
     bound = signature.bind(**{**model.model_dump(), **context_dict})
     bound.apply_defaults()
@@ -3,6 +3,7 @@ from .base import (
     EOUMetrics,
     LLMMetrics,
     STTMetrics,
+    ToolMetrics,
     TTSMetrics,
     VADMetrics,
 )
@@ -16,6 +17,7 @@ __all__ = [
     "EOUMetrics",
     "STTMetrics",
     "TTSMetrics",
+    "ToolMetrics",
     "UsageSummary",
     "UsageCollector",
     "log_metrics",
@@ -17,6 +17,8 @@ class LLMMetrics(BaseModel):
     prompt_tokens: int
     total_tokens: int
     tokens_per_second: float
+    cache_hit: bool | None = None
+    """Whether the response was replayed by a llm.CachingAdapter, None when not cached."""
     speech_id: str | None = None
 
 
@@ -31,6 +33,10 @@ class STTMetrics(BaseModel):
     """The duration of the pushed audio in seconds."""
     streamed: bool
     """Whether the STT is streaming (e.g using websocket)."""
+    gated_audio_duration: float = 0.0
+    """The duration of the audio not sent to the provider by the audio gate, in seconds."""
+    gated_audio_bytes: int = 0
+    """The size of the PCM audio not sent to the provider by the audio gate."""
 
 
 class TTSMetrics(BaseModel):
@@ -44,6 +50,10 @@ class TTSMetrics(BaseModel):
     cancelled: bool
     characters_count: int
     streamed: bool
+    cache_hit: bool | None = None
+    """Whether the audio was replayed by a tts.CachingAdapter, None when not cached."""
+    decode_time: float = 0.0
+    """Time spent decoding the audio received from the provider, in seconds."""
     speech_id: str | None = None
 
 
@@ -71,10 +81,25 @@ class EOUMetrics(BaseModel):
     speech_id: str | None = None
 
 
+class ToolMetrics(BaseModel):
+    type: Literal["tool_metrics"] = "tool_metrics"
+    label: str
+    """The name of the function tool."""
+    timestamp: float
+    duration: float
+    """Time spent executing the tool in seconds."""
+    queue_duration: float
+    """Time spent waiting for a free slot when the tool has a `max_concurrency` limit."""
+    timed_out: bool
+    error: bool
+    speech_id: str | None = None
+
+
 AgentMetrics = Union[
     STTMetrics,
     LLMMetrics,
     TTSMetrics,
     VADMetrics,
     EOUMetrics,
+    ToolMetrics,
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 
 from ..log import logger as default_logger
-from .base import AgentMetrics, EOUMetrics, LLMMetrics, STTMetrics, TTSMetrics
+from .base import AgentMetrics, EOUMetrics, LLMMetrics, STTMetrics, ToolMetrics, TTSMetrics
 
 
 def log_metrics(metrics: AgentMetrics, *, logger: logging.Logger | None = None):
@@ -24,3 +24,7 @@ def log_metrics(metrics: AgentMetrics, *, logger: logging.Logger | None = None):
         )
     elif isinstance(metrics, STTMetrics):
         logger.info(f"STT metrics: audio_duration={metrics.audio_duration:.2f}")
+    elif isinstance(metrics, ToolMetrics):
+        logger.info(
+            f"Tool metrics: function={metrics.label}, duration={metrics.duration:.2f}, queue_duration={metrics.queue_duration:.2f}, timed_out={metrics.timed_out}"  # noqa: E501
+        )
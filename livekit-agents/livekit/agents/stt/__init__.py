@@ -1,3 +1,4 @@
+from .audio_gate import AudioGateOptions
 from .fallback_adapter import AvailabilityChangedEvent, FallbackAdapter
 from .stream_adapter import StreamAdapter, StreamAdapterWrapper
 from .stt import (
@@ -13,6 +14,7 @@ from .stt import (
 )
 
 __all__ = [
+    "AudioGateOptions",
     "SpeechEventType",
     "SpeechEvent",
     "SpeechData",
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+from livekit import rtc
+
+from ..vad import VADEvent, VADEventType
+
+
+@dataclass
+class AudioGateOptions:
+    """
+    Stop sending audio to the STT provider while the VAD detects silence, the audio that
+    isn't sent doesn't count toward the provider usage.
+    """
+
+    pre_roll: float = 0.5
+    """audio sent before the detected start of speech, covers the VAD detection delay"""
+    hangover: float = 1.0
+    """audio still sent after the end of speech, so the provider can finalize the transcript"""
+    keepalive_interval: float | None = 5.0
+    """send a frame of silence this often while gated, so the provider doesn't close the
+    connection. ignored by the streams sending their own keepalive messages"""
+
+
+class _AudioGate:
+    def __init__(self, opts: AudioGateOptions, *, keepalive: bool) -> None:
+        self._opts = opts
+        self._keepalive_interval = opts.keepalive_interval if keepalive else None
+        self._speaking = False
+        self._hangover_left = 0.0
+        self._pre_roll: deque[rtc.AudioFrame] = deque()
+        self._pre_roll_duration = 0.0
+        self._gated_duration = 0.0
+        self._saved_duration = 0.0
+        self._saved_bytes = 0
+
+    def push(self, frame: rtc.AudioFrame) -> list[rtc.AudioFrame]:
+        """returns the frames to forward to the provider"""
+        if not self._speaking and self._hangover_left > 0.0:
+            self._hangover_left -= frame.duration
+        elif not self._speaking:
+            return self._gate(frame)
+
+        frames = [*self._pre_roll, frame]
+        self._pre_roll.clear()
+        self._pre_roll_duration = 0.0
+        self._gated_duration = 0.0
+        return frames
+
+    def _gate(self, frame: rtc.AudioFrame) -> list[rtc.AudioFrame]:
+        # keep the last frames, they are sent when the speech starts
+        self._pre_roll.append(frame)
+        self._pre_roll_duration += frame.duration
+        while (
+            self._pre_roll
+            and self._pre_roll_duration - self._pre_roll[0].duration >= self._opts.pre_roll
+        ):
+            dropped = self._pre_roll.popleft()
+            self._pre_roll_duration -= dropped.duration
+            self._saved_duration += dropped.duration
+            self._saved_bytes += len(dropped.data) * 2  # 16-bit samples
+
+        self._gated_duration += frame.duration
+        if (
+            self._keepalive_interval is not None
+            and self._gated_duration >= self._keepalive_interval
+        ):
+            self._gated_duration = 0.0
+            return [
+                rtc.AudioFrame.create(
+                    frame.sample_rate, frame.num_channels, frame.samples_per_channel
+                )
+            ]
+
+        return []
+
+    @property
+    def saved_duration(self) -> float:
+        return self._saved_duration
+
+    def take_savings(self) -> tuple[float, int]:
+        """returns the duration and bytes of audio not sent since the last call"""
+        savings = self._saved_duration, self._saved_bytes
+        self._saved_duration, self._saved_bytes = 0.0, 0
+        return savings
+
+    def on_vad_event(self, ev: VADEvent) -> None:
+        if ev.type == VADEventType.START_OF_SPEECH:
+            self._speaking = True
+        elif ev.type == VADEventType.END_OF_SPEECH:
+            self._speaking = False
+            self._hangover_left = self._opts.hangover
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import dataclasses
+import functools
 import time
 from dataclasses import dataclass
 from typing import Literal
@@ -13,6 +14,7 @@ from livekit.agents.utils.audio import AudioBuffer
 from .. import utils
 from .._exceptions import APIConnectionError, APIError
 from ..log import logger
+from ..metrics import STTMetrics
 from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
 from ..utils import aio
 from .stt import STT, RecognizeStream, SpeechEvent, SpeechEventType, STTCapabilities
@@ -22,6 +24,9 @@ DEFAULT_FALLBACK_API_CONNECT_OPTIONS = APIConnectOptions(
     max_retry=0, timeout=DEFAULT_API_CONNECT_OPTIONS.timeout
 )
 
+# number of latency samples needed before hedging the requests of a STT
+MIN_HEDGE_SAMPLES = 10
+
 
 @dataclass
 class AvailabilityChangedEvent:
@@ -34,6 +39,7 @@ class _STTStatus:
     available: bool
     recovering_synthesize_task: asyncio.Task | None
     recovering_stream_task: asyncio.Task | None
+    stats: utils.ProviderStats
 
 
 class FallbackAdapter(
@@ -46,7 +52,27 @@ class FallbackAdapter(
         attempt_timeout: float = 10.0,
         max_retry_per_stt: int = 1,
         retry_interval: float = 5,
+        hedge_percentile: float | None = None,
+        max_hedge_fraction: float = 0.1,
+        dynamic_ranking: bool = False,
+        exploration: float = 0.05,
     ) -> None:
+        """
+        Args:
+            stt: The STT instances to use, in order of preference.
+            attempt_timeout: Timeout for each recognition attempt in seconds.
+            max_retry_per_stt: Maximum number of retries per STT instance.
+            retry_interval: Interval between the retries in seconds.
+            hedge_percentile: Enables latency hedging of the recognize requests. When the STT has
+                not returned a transcript after this percentile of its recent recognition
+                durations, the request is also sent to the next available STT, the first
+                transcript is used and the other request is cancelled. Disabled when None.
+            max_hedge_fraction: Maximum fraction of the requests that can be hedged.
+            dynamic_ranking: Try the available STT instances by their recent latency and error
+                rate instead of the list order.
+            exploration: With dynamic ranking, the probability of trying another available STT
+                first to keep its statistics up to date.
+        """
         if len(stt) < 1:
             raise ValueError("At least one STT instance must be provided.")
 
@@ -69,15 +95,124 @@ class FallbackAdapter(
         self._attempt_timeout = attempt_timeout
         self._max_retry_per_stt = max_retry_per_stt
         self._retry_interval = retry_interval
-
-        self._status: list[_STTStatus] = [
-            _STTStatus(
+        self._hedge_percentile = hedge_percentile
+        self._hedge_budget = utils.HedgeBudget(max_hedge_fraction)
+        self._dynamic_ranking = dynamic_ranking
+        self._exploration = exploration
+
+        self._status: list[_STTStatus] = []
+        for t in self._stt_instances:
+            status = _STTStatus(
                 available=True,
                 recovering_synthesize_task=None,
                 recovering_stream_task=None,
+                stats=utils.ProviderStats(),
             )
-            for _ in self._stt_instances
-        ]
+            self._status.append(status)
+            t.on("metrics_collected", functools.partial(self._on_metrics_collected, status))
+
+    def _on_metrics_collected(self, status: _STTStatus, metrics: STTMetrics) -> None:
+        # streams don't have a request duration, their latency is measured by
+        # FallbackRecognizeStream
+        if not metrics.streamed:
+            status.stats.add_ttfb(metrics.duration)
+
+    def _ranked(self) -> list[int]:
+        """indices of the STT instances in the order they should be tried"""
+        if not self._dynamic_ranking:
+            return list(range(len(self._status)))
+
+        return utils.rank_providers(
+            [status.stats for status in self._status],
+            available=[status.available for status in self._status],
+            exploration=self._exploration,
+        )
+
+    def _hedge_for(self, index: int, order: list[int]) -> tuple[int, float] | None:
+        """the STT to hedge a request to the given STT with, and the hedge delay"""
+        if self._hedge_percentile is None:
+            return None
+
+        latency = self._status[index].stats.ttfb
+        if latency.size() < MIN_HEDGE_SAMPLES:
+            return None
+
+        for hedge_index in order[order.index(index) + 1 :]:
+            if self._status[hedge_index].available:
+                return hedge_index, latency.get_percentile(self._hedge_percentile)
+
+        return None
+
+    async def _hedged_recognize(
+        self,
+        index: int,
+        hedge_index: int,
+        hedge_delay: float,
+        *,
+        buffer: utils.AudioBuffer,
+        language: NotGivenOr[str],
+        conn_options: APIConnectOptions,
+    ) -> tuple[int, SpeechEvent, bool]:
+        """
+        Recognize with a STT, and also with the hedge STT when it didn't return after the hedge
+        delay. Returns the index of the first STT returning along with its transcript and whether
+        the first STT failed, the other request is cancelled.
+
+        Failures of the first STT are left to the caller, its error is raised when both fail.
+        """
+        tasks: dict[int, asyncio.Task[SpeechEvent]] = {}
+        started_at: dict[int, float] = {}
+
+        def _start(i: int) -> None:
+            tasks[i] = asyncio.create_task(
+                self._try_recognize(
+                    stt=self._stt_instances[i],
+                    buffer=buffer,
+                    language=language,
+                    conn_options=conn_options,
+                )
+            )
+            started_at[i] = time.perf_counter()
+
+        try:
+            _start(index)
+            await asyncio.wait([tasks[index]], timeout=hedge_delay)
+            if not tasks[index].done() and self._hedge_budget.try_acquire():
+                stt = self._stt_instances[index]
+                hedge_stt = self._stt_instances[hedge_index]
+                logger.info(
+                    f"{stt.label} did not return after {hedge_delay:.3f}s, "
+                    f"hedging with {hedge_stt.label}",
+                    extra={"streamed": False},
+                )
+                _start(hedge_index)
+
+            pending = set(tasks.values())
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for i, task in tasks.items():
+                    if task not in done:
+                        continue
+
+                    if task.exception() is None:
+                        return i, task.result(), i != index and tasks[index].done()
+
+                    if i == hedge_index:
+                        self._mark_failed(i)
+                        self._try_recovery(
+                            stt=self._stt_instances[i],
+                            buffer=buffer,
+                            language=language,
+                            conn_options=conn_options,
+                        )
+
+            raise tasks[index].exception()  # type: ignore
+        finally:
+            for i, task in tasks.items():
+                if not task.done():
+                    # a lower bound of its duration, cancelled requests don't emit metrics
+                    self._status[i].stats.add_ttfb(time.perf_counter() - started_at[i])
+                    await aio.cancel_and_wait(task)
 
     async def _try_recognize(
         self,
@@ -138,6 +273,16 @@ class FallbackAdapter(
             )
             raise
 
+    def _mark_failed(self, index: int) -> None:
+        stt, stt_status = self._stt_instances[index], self._status[index]
+        stt_status.stats.add_result(error=True)
+        if stt_status.available:
+            stt_status.available = False
+            self.emit(
+                "stt_availability_changed",
+                AvailabilityChangedEvent(stt=stt, available=False),
+            )
+
     def _try_recovery(
         self,
         *,
@@ -186,25 +331,46 @@ class FallbackAdapter(
         if all_failed:
             logger.error("all STTs are unavailable, retrying..")
 
-        for i, stt in enumerate(self._stt_instances):
+        self._hedge_budget.add_request()
+        first_attempt = True
+
+        order = self._ranked()
+        for i in order:
+            stt = self._stt_instances[i]
             stt_status = self._status[i]
             if stt_status.available or all_failed:
                 try:
-                    return await self._try_recognize(
-                        stt=stt,
-                        buffer=buffer,
-                        language=language,
-                        conn_options=conn_options,
-                        recovering=False,
-                    )
-                except Exception:  # exceptions already logged inside _try_recognize
-                    if stt_status.available:
-                        stt_status.available = False
-                        self.emit(
-                            "stt_availability_changed",
-                            AvailabilityChangedEvent(stt=stt, available=False),
+                    hedge = self._hedge_for(i, order) if first_attempt and not all_failed else None
+                    first_attempt = False
+                    if hedge is not None:
+                        winner, ev, failed = await self._hedged_recognize(
+                            i,
+                            *hedge,
+                            buffer=buffer,
+                            language=language,
+                            conn_options=conn_options,
+                        )
+                        if failed:
+                            self._mark_failed(i)
+                            self._try_recovery(
+                                stt=stt, buffer=buffer, language=language, conn_options=conn_options
+                            )
+
+                        stt_status = self._status[winner]
+                    else:
+                        ev = await self._try_recognize(
+                            stt=stt,
+                            buffer=buffer,
+                            language=language,
+                            conn_options=conn_options,
+                            recovering=False,
                         )
 
+                    stt_status.stats.add_result(error=False)
+                    return ev
+                except Exception:  # exceptions already logged inside _try_recognize
+                    self._mark_failed(i)
+
             self._try_recovery(stt=stt, buffer=buffer, language=language, conn_options=conn_options)
 
         raise APIConnectionError(
@@ -228,6 +394,14 @@ class FallbackAdapter(
     ) -> RecognizeStream:
         return FallbackRecognizeStream(stt=self, language=language, conn_options=conn_options)
 
+    @property
+    def sample_rate(self) -> int | None:
+        sample_rates = {stt.sample_rate for stt in self._stt_instances}
+        return sample_rates.pop() if len(sample_rates) == 1 else None
+
+    def prewarm(self) -> None:
+        self._stt_instances[self._ranked()[0]].prewarm()
+
     async def aclose(self) -> None:
         for stt_status in self._status:
             if stt_status.recovering_synthesize_task is not None:
@@ -259,8 +433,10 @@ class FallbackRecognizeStream(RecognizeStream):
 
         main_stream: RecognizeStream | None = None
         forward_input_task: asyncio.Task | None = None
+        pushed_duration = 0.0  # audio pushed to the main stream
 
         async def _forward_input_task() -> None:
+            nonlocal pushed_duration
             with contextlib.suppress(RuntimeError):  # stream might be closed
                 async for data in self._input_ch:
                     for stream in self._recovering_streams:
@@ -272,16 +448,19 @@ class FallbackRecognizeStream(RecognizeStream):
                     if main_stream is not None:
                         if isinstance(data, rtc.AudioFrame):
                             main_stream.push_frame(data)
+                            pushed_duration += data.duration
                         elif isinstance(data, self._FlushSentinel):
                             main_stream.flush()
 
                 if main_stream is not None:
                     main_stream.end_input()
 
-        for i, stt in enumerate(self._fallback_adapter._stt_instances):
+        for i in self._fallback_adapter._ranked():
+            stt = self._fallback_adapter._stt_instances[i]
             stt_status = self._fallback_adapter._status[i]
             if stt_status.available or all_failed:
                 try:
+                    pushed_duration = 0.0
                     main_stream = stt.stream(
                         language=self._language,
                         conn_options=dataclasses.replace(
@@ -298,6 +477,16 @@ class FallbackRecognizeStream(RecognizeStream):
                     try:
                         async with main_stream:
                             async for ev in main_stream:
+                                if (
+                                    ev.type == SpeechEventType.FINAL_TRANSCRIPT
+                                    and ev.alternatives
+                                    and ev.alternatives[0].end_time > 0
+                                ):
+                                    # the audio pushed past the end of the transcript
+                                    stt_status.stats.add_ttfb(
+                                        max(pushed_duration - ev.alternatives[0].end_time, 0.0)
+                                    )
+
                                 self._event_ch.send_nowait(ev)
 
                     except asyncio.TimeoutError:
@@ -320,8 +509,10 @@ class FallbackRecognizeStream(RecognizeStream):
                         )
                         raise
 
+                    stt_status.stats.add_result(error=False)
                     return
                 except Exception:
+                    stt_status.stats.add_result(error=True)
                     if stt_status.available:
                         stt_status.available = False
                         self._stt.emit(
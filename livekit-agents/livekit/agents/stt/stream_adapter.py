@@ -3,7 +3,10 @@ from __future__ import annotations
 import asyncio
 from collections.abc import AsyncIterable
 
+from livekit import rtc
+
 from .. import utils
+from ..log import logger
 from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
 from ..vad import VAD, VADEventType
 from .stt import STT, RecognizeStream, SpeechEvent, SpeechEventType, STTCapabilities
@@ -15,10 +18,24 @@ DEFAULT_STREAM_ADAPTER_API_CONNECT_OPTIONS = APIConnectOptions(
 
 
 class StreamAdapter(STT):
-    def __init__(self, *, stt: STT, vad: VAD) -> None:
-        super().__init__(capabilities=STTCapabilities(streaming=True, interim_results=False))
+    def __init__(self, *, stt: STT, vad: VAD, partial_interval: float | None = None) -> None:
+        """
+        Args:
+            stt: The non-streaming STT to wrap.
+            vad: Used to detect the utterances, each one is recognized once it ends. The
+                utterances are recognized concurrently, their transcripts are emitted in order.
+            partial_interval: When set, the in-progress utterance is also recognized every
+                `partial_interval` seconds of speech and emitted as an interim transcript.
+                Each partial recognition is an additional request to the wrapped STT.
+        """
+        super().__init__(
+            capabilities=STTCapabilities(
+                streaming=True, interim_results=partial_interval is not None
+            )
+        )
         self._vad = vad
         self._stt = stt
+        self._partial_interval = partial_interval
 
         @self._stt.on("metrics_collected")
         def _forward_metrics(*args, **kwargs):
@@ -51,8 +68,12 @@ class StreamAdapter(STT):
             wrapped_stt=self._stt,
             language=language,
             conn_options=conn_options,
+            partial_interval=self._partial_interval,
         )
 
+    def prewarm(self) -> None:
+        self._stt.prewarm()
+
 
 class StreamAdapterWrapper(RecognizeStream):
     def __init__(
@@ -63,12 +84,14 @@ class StreamAdapterWrapper(RecognizeStream):
         wrapped_stt: STT,
         language: NotGivenOr[str | None],
         conn_options: APIConnectOptions,
+        partial_interval: float | None = None,
     ) -> None:
         super().__init__(stt=stt, conn_options=conn_options)
         self._vad = vad
         self._wrapped_stt = wrapped_stt
         self._vad_stream = self._vad.stream()
         self._language = language
+        self._partial_interval = partial_interval
 
     async def _metrics_monitor_task(self, event_aiter: AsyncIterable[SpeechEvent]) -> None:
         pass  # do nothing
@@ -84,11 +107,61 @@ class StreamAdapterWrapper(RecognizeStream):
 
             self._vad_stream.end_input()
 
+        # the final recognitions are issued concurrently and emitted in utterance order
+        recognition_ch = utils.aio.Chan[asyncio.Task[SpeechEvent]]()
+        recognition_tasks: set[asyncio.Task[SpeechEvent]] = set()
+        partial_task: asyncio.Task[None] | None = None
+
+        async def _recognize_frames(frames: list[rtc.AudioFrame]) -> SpeechEvent:
+            return await self._wrapped_stt.recognize(
+                buffer=utils.merge_frames(frames),
+                language=self._language,
+                conn_options=self._conn_options,
+            )
+
+        async def _recognize_partial(frames: list[rtc.AudioFrame]) -> None:
+            try:
+                t_event = await _recognize_frames(frames)
+            except Exception:
+                logger.warning("failed to recognize the in-progress utterance", exc_info=True)
+                return
+
+            if recognition_tasks:
+                # don't emit it before the final transcripts of the previous utterances
+                return
+
+            if len(t_event.alternatives) == 0 or not t_event.alternatives[0].text:
+                return
+
+            self._event_ch.send_nowait(
+                SpeechEvent(
+                    type=SpeechEventType.INTERIM_TRANSCRIPT,
+                    alternatives=[t_event.alternatives[0]],
+                )
+            )
+
         async def _recognize():
             """recognize speech from vad"""
+            nonlocal partial_task
+            speech_frames: list[rtc.AudioFrame] = []
+            next_partial_at = 0.0
+
             async for event in self._vad_stream:
                 if event.type == VADEventType.START_OF_SPEECH:
                     self._event_ch.send_nowait(SpeechEvent(SpeechEventType.START_OF_SPEECH))
+                    if self._partial_interval is not None:
+                        speech_frames = list(event.frames)
+                        next_partial_at = self._partial_interval
+                elif event.type == VADEventType.INFERENCE_DONE:
+                    if self._partial_interval is None or not speech_frames:
+                        continue
+
+                    speech_frames.extend(event.frames)
+                    if event.speech_duration >= next_partial_at and (
+                        partial_task is None or partial_task.done()
+                    ):
+                        next_partial_at = event.speech_duration + self._partial_interval
+                        partial_task = asyncio.create_task(_recognize_partial(list(speech_frames)))
                 elif event.type == VADEventType.END_OF_SPEECH:
                     self._event_ch.send_nowait(
                         SpeechEvent(
@@ -96,30 +169,44 @@ class StreamAdapterWrapper(RecognizeStream):
                         )
                     )
 
-                    merged_frames = utils.merge_frames(event.frames)
-                    t_event = await self._wrapped_stt.recognize(
-                        buffer=merged_frames,
-                        language=self._language,
-                        conn_options=self._conn_options,
-                    )
+                    # the final transcript supersedes the in-progress partial recognition
+                    speech_frames = []
+                    if partial_task is not None:
+                        await utils.aio.cancel_and_wait(partial_task)
+                        partial_task = None
 
-                    if len(t_event.alternatives) == 0:
-                        continue
-                    elif not t_event.alternatives[0].text:
-                        continue
+                    task = asyncio.create_task(_recognize_frames(event.frames))
+                    recognition_tasks.add(task)
+                    recognition_ch.send_nowait(task)
 
-                    self._event_ch.send_nowait(
-                        SpeechEvent(
-                            type=SpeechEventType.FINAL_TRANSCRIPT,
-                            alternatives=[t_event.alternatives[0]],
-                        )
+            recognition_ch.close()
+
+        async def _emit_transcripts() -> None:
+            async for task in recognition_ch:
+                try:
+                    t_event = await task
+                finally:
+                    recognition_tasks.discard(task)
+
+                if len(t_event.alternatives) == 0:
+                    continue
+                elif not t_event.alternatives[0].text:
+                    continue
+
+                self._event_ch.send_nowait(
+                    SpeechEvent(
+                        type=SpeechEventType.FINAL_TRANSCRIPT,
+                        alternatives=[t_event.alternatives[0]],
                     )
+                )
 
         tasks = [
             asyncio.create_task(_forward_input(), name="forward_input"),
             asyncio.create_task(_recognize(), name="recognize"),
+            asyncio.create_task(_emit_transcripts(), name="emit_transcripts"),
         ]
         try:
             await asyncio.gather(*tasks)
         finally:
-            await utils.aio.cancel_and_wait(*tasks)
+            pending = [*recognition_tasks, *([partial_task] if partial_task else [])]
+            await utils.aio.cancel_and_wait(*tasks, *pending)
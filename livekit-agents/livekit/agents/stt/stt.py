@@ -19,6 +19,8 @@ from ..metrics import STTMetrics
 from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
 from ..utils import AudioBuffer, aio, is_given
 from ..utils.audio import calculate_audio_duration
+from ..vad import VADEvent
+from .audio_gate import AudioGateOptions, _AudioGate
 
 
 @unique
@@ -95,6 +97,12 @@ class STT(
     def capabilities(self) -> STTCapabilities:
         return self._capabilities
 
+    @property
+    def sample_rate(self) -> int | None:
+        """Sample rate of the audio sent to the provider by the streams, the audio pushed at
+        another sample rate is resampled. None if the audio is sent at the input sample rate"""
+        return None
+
     @abstractmethod
     async def _recognize_impl(
         self,
@@ -163,6 +171,10 @@ class STT(
             "streaming is not supported by this STT, please use a different STT or use a StreamAdapter"  # noqa: E501
         )
 
+    def prewarm(self) -> None:
+        """Pre-warm connection to the STT service"""
+        pass
+
     async def aclose(self) -> None:
         """Close the STT, and every stream/requests associated with it"""
         ...
@@ -185,6 +197,10 @@ class RecognizeStream(ABC):
 
         pass
 
+    _sends_keepalive: bool = False
+    """the stream keeps the provider connection open on its own, no silence is sent while
+    the audio gate is closed"""
+
     def __init__(
         self,
         *,
@@ -216,6 +232,7 @@ class RecognizeStream(ABC):
         self._needed_sr = sample_rate if is_given(sample_rate) else None
         self._pushed_sr = 0
         self._resampler: rtc.AudioResampler | None = None
+        self._audio_gate: _AudioGate | None = None
 
     @abstractmethod
     async def _run(self) -> None: ...
@@ -267,23 +284,58 @@ class RecognizeStream(ABC):
     async def _metrics_monitor_task(self, event_aiter: AsyncIterable[SpeechEvent]) -> None:
         """Task used to collect metrics"""
 
+        request_id = ""
         async for ev in event_aiter:
+            request_id = ev.request_id or request_id
             if ev.type == SpeechEventType.RECOGNITION_USAGE:
                 assert ev.recognition_usage is not None, (
                     "recognition_usage must be provided for RECOGNITION_USAGE event"
                 )
 
-                stt_metrics = STTMetrics(
-                    request_id=ev.request_id,
-                    timestamp=time.time(),
-                    duration=0.0,
-                    label=self._stt._label,
-                    audio_duration=ev.recognition_usage.audio_duration,
-                    streamed=True,
-                    error=None,
+                self._emit_metrics(
+                    request_id=ev.request_id, audio_duration=ev.recognition_usage.audio_duration
                 )
 
-                self._stt.emit("metrics_collected", stt_metrics)
+        if self._audio_gate is not None and self._audio_gate.saved_duration > 0.0:
+            # report the audio gated since the last usage event
+            self._emit_metrics(request_id=request_id, audio_duration=0.0)
+
+    def _emit_metrics(self, *, request_id: str, audio_duration: float) -> None:
+        gated_duration, gated_bytes = 0.0, 0
+        if self._audio_gate is not None:
+            gated_duration, gated_bytes = self._audio_gate.take_savings()
+
+        stt_metrics = STTMetrics(
+            request_id=request_id,
+            timestamp=time.time(),
+            duration=0.0,
+            label=self._stt._label,
+            audio_duration=audio_duration,
+            streamed=True,
+            gated_audio_duration=gated_duration,
+            gated_audio_bytes=gated_bytes,
+            error=None,
+        )
+
+        self._stt.emit("metrics_collected", stt_metrics)
+
+    def enable_audio_gate(self, options: AudioGateOptions | None = None) -> None:
+        """Stop forwarding the audio to the provider while the VAD detects silence
+
+        Must be called before pushing audio. The gate doesn't run a VAD, the events of the VAD
+        running on the same audio must be forwarded with push_vad_event.
+        """
+        if self._audio_gate is not None:
+            raise RuntimeError("the audio gate is already enabled")
+
+        self._audio_gate = _AudioGate(
+            options or AudioGateOptions(), keepalive=not self._sends_keepalive
+        )
+
+    def push_vad_event(self, ev: VADEvent) -> None:
+        """Forward a VAD event to the audio gate, ignored if the gate isn't enabled"""
+        if self._audio_gate is not None:
+            self._audio_gate.on_vad_event(ev)
 
     def push_frame(self, frame: rtc.AudioFrame) -> None:
         """Push audio to be recognized"""
@@ -305,10 +357,19 @@ class RecognizeStream(ABC):
 
         if self._resampler:
             frames = self._resampler.push(frame)
-            for frame in frames:
-                self._input_ch.send_nowait(frame)
         else:
+            frames = [frame]
+
+        for frame in frames:
+            self._send_frame(frame)
+
+    def _send_frame(self, frame: rtc.AudioFrame) -> None:
+        if self._audio_gate is None:
             self._input_ch.send_nowait(frame)
+            return
+
+        for gated_frame in self._audio_gate.push(frame):
+            self._input_ch.send_nowait(gated_frame)
 
     def flush(self) -> None:
         """Mark the end of the current segment"""
@@ -317,7 +378,7 @@ class RecognizeStream(ABC):
 
         if self._resampler:
             for frame in self._resampler.flush():
-                self._input_ch.send_nowait(frame)
+                self._send_frame(frame)
 
         self._input_ch.send_nowait(self._FlushSentinel())
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import array
+import collections
 import re
 
 
@@ -8,9 +10,7 @@ import re
 # Users that want different languages or more advanced hyphenation should use the livekit-plugins-*
 class Hyphenator:
     def __init__(self, patterns, exceptions=""):
-        self.tree = {}
-        for pattern in patterns.split():
-            self._insert_pattern(pattern)
+        self._compile(patterns.split())
 
         self.exceptions = {}
         for ex in exceptions.split():
@@ -18,21 +18,57 @@ class Hyphenator:
             points = [0] + [int(h == "-") for h in re.split(r"[a-z]", ex)]
             self.exceptions[ex.replace("-", "")] = points
 
-    def _insert_pattern(self, pattern):
-        # Convert the a pattern like 'a1bc3d4' into a string of chars 'abcd'
+    def _compile(self, patterns: list[str]) -> None:
+        # Compile the patterns into an Aho-Corasick automaton, a single pass over a word finds
+        # every pattern occurrence instead of walking a trie from each offset.
+        # Patterns like 'a1bc3d4' are split into a string of chars 'abcd'
         # and a list of points [ 0, 1, 0, 3, 4 ].
-        chars = re.sub("[0-9]", "", pattern)
-        points = [int(d or 0) for d in re.split("[.a-z]", pattern)]
+        symbols: dict[str, int] = {}
+        goto: list[dict[int, int]] = [{}]
+        leaves: dict[int, list[int]] = {}
+        for pattern in patterns:
+            chars = re.sub("[0-9]", "", pattern)
+            state = 0
+            for c in chars:
+                sym = symbols.setdefault(c, len(symbols))
+                if sym not in goto[state]:
+                    goto[state][sym] = len(goto)
+                    goto.append({})
+                state = goto[state][sym]
+            leaves[state] = [int(d or 0) for d in re.split("[.a-z]", pattern)]
 
-        # Insert the pattern into the tree. Each character finds a dict
-        # another level down in the tree, and leaf nodes have the list of
-        # points.
-        t = self.tree
-        for c in chars:
-            if c not in t:
-                t[c] = {}
-            t = t[c]
-        t[None] = points
+        # dense transition table (state * n_symbols + symbol -> state), filled with the failure
+        # transitions in BFS order. The output of a state is the max of the points of every
+        # pattern ending there, indexed relative to the end of the match.
+        n_symbols = len(symbols)
+        delta = array.array("i", [0]) * (len(goto) * n_symbols)
+        outputs: list[tuple[tuple[int, int], ...]] = [()] * len(goto)
+        fail = [0] * len(goto)
+        queue = collections.deque([0])
+        while queue:
+            state = queue.popleft()
+            base, fail_base = state * n_symbols, fail[state] * n_symbols
+            if state:
+                delta[base : base + n_symbols] = delta[fail_base : fail_base + n_symbols]
+            for sym, nxt in goto[state].items():
+                fail[nxt] = delta[base + sym] if state else 0
+                delta[base + sym] = nxt
+                queue.append(nxt)
+
+            outputs[state] = outputs[fail[state]]
+            points = leaves.get(state)
+            if points is not None:
+                merged = dict(outputs[state])
+                for j, p_j in enumerate(points):
+                    offset = j - len(points) + 1
+                    if p_j > merged.get(offset, 0):
+                        merged[offset] = p_j
+                outputs[state] = tuple(merged.items())
+
+        self._symbols = symbols
+        self._n_symbols = n_symbols
+        self._delta = delta
+        self._outputs = outputs
 
     def hyphenate_word(self, word: str) -> list[str]:
         """Given a word, returns a list of pieces, broken at the possible
@@ -47,17 +83,24 @@ class Hyphenator:
         else:
             work = "." + word.lower() + "."
             points = [0] * (len(work) + 1)
-            for i in range(len(work)):
-                t = self.tree
-                for c in work[i:]:
-                    if c in t:
-                        t = t[c]
-                        if None in t:
-                            p = t[None]
-                            for j, p_j in enumerate(p):
-                                points[i + j] = max(points[i + j], p_j)
-                    else:
-                        break
+            symbols, n_symbols, delta, outputs = (
+                self._symbols,
+                self._n_symbols,
+                self._delta,
+                self._outputs,
+            )
+            state = 0
+            for i, c in enumerate(work, 1):
+                sym = symbols.get(c)
+                if sym is None:
+                    # no pattern contains this char
+                    state = 0
+                    continue
+
+                state = delta[state * n_symbols + sym]
+                for offset, p in outputs[state]:
+                    if p > points[i + offset]:
+                        points[i + offset] = p
             # No hyphens in the first two chars or the last two.
             points[1] = points[2] = points[-2] = points[-3] = 0
 
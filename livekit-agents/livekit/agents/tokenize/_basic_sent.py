@@ -1,85 +1,334 @@
+from __future__ import annotations
+
+import bisect
+import functools
 import re
+from dataclasses import dataclass
 
+# split_sentences only splits the text after one of these characters ("\n" too when
+# retain_format is set) and looks at most at LOOKAHEAD characters after it to decide whether
+# it ends a sentence (e.g. an acronym followed by a sentence starter: "U.S. However ")
+STOP_CHARS = ".!?"
+LOOKAHEAD = 16
 
-# rule based segmentation based on https://stackoverflow.com/a/31505798, works surprisingly well
-def split_sentences(
-    text: str, min_sentence_len: int = 20, retain_format: bool = False
-) -> list[tuple[str, int, int]]:
+
+@dataclass(frozen=True)
+class AbbreviationTable:
+    """Language specific words used by the rule based sentence splitter"""
+
+    prefixes: tuple[str, ...]
+    """abbreviations placed before a name, their dot never ends a sentence (e.g. "Dr")"""
+    suffixes: tuple[str, ...]
+    """abbreviations placed after a name, their dot only ends a sentence before a starter"""
+    starters: tuple[str, ...]
+    """words followed by a whitespace that usually start a sentence (e.g. "However")"""
+    starter_prefixes: tuple[str, ...]
+    """prefixes of words that usually start a sentence (e.g. "Prof")"""
+    domains: tuple[str, ...]
+    """top level domains, "example.com" is not split"""
+
+
+ENGLISH = AbbreviationTable(
+    prefixes=("Mr", "St", "Mrs", "Ms", "Dr"),
+    suffixes=("Inc", "Ltd", "Jr", "Sr", "Co"),
+    starters=(
+        "He",
+        "She",
+        "It",
+        "They",
+        "Their",
+        "Our",
+        "We",
+        "But",
+        "However",
+        "That",
+        "This",
+    ),
+    starter_prefixes=("Mr", "Mrs", "Ms", "Dr", "Prof", "Capt", "Cpt", "Lt", "Wherever"),
+    domains=("com", "net", "org", "io", "gov", "edu", "me"),
+)
+
+ABBREVIATIONS: dict[str, AbbreviationTable] = {"english": ENGLISH, "en": ENGLISH}
+
+
+_LETTERS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+_UPPER = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_DIGITS = frozenset("0123456789")
+
+
+class _SentenceSplitter:
     """
-    the text may not contain substrings "<prd>" or "<stop>"
+    Rule based segmentation based on https://stackoverflow.com/a/31505798.
+
+    Every rule is about a dot, so the rules are evaluated around each dot of the text, in
+    order, and only record which dots don't end a sentence and where the sentences are split.
+    The text itself is never rewritten.
     """
-    alphabets = r"([A-Za-z])"
-    prefixes = r"(Mr|St|Mrs|Ms|Dr)[.]"
-    suffixes = r"(Inc|Ltd|Jr|Sr|Co)"
-    starters = r"(Mr|Mrs|Ms|Dr|Prof|Capt|Cpt|Lt|He\s|She\s|It\s|They\s|Their\s|Our\s|We\s|But\s|However\s|That\s|This\s|Wherever)"  # noqa: E501
-    acronyms = r"([A-Z][.][A-Z][.](?:[A-Z][.])?)"
-    websites = r"[.](com|net|org|io|gov|edu|me)"
-    digits = r"([0-9])"
-    multiple_dots = r"\.{2,}"
-
-    # fmt: off
-    if retain_format:
-        text = text.replace("\n","<nel><stop>")
-    else:
-        text = text.replace("\n"," ")
-
-    text = re.sub(prefixes,"\\1<prd>", text)
-    text = re.sub(websites,"<prd>\\1", text)
-    text = re.sub(digits + "[.]" + digits,"\\1<prd>\\2",text)
-    # text = re.sub(multiple_dots, lambda match: "<prd>" * len(match.group(0)) + "<stop>", text)
-    # TODO(theomonnom): need improvement for ""..." dots", check capital + next sentence should not be  # noqa: E501
-    # small
-    text = re.sub(multiple_dots, lambda match: "<prd>" * len(match.group(0)), text)
-    if "Ph.D" in text:
-        text = text.replace("Ph.D.","Ph<prd>D<prd>")
-    text = re.sub(r"\s" + alphabets + "[.] "," \\1<prd> ",text)
-    text = re.sub(acronyms+" "+starters,"\\1<stop> \\2",text)
-    text = re.sub(alphabets + "[.]" + alphabets + "[.]" + alphabets + "[.]","\\1<prd>\\2<prd>\\3<prd>",text)  # noqa: E501
-    text = re.sub(alphabets + "[.]" + alphabets + "[.]","\\1<prd>\\2<prd>",text)
-    text = re.sub(r" "+suffixes+"[.] "+starters," \\1<stop> \\2",text)
-    text = re.sub(r" "+suffixes+"[.]"," \\1<prd>",text)
-    text = re.sub(r" " + alphabets + "[.]"," \\1<prd>",text)
-    if "”" in text:
-        text = text.replace(".”","”.")
-    if "\"" in text:
-        text = text.replace(".\"","\".")
-    if "!" in text:
-        text = text.replace("!\"","\"!")
-    if "?" in text:
-        text = text.replace("?\"","\"?")
-    text = text.replace(".",".<stop>")
-    text = text.replace("?","?<stop>")
-    text = text.replace("!","!<stop>")
-    text = text.replace("<prd>",".")
-    # fmt: on
-
-    if retain_format:
-        text = text.replace("<nel>", "\n")
-    splitted_sentences = text.split("<stop>")
-    text = text.replace("<stop>", "")
-
-    sentences: list[tuple[str, int, int]] = []
-
-    buff = ""
-    start_pos = 0
-    end_pos = 0
-    pre_pad = "" if retain_format else " "
-    for match in splitted_sentences:
-        if retain_format:
-            sentence = match
+
+    def __init__(self, table: AbbreviationTable, retain_format: bool) -> None:
+        self._retain_format = retain_format
+        self._prefixes = table.prefixes
+        self._domains = table.domains
+        self._suffixes = tuple(" " + s for s in table.suffixes)
+
+        # with retain_format, newlines end a sentence and are never treated as whitespace
+        ws = r"[^\S\n]" if retain_format else r"\s"
+        starters = "|".join(
+            [re.escape(w) for w in table.starter_prefixes]
+            + [re.escape(w) + ws for w in table.starters]
+        )
+        self._starter_re = re.compile(f"(?:{starters})")
+
+        # matches every dot, the "rule" group is set when one of the rules may apply to it,
+        # the other dots always end a sentence
+        self._dot_re = re.compile(
+            r"\.(?P<rule>"
+            + "|".join(
+                [
+                    r"(?<=[0-9]\.)(?=[0-9])",
+                    r"(?=\.)|(?<=\.\.)",
+                    f"(?={'|'.join(re.escape(w) for w in table.domains)})",
+                    _lookbehind([w + "." for w in (*self._prefixes, *self._suffixes)]),
+                    r"(?<=\s[A-Za-z]\.)",
+                    r"(?<=[A-Za-z]\.)(?=[A-Za-z]\.)|(?<=[A-Za-z]\.[A-Za-z]\.)",
+                ]
+            )
+            + ")?"
+        )
+        self._stop_chars = ".!?\n" if retain_format else ".!?"
+
+    def _is_ws(self, c: str) -> bool:
+        return c.isspace() and not (self._retain_format and c == "\n")
+
+    def split(self, text: str, min_sentence_len: int) -> list[tuple[str, int, int]]:
+        retain_format = self._retain_format
+        if not retain_format:
+            text = text.replace("\n", " ")
+
+        prd: set[int] = set()  # dots that don't end a sentence
+        stops: list[int] = []  # the text is split before these offsets
+        deleted: list[int] = []
+        edits: dict[int, str] = {}
+
+        rule_dots: list[int] = []
+        plain_dots: list[int] = []
+        for m in self._dot_re.finditer(text):
+            (rule_dots if m.group(1) is not None else plain_dots).append(m.start())
+
+        if rule_dots:
+            self._find_protected_dots(text, rule_dots, prd, stops, deleted, edits)
+
+        if '"' in text or "”" in text:
+            # closing quotes are moved before the punctuation ending the sentence, the dots
+            # that don't end a sentence are masked so they are neither swapped nor split
+            chars = list(text)
+            for i in prd:
+                chars[i] = "\0"
+
+            swapped = (
+                "".join(chars)
+                .replace(".”", "”.")
+                .replace('."', '".')
+                .replace('!"', '"!')
+                .replace('?"', '"?')
+            )
+            for c in self._stop_chars:
+                stops.extend(i + 1 for i in _find_all(swapped, c))
+
+            chars = list(swapped)
+            for i in prd:
+                chars[i] = "."
+            for i, c in edits.items():
+                chars[i] = c
+            text = "".join(chars)
         else:
-            sentence = match.strip()
-        if not sentence:
-            continue
+            stops.extend(i + 1 for i in plain_dots)
+            stops.extend(i + 1 for i in rule_dots if i not in prd)
+            for c in self._stop_chars[1:]:
+                stops.extend(i + 1 for i in _find_all(text, c))
+
+            if edits:
+                chars = list(text)
+                for i, c in edits.items():
+                    chars[i] = c
+                text = "".join(chars)
+
+        if deleted:
+            text = "".join(text[s + 1 : e] for s, e in zip([-1, *deleted], [*deleted, len(text)]))
+            stops = [i - bisect.bisect_left(deleted, i) for i in stops]
 
-        buff += pre_pad + sentence
-        end_pos += len(match)
-        if len(buff) > min_sentence_len:
-            sentences.append((buff[len(pre_pad) :], start_pos, end_pos))
-            start_pos = end_pos
-            buff = ""
+        sentences: list[tuple[str, int, int]] = []
+        buff = ""
+        start_pos = 0
+        end_pos = 0
+        pre_pad = "" if retain_format else " "
+        prev = 0
+        for stop in [*sorted(set(stops)), len(text)]:
+            match = text[prev:stop]
+            prev = stop
 
-    if buff:
-        sentences.append((buff[len(pre_pad) :], start_pos, len(text) - 1))
+            sentence = match if retain_format else match.strip()
+            if not sentence:
+                continue
 
-    return sentences
+            buff += pre_pad + sentence
+            end_pos += len(match)
+            if len(buff) > min_sentence_len:
+                sentences.append((buff[len(pre_pad) :], start_pos, end_pos))
+                start_pos = end_pos
+                buff = ""
+
+        if buff:
+            sentences.append((buff[len(pre_pad) :], start_pos, len(text) - 1))
+
+        return sentences
+
+    def _find_protected_dots(
+        self,
+        text: str,
+        dots: list[int],
+        prd: set[int],
+        stops: list[int],
+        deleted: list[int],
+        edits: dict[int, str],
+    ) -> None:
+        # titles, domains and decimal numbers: "Dr.", "livekit.io", "3.14"
+        digits_end = -1
+        for d in dots:
+            if text.endswith(self._prefixes, 0, d) or text.startswith(self._domains, d + 1):
+                prd.add(d)
+            elif (
+                d > digits_end + 1
+                and d > 0
+                and text[d - 1] in _DIGITS
+                and text[d + 1 : d + 2] in _DIGITS
+            ):
+                prd.add(d)
+                digits_end = d + 1
+
+        # runs of dots: "...", the dots protected above break the runs
+        run: list[int] = []
+        for d in [*dots, -2]:
+            if run and (d != run[-1] + 1 or d in prd):
+                if len(run) >= 2:
+                    prd.update(run)
+                run = []
+            if d >= 0 and d not in prd:
+                run.append(d)
+
+        if "Ph.D." in text:
+            for i in _find_all(text, "Ph.D."):
+                if i + 2 not in prd and i + 4 not in prd:
+                    prd.update((i + 2, i + 4))
+
+        initial_end = -1
+        for d in dots:
+            # initials: " J. "
+            if (
+                d >= 2
+                and d - 2 >= initial_end
+                and text[d + 1 : d + 2] == " "
+                and text[d - 1] in _LETTERS
+                and self._is_ws(text[d - 2])
+                and d not in prd
+            ):
+                prd.add(d)
+                if text[d - 2] != " ":
+                    edits[d - 2] = " "
+                initial_end = d + 2
+
+            # acronyms followed by a sentence starter: "U.S. However"
+            if (
+                d >= 3
+                and text[d + 1 : d + 2] == " "
+                and text[d - 1] in _UPPER
+                and text[d - 2] == "."
+                and text[d - 3] in _UPPER
+                and self._starter_re.match(text, d + 2)
+            ):
+                stops.append(d + 1)
+
+        letters_end = 0
+        suffix_end = 0
+        for d in dots:
+            # letters separated by dots: "e.g.", "a.m."
+            if (
+                d >= 1
+                and d - 1 >= letters_end
+                and text[d - 1] in _LETTERS
+                and text[d + 1 : d + 2] in _LETTERS
+                and text[d + 2 : d + 3] == "."
+                and d not in prd
+                and d + 2 not in prd
+            ):
+                prd.update((d, d + 2))
+                letters_end = d + 3
+                if (
+                    text[d + 3 : d + 4] in _LETTERS
+                    and text[d + 4 : d + 5] == "."
+                    and d + 4 not in prd
+                ):
+                    prd.add(d + 4)
+                    letters_end = d + 5
+
+            if text.endswith(self._suffixes, 0, d):
+                # suffixes followed by a sentence starter: "Acme Inc. However", the dot is
+                # dropped from the sentence
+                if (
+                    d not in prd
+                    and text[d + 1 : d + 2] == " "
+                    and (m := self._starter_re.match(text, d + 2))
+                    and _suffix_start(text, d, self._suffixes) >= suffix_end
+                ):
+                    deleted.append(d)
+                    stops.append(d + 1)
+                    suffix_end = m.end()
+
+                prd.add(d)
+            elif d >= 2 and text[d - 2] == " " and text[d - 1] in _LETTERS:
+                prd.add(d)  # single letters: " a."
+
+
+def lookahead(table: AbbreviationTable) -> int:
+    """number of characters after a dot split_sentences may look at"""
+    longest = max(
+        (len(w) for w in (*table.starters, *table.starter_prefixes, *table.domains)), default=0
+    )
+    return max(LOOKAHEAD, longest + 3)
+
+
+def _lookbehind(words: list[str]) -> str:
+    """lookbehind assertions matching any of the words, grouped by length (fixed width)"""
+    by_len: dict[int, list[str]] = {}
+    for w in words:
+        by_len.setdefault(len(w), []).append(re.escape(w))
+
+    return "|".join(f"(?<={'|'.join(ws)})" for ws in by_len.values())
+
+
+def _find_all(text: str, sub: str) -> list[int]:
+    res = []
+    i = text.find(sub)
+    while i != -1:
+        res.append(i)
+        i = text.find(sub, i + len(sub))
+    return res
+
+
+def _suffix_start(text: str, d: int, suffixes: tuple[str, ...]) -> int:
+    return min(d - len(s) for s in suffixes if text.endswith(s, 0, d))
+
+
+@functools.cache
+def _splitter(table: AbbreviationTable, retain_format: bool) -> _SentenceSplitter:
+    return _SentenceSplitter(table, retain_format)
+
+
+def split_sentences(
+    text: str,
+    min_sentence_len: int = 20,
+    retain_format: bool = False,
+    *,
+    abbreviations: AbbreviationTable = ENGLISH,
+) -> list[tuple[str, int, int]]:
+    return _splitter(abbreviations, retain_format).split(text, min_sentence_len)
@@ -2,6 +2,8 @@ import re
 
 from . import tokenizer
 
+_PUNCTUATIONS_TABLE = str.maketrans("", "", "".join(tokenizer.PUNCTUATIONS))
+
 
 def split_words(text: str, ignore_punctuation: bool = True) -> list[tuple[str, int, int]]:
     """
@@ -18,8 +20,7 @@ def split_words(text: str, ignore_punctuation: bool = True) -> list[tuple[str, i
 
         if ignore_punctuation:
             # TODO(theomonnom): acronyms passthrough
-            translation_table = str.maketrans("", "", "".join(tokenizer.PUNCTUATIONS))
-            word = word.translate(translation_table)
+            word = word.translate(_PUNCTUATIONS_TABLE)
 
             if not word:
                 continue
@@ -15,7 +15,11 @@ from . import (
 # Really naive implementation of SentenceTokenizer, WordTokenizer + hyphenate_word
 # The basic tokenizer is rule-based and only English is really tested
 
+AbbreviationTable = _basic_sent.AbbreviationTable
+
 __all__ = [
+    "AbbreviationTable",
+    "register_abbreviations",
     "SentenceTokenizer",
     "WordTokenizer",
     "hyphenate_word",
@@ -29,6 +33,13 @@ class _TokenizerOptions:
     min_sentence_len: int
     stream_context_len: int
     retain_format: bool
+    early_flush: token_stream.EarlyFlushOptions | None
+    abbreviations: AbbreviationTable | None
+
+
+def register_abbreviations(language: str, table: AbbreviationTable) -> None:
+    """Set the abbreviation table used by the SentenceTokenizer for the given language"""
+    _basic_sent.ABBREVIATIONS[language] = table
 
 
 class SentenceTokenizer(tokenizer.SentenceTokenizer):
@@ -39,14 +50,32 @@ class SentenceTokenizer(tokenizer.SentenceTokenizer):
         min_sentence_len: int = 20,
         stream_context_len: int = 10,
         retain_format: bool = False,
+        early_flush: token_stream.EarlyFlushOptions | None = None,
+        abbreviations: AbbreviationTable | None = None,
     ) -> None:
+        """
+        Args:
+            early_flush: When set, streams emit the first chunk of each segment at the first
+                clause boundary (or after a few words/milliseconds) instead of waiting for a
+                full sentence.
+            abbreviations: Abbreviations and sentence starters used to find the sentence
+                boundaries, defaults to the table registered for the language (English if none).
+        """
         self._config = _TokenizerOptions(
             language=language,
             min_sentence_len=min_sentence_len,
             stream_context_len=stream_context_len,
             retain_format=retain_format,
+            early_flush=early_flush,
+            abbreviations=abbreviations,
         )
 
+    def _abbreviations(self, language: str | None) -> AbbreviationTable:
+        if self._config.abbreviations is not None:
+            return self._config.abbreviations
+
+        return _basic_sent.ABBREVIATIONS.get(language or self._config.language, _basic_sent.ENGLISH)
+
     def tokenize(self, text: str, *, language: str | None = None) -> list[str]:
         return [
             tok[0]
@@ -54,18 +83,24 @@ class SentenceTokenizer(tokenizer.SentenceTokenizer):
                 text,
                 min_sentence_len=self._config.min_sentence_len,
                 retain_format=self._config.retain_format,
+                abbreviations=self._abbreviations(language),
             )
         ]
 
     def stream(self, *, language: str | None = None) -> tokenizer.SentenceStream:
+        abbreviations = self._abbreviations(language)
         return token_stream.BufferedSentenceStream(
             tokenizer=functools.partial(
                 _basic_sent.split_sentences,
                 min_sentence_len=self._config.min_sentence_len,
                 retain_format=self._config.retain_format,
+                abbreviations=abbreviations,
             ),
             min_token_len=self._config.min_sentence_len,
             min_ctx_len=self._config.stream_context_len,
+            early_flush=self._config.early_flush,
+            boundary_chars=_basic_sent.STOP_CHARS + ("\n" if self._config.retain_format else ""),
+            boundary_lookahead=_basic_sent.lookahead(abbreviations),
         )
 
 
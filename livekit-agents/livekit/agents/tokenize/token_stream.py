@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import re
 import typing
+from dataclasses import dataclass
 from typing import Callable, Union
 
 from ..utils import aio, shortuuid
@@ -10,6 +13,26 @@ from .tokenizer import SentenceStream, TokenData, WordStream
 # If the start and end indices are not available, we attempt to locate the token within the text using str.find.  # noqa: E501
 TokenizeCallable = Callable[[str], Union[list[str], list[tuple[str, int, int]]]]
 
+_CLAUSE_BOUNDARY = re.compile(r"[,;:.!?\u2014\u2026](?=\s)")
+_WORD = re.compile(r"\S+(?=\s)")
+_ABBREVIATIONS = frozenset(["mr.", "mrs.", "ms.", "dr.", "st.", "jr.", "sr.", "prof.", "vs."])
+
+
+@dataclass
+class EarlyFlushOptions:
+    """
+    Emit the first chunk of each segment before a full sentence is available,
+    reducing the time to first audio. Once the first chunk is emitted, the stream
+    goes back to full sentences.
+    """
+
+    clause_boundary: bool = True
+    """flush at the first clause boundary (comma, semicolon, colon, end of sentence, ...)"""
+    max_words: int | None = 8
+    """flush once this many complete words are buffered"""
+    max_delay: float | None = 0.4
+    """flush the complete words buffered this many seconds after the first text was pushed"""
+
 
 class BufferedTokenStream:
     def __init__(
@@ -19,31 +42,78 @@ class BufferedTokenStream:
         min_token_len: int,
         min_ctx_len: int,
         retain_format: bool = False,
+        early_flush: EarlyFlushOptions | None = None,
+        boundary_chars: str | None = None,
+        boundary_lookahead: int = 0,
     ) -> None:
+        """
+        Args:
+            boundary_chars: When set, the tokenizer is assumed to only split the text at one of
+                these characters, and to merge the sentences shorter than `min_token_len`. The
+                buffer is then re-tokenized only when a boundary char was pushed or is still
+                within `boundary_lookahead` characters of the end of the buffer, instead of on
+                every push. Only the end of the buffer is tokenized until a split is found.
+            boundary_lookahead: Number of characters after a boundary char the tokenizer may
+                look at to decide whether it is an actual boundary.
+        """
         self._event_ch = aio.Chan[TokenData]()
         self._tokenize_fnc = tokenize_fnc
         self._min_ctx_len = min_ctx_len
         self._min_token_len = min_token_len
         self._retain_format = retain_format
+        self._early_flush = early_flush
         self._current_segment_id = shortuuid()
 
+        self._boundary_re = (
+            re.compile(f"[{re.escape(boundary_chars)}]") if boundary_chars is not None else None
+        )
+        self._boundary_lookahead = boundary_lookahead
+        # boundary chars before this index of _in_buf were already seen by the tokenizer
+        # with enough context after them, they can't start a new token anymore
+        self._scan_from = 0
+        self._boundary_pending = False
+
         self._buf_tokens: list[str] = []  # <= min_token_len
         self._in_buf = ""
+        self._in_pending: list[str] = []  # pushed text not yet joined into _in_buf
+        self._in_pending_len = 0
         self._out_buf = ""
 
+        self._first_chunk = True  # nothing was emitted yet for the current segment
+        self._early_flush_handle: asyncio.TimerHandle | None = None
+        self._early_flush_expired = False
+
     @typing.no_type_check
     def push_text(self, text: str) -> None:
         self._check_not_closed()
-        self._in_buf += text
+        self._in_pending.append(text)
+        self._in_pending_len += len(text)
+        if self._boundary_re is not None and self._boundary_re.search(text):
+            self._boundary_pending = True
+
+        if self._early_flush is not None and self._first_chunk:
+            self._join_input()
+            self._push_first_chunk()
+
+        if len(self._in_buf) + self._in_pending_len < self._min_ctx_len:
+            return
 
-        if len(self._in_buf) < self._min_ctx_len:
+        if not self._may_split():
             return
 
+        self._join_input()
         while True:
+            if not self._window_may_split():
+                self._update_scan_from()
+                break
+
             tokens = self._tokenize_fnc(self._in_buf)
             if len(tokens) <= 1:
+                self._update_scan_from()
                 break
 
+            self._scan_from = 0
+
             if self._out_buf:
                 self._out_buf += " "
 
@@ -54,10 +124,7 @@ class BufferedTokenStream:
 
             self._out_buf += tok_text
             if len(self._out_buf) >= self._min_token_len:
-                self._event_ch.send_nowait(
-                    TokenData(token=self._out_buf, segment_id=self._current_segment_id)
-                )
-
+                self._emit(self._out_buf)
                 self._out_buf = ""
 
             if isinstance(tok, tuple):
@@ -69,6 +136,7 @@ class BufferedTokenStream:
     @typing.no_type_check
     def flush(self) -> None:
         self._check_not_closed()
+        self._join_input()
 
         if self._in_buf or self._out_buf:
             tokens = self._tokenize_fnc(self._in_buf)
@@ -82,21 +150,160 @@ class BufferedTokenStream:
                     self._out_buf += " ".join(tokens)
 
             if self._out_buf:
-                self._event_ch.send_nowait(
-                    TokenData(token=self._out_buf, segment_id=self._current_segment_id)
-                )
+                self._emit(self._out_buf)
 
             self._current_segment_id = shortuuid()
 
         self._in_buf = ""
         self._out_buf = ""
+        self._scan_from = 0
+        self._reset_first_chunk()
 
     def end_input(self) -> None:
         self.flush()
         self._event_ch.close()
+        self._reset_first_chunk()
 
     async def aclose(self) -> None:
         self._event_ch.close()
+        self._reset_first_chunk()
+
+    def _join_input(self) -> None:
+        if self._in_pending:
+            self._in_buf += "".join(self._in_pending)
+            self._in_pending.clear()
+            self._in_pending_len = 0
+
+    def _may_split(self) -> bool:
+        """whether tokenizing the buffer may return more than one token"""
+        if self._boundary_re is None or self._boundary_pending:
+            self._boundary_pending = False
+            return True
+
+        return self._boundary_re.search(self._in_buf, self._scan_from) is not None
+
+    def _update_scan_from(self) -> None:
+        if self._boundary_re is not None:
+            stable_len = len(self._in_buf.rstrip())
+            self._scan_from = max(0, stable_len - self._boundary_lookahead)
+
+    def _window_may_split(self) -> bool:
+        """whether the whole buffer may be split, only tokenizes the text around the boundary
+        chars not seen yet, so text full of dots that aren't boundaries (e.g. "v1.2",
+        decimals, urls) isn't re-tokenized from the start of the buffer on every push"""
+        if self._boundary_re is None or self._scan_from == 0:
+            return True
+
+        start = self._window_start()
+        if start == 0:
+            return True
+
+        tokens = self._tokenize_fnc(self._in_buf[start:])
+        if len(tokens) <= 1:
+            return False
+
+        if not isinstance(tokens[0], tuple):
+            return True
+
+        # the splits before _scan_from were already rejected with the whole buffer
+        return any(start + tok[2] >= self._scan_from for tok in tokens[:-1])
+
+    def _window_start(self) -> int:
+        # the window must contain enough text before the new boundaries for the tokenizer to
+        # look behind them and to merge the short sentences the same way as with the whole
+        # buffer (the whitespaces may be stripped)
+        needed = self._boundary_lookahead + self._min_token_len
+        i = self._scan_from
+        while i > 0 and needed > 0:
+            i -= 1
+            if not self._in_buf[i].isspace():
+                needed -= 1
+
+        # start at a whitespace, the first word is complete
+        while i > 0 and not self._in_buf[i].isspace():
+            i -= 1
+
+        return i
+
+    def _emit(self, token: str) -> None:
+        self._event_ch.send_nowait(TokenData(token=token, segment_id=self._current_segment_id))
+        if self._first_chunk:
+            self._first_chunk = False
+            if self._early_flush_handle is not None:
+                self._early_flush_handle.cancel()
+                self._early_flush_handle = None
+
+    def _reset_first_chunk(self) -> None:
+        if self._early_flush_handle is not None:
+            self._early_flush_handle.cancel()
+            self._early_flush_handle = None
+
+        self._first_chunk = True
+        self._early_flush_expired = False
+
+    def _push_first_chunk(self) -> None:
+        opts = self._early_flush
+        assert opts is not None
+
+        if (
+            self._early_flush_handle is None
+            and not self._early_flush_expired
+            and opts.max_delay is not None
+            and self._in_buf.strip()
+        ):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass  # pushed outside of an event loop, only the text based rules apply
+            else:
+                self._early_flush_handle = loop.call_later(
+                    opts.max_delay, self._on_early_flush_expired
+                )
+
+        cut: int | None = None
+        if opts.clause_boundary:
+            for m in _CLAUSE_BOUNDARY.finditer(self._in_buf):
+                word = self._in_buf[: m.end()].rsplit(None, 1)[-1]
+                if m.group() == "." and (len(word) <= 2 or word.lower() in _ABBREVIATIONS):
+                    continue  # initials and abbreviations, e.g. "J." or "Dr."
+
+                cut = m.end()
+                break
+
+        if cut is None and opts.max_words is not None and opts.max_words > 0:
+            for i, m in enumerate(_WORD.finditer(self._in_buf)):
+                if i + 1 >= opts.max_words:
+                    cut = m.end()
+                    break
+
+        if cut is None and self._early_flush_expired:
+            # only complete words are flushed
+            for m in _WORD.finditer(self._in_buf):
+                cut = m.end()
+
+        if cut is not None:
+            self._flush_first_chunk(cut)
+
+    def _flush_first_chunk(self, cut: int) -> None:
+        chunk = self._in_buf[:cut].strip()
+        if not chunk:
+            return
+
+        if self._out_buf:
+            chunk = self._out_buf + " " + chunk
+            self._out_buf = ""
+
+        self._in_buf = self._in_buf[cut:].lstrip()
+        self._scan_from = 0
+        self._emit(chunk)
+
+    def _on_early_flush_expired(self) -> None:
+        self._early_flush_handle = None
+        if self._event_ch.closed or not self._first_chunk:
+            return
+
+        self._early_flush_expired = True
+        self._push_first_chunk()
 
     def _check_not_closed(self) -> None:
         if self._event_ch.closed:
@@ -117,11 +324,17 @@ class BufferedSentenceStream(BufferedTokenStream, SentenceStream):
         tokenizer: TokenizeCallable,
         min_token_len: int,
         min_ctx_len: int,
+        early_flush: EarlyFlushOptions | None = None,
+        boundary_chars: str | None = None,
+        boundary_lookahead: int = 0,
     ) -> None:
         super().__init__(
             tokenize_fnc=tokenizer,
             min_token_len=min_token_len,
             min_ctx_len=min_ctx_len,
+            early_flush=early_flush,
+            boundary_chars=boundary_chars,
+            boundary_lookahead=boundary_lookahead,
         )
 
 
@@ -1,3 +1,4 @@
+from .caching_adapter import CachingAdapter, CachingChunkedStream, CachingSynthesizeStream
 from .fallback_adapter import (
     AvailabilityChangedEvent,
     FallbackAdapter,
@@ -6,7 +7,9 @@ from .fallback_adapter import (
 )
 from .stream_adapter import StreamAdapter, StreamAdapterWrapper
 from .tts import (
+    ENCODING_PREFERENCE,
     TTS,
+    AudioEncoding,
     ChunkedStream,
     SynthesizedAudio,
     SynthesizedAudioEmitter,
@@ -17,6 +20,8 @@ from .tts import (
 
 __all__ = [
     "TTS",
+    "AudioEncoding",
+    "ENCODING_PREFERENCE",
     "SynthesizedAudio",
     "SynthesizeStream",
     "TTSCapabilities",
@@ -27,6 +32,9 @@ __all__ = [
     "FallbackAdapter",
     "FallbackChunkedStream",
     "FallbackSynthesizeStream",
+    "CachingAdapter",
+    "CachingChunkedStream",
+    "CachingSynthesizeStream",
     "SynthesizedAudioEmitter",
     "TTSError",
 ]
@@ -0,0 +1,522 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import dataclasses
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from livekit import rtc
+
+from .. import utils
+from ..log import logger
+from ..metrics import TTSMetrics
+from ..types import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions
+from ..utils import aio
+from .tts import (
+    TTS,
+    AudioEncoding,
+    ChunkedStream,
+    SynthesizedAudio,
+    SynthesizeStream,
+    TTSCapabilities,
+)
+
+_FRAME_DURATION_MS = 50
+
+# magic, sample_rate, num_channels
+_DISK_HEADER = struct.Struct("<4sIH")
+_DISK_MAGIC = b"LKTA"
+
+
+@dataclass
+class _CachedAudio:
+    text: str
+    sample_rate: int
+    num_channels: int
+    data: bytes | memoryview
+    """int16 PCM, a memoryview over the mapped file when loaded from the disk store"""
+
+    def frames(self) -> list[rtc.AudioFrame]:
+        bytes_per_sample = 2 * self.num_channels
+        bytes_per_frame = self.sample_rate * _FRAME_DURATION_MS // 1000 * bytes_per_sample
+        frames = []
+        for i in range(0, len(self.data), bytes_per_frame):
+            data = self.data[i : i + bytes_per_frame]
+            frames.append(
+                rtc.AudioFrame(
+                    data=data,
+                    sample_rate=self.sample_rate,
+                    num_channels=self.num_channels,
+                    samples_per_channel=len(data) // bytes_per_sample,
+                )
+            )
+        return frames
+
+
+class _MemoryAudioCache:
+    """Size-bounded LRU, also keeps a sorted index of the cached texts for prefix lookups"""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[str, _CachedAudio] = OrderedDict()
+        self._texts: list[str] = []
+
+    def get(self, key: str) -> _CachedAudio | None:
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, audio: _CachedAudio) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+        if len(audio.data) > self._max_bytes:
+            return
+
+        self._entries[key] = audio
+        self._size += len(audio.data)
+        bisect.insort(self._texts, audio.text)
+        while self._size > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def has_prefix(self, prefix: str) -> bool:
+        idx = bisect.bisect_left(self._texts, prefix)
+        return idx < len(self._texts) and self._texts[idx].startswith(prefix)
+
+    def _remove(self, key: str) -> None:
+        audio = self._entries.pop(key)
+        self._size -= len(audio.data)
+        del self._texts[bisect.bisect_left(self._texts, audio.text)]
+
+
+class _DiskAudioCache:
+    """One file per utterance, memory-mapped on read so the pages are shared between processes"""
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.pcm")
+
+    def get(self, key: str, text: str) -> _CachedAudio | None:
+        try:
+            with open(self._path(key), "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            os.utime(self._path(key))  # the eviction is based on the mtime
+        except (FileNotFoundError, ValueError):
+            return None
+
+        try:
+            magic, sample_rate, num_channels = _DISK_HEADER.unpack_from(mm)
+        except struct.error:
+            return None
+
+        if magic != _DISK_MAGIC:
+            return None
+
+        return _CachedAudio(
+            text=text,
+            sample_rate=sample_rate,
+            num_channels=num_channels,
+            data=memoryview(mm)[_DISK_HEADER.size :],
+        )
+
+    def put(self, key: str, audio: _CachedAudio) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_DISK_HEADER.pack(_DISK_MAGIC, audio.sample_rate, audio.num_channels))
+                f.write(audio.data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # e.g. the file is currently mapped by another process on Windows
+            logger.debug("failed to write the TTS disk cache", exc_info=True)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        files = []
+        total_size = 0
+        with os.scandir(self._directory) as it:
+            for entry in it:
+                if entry.name.endswith(".pcm"):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+
+        files.sort()
+        for _, size, path in files:
+            if total_size <= self._max_bytes:
+                break
+
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                pass
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+class CachingAdapter(TTS[Any]):
+    def __init__(
+        self,
+        tts: TTS[Any],
+        *,
+        max_cache_bytes: int = 64 * 1024 * 1024,
+        disk_cache_dir: str | None = None,
+        max_disk_cache_bytes: int = 512 * 1024 * 1024,
+        prewarm_phrases: Iterable[str] | None = None,
+        normalize_text: Callable[[str], str] = _normalize_text,
+    ) -> None:
+        """
+        Cache the synthesized audio of repeated utterances (greetings, confirmations, hold
+        messages...). Cache hits are streamed immediately.
+
+        The cache is keyed on the normalized text, the label of the wrapped TTS and its options.
+
+        Args:
+            tts: The TTS to wrap.
+            max_cache_bytes: Size of the in-memory LRU.
+            disk_cache_dir: Optional directory used to share the cached audio between the job
+                processes of a node. The files are memory-mapped when read.
+            max_disk_cache_bytes: Maximum size of the disk store.
+            prewarm_phrases: Phrases synthesized when `prewarm()` is called.
+            normalize_text: Function used to normalize the text before computing the key.
+        """
+        super().__init__(
+            capabilities=TTSCapabilities(streaming=tts.capabilities.streaming),
+            sample_rate=tts.sample_rate,
+            num_channels=tts.num_channels,
+        )
+        self._tts = tts
+        self._normalize_text = normalize_text
+        self._memory_cache = _MemoryAudioCache(max_cache_bytes)
+        self._disk_cache = (
+            _DiskAudioCache(disk_cache_dir, max_disk_cache_bytes) if disk_cache_dir else None
+        )
+        self._prewarm_phrases = list(prewarm_phrases or [])
+        self._prewarm_task: asyncio.Task[None] | None = None
+
+        @self._tts.on("error")
+        def _forward_error(*args: Any, **kwargs: Any) -> None:
+            self.emit("error", *args, **kwargs)
+
+    @property
+    def tts(self) -> TTS[Any]:
+        return self._tts
+
+    def synthesize(
+        self,
+        text: str,
+        *,
+        conn_options: APIConnectOptions | None = None,
+    ) -> CachingChunkedStream:
+        return CachingChunkedStream(
+            tts=self,
+            input_text=text,
+            conn_options=conn_options or DEFAULT_API_CONNECT_OPTIONS,
+        )
+
+    def stream(self, *, conn_options: APIConnectOptions | None = None) -> CachingSynthesizeStream:
+        return CachingSynthesizeStream(
+            tts=self, conn_options=conn_options or DEFAULT_API_CONNECT_OPTIONS
+        )
+
+    def negotiate_encoding(self) -> AudioEncoding | None:
+        return self._tts.negotiate_encoding()
+
+    def prewarm(self) -> None:
+        self._tts.prewarm()
+
+        if self._prewarm_phrases and self._prewarm_task is None:
+            try:
+                self._prewarm_task = asyncio.create_task(self.warm_cache(self._prewarm_phrases))
+            except RuntimeError:
+                pass  # no running event loop
+
+    async def warm_cache(self, phrases: Iterable[str]) -> None:
+        """Synthesize the phrases that aren't cached yet"""
+        for phrase in phrases:
+            if await self._lookup(phrase) is not None:
+                continue
+
+            try:
+                async with self.synthesize(phrase) as stream:
+                    async for _ in stream:
+                        pass
+            except Exception:
+                logger.exception("failed to prewarm the TTS cache", extra={"text": phrase})
+
+    async def aclose(self) -> None:
+        if self._prewarm_task is not None:
+            await aio.cancel_and_wait(self._prewarm_task)
+
+    def _cache_key(self, text: str) -> str:
+        options: dict[str, Any] = {}
+        if dataclasses.is_dataclass(opts := getattr(self._tts, "_opts", None)):
+            # only keep the simple values (voice, model, speed, language...)
+            options = {
+                field.name: value
+                for field in dataclasses.fields(opts)
+                if isinstance(value := getattr(opts, field.name), (str, int, float, bool))
+            }
+
+        key = {
+            "tts": self._tts.label,
+            "sample_rate": self._tts.sample_rate,
+            "num_channels": self._tts.num_channels,
+            "options": options,
+            "text": text,
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    def _is_cached_prefix(self, text: str) -> bool:
+        normalized = self._normalize_text(text)
+        if self._memory_cache.has_prefix(normalized):
+            return True
+
+        return any(
+            self._normalize_text(phrase).startswith(normalized) for phrase in self._prewarm_phrases
+        )
+
+    async def _lookup(self, text: str) -> _CachedAudio | None:
+        normalized = self._normalize_text(text)
+        key = self._cache_key(normalized)
+        if (audio := self._memory_cache.get(key)) is not None:
+            return audio
+
+        if self._disk_cache is not None:
+            audio = await asyncio.to_thread(self._disk_cache.get, key, normalized)
+            if audio is not None:
+                self._memory_cache.put(key, audio)
+                return audio
+
+        return None
+
+    async def _store(self, text: str, frames: list[rtc.AudioFrame]) -> None:
+        if not frames:
+            return
+
+        normalized = self._normalize_text(text)
+        key = self._cache_key(normalized)
+        combined = rtc.combine_audio_frames(frames)
+        audio = _CachedAudio(
+            text=normalized,
+            sample_rate=combined.sample_rate,
+            num_channels=combined.num_channels,
+            data=bytes(combined.data),
+        )
+        self._memory_cache.put(key, audio)
+        if self._disk_cache is not None:
+            await asyncio.to_thread(self._disk_cache.put, key, audio)
+
+
+class CachingChunkedStream(ChunkedStream):
+    def __init__(
+        self,
+        *,
+        tts: CachingAdapter,
+        input_text: str,
+        conn_options: APIConnectOptions,
+    ) -> None:
+        # retries are handled by the wrapped TTS
+        super().__init__(
+            tts=tts,
+            input_text=input_text,
+            conn_options=dataclasses.replace(conn_options, max_retry=0),
+        )
+        self._caching_tts = tts
+        self._wrapped_conn_options = conn_options
+
+    async def _run(self) -> None:
+        request_id = utils.shortuuid()
+        if (cached := await self._caching_tts._lookup(self._input_text)) is not None:
+            self._cache_hit = True
+            for frame in cached.frames():
+                self._event_ch.send_nowait(SynthesizedAudio(frame=frame, request_id=request_id))
+            return
+
+        self._cache_hit = False
+        frames: list[rtc.AudioFrame] = []
+        async with self._caching_tts._tts.synthesize(
+            self._input_text, conn_options=self._wrapped_conn_options
+        ) as stream:
+            async for audio in stream:
+                frames.append(audio.frame)
+                self._event_ch.send_nowait(audio)
+
+        await self._caching_tts._store(self._input_text, frames)
+
+
+@dataclass
+class _Segment:
+    text: str
+    cached: _CachedAudio | None
+    started_at: float
+
+
+class CachingSynthesizeStream(SynthesizeStream):
+    """Segments (separated by flushes) are looked up in the cache once complete.
+
+    The text is only held back while it's the prefix of a cached phrase, other segments are
+    forwarded to the wrapped stream right away."""
+
+    def __init__(self, *, tts: CachingAdapter, conn_options: APIConnectOptions) -> None:
+        super().__init__(tts=tts, conn_options=dataclasses.replace(conn_options, max_retry=0))
+        self._caching_tts = tts
+        self._wrapped_conn_options = conn_options
+        self._wrapped_stream: SynthesizeStream | None = None
+
+    async def _metrics_monitor_task(self, event_aiter: AsyncIterable[SynthesizedAudio]) -> None:
+        pass  # metrics are emitted per segment by _run
+
+    def _ensure_wrapped_stream(self) -> SynthesizeStream:
+        if self._wrapped_stream is None:
+            self._wrapped_stream = self._caching_tts._tts.stream(
+                conn_options=self._wrapped_conn_options
+            )
+        return self._wrapped_stream
+
+    def _emit_segment_metrics(
+        self, segment: _Segment, *, request_id: str, ttfb: float, audio_duration: float
+    ) -> None:
+        self._tts.emit(
+            "metrics_collected",
+            TTSMetrics(
+                timestamp=time.time(),
+                request_id=request_id,
+                ttfb=ttfb,
+                duration=time.perf_counter() - segment.started_at,
+                characters_count=len(segment.text),
+                audio_duration=audio_duration,
+                cancelled=False,
+                label=self._tts.label,
+                streamed=True,
+                cache_hit=segment.cached is not None,
+            ),
+        )
+
+    async def _run(self) -> None:
+        segment_ch = aio.Chan[_Segment]()
+
+        async def _input_task() -> None:
+            pending = ""  # text held back, could still match a cached phrase
+            segment: _Segment | None = None  # current segment forwarded to the wrapped stream
+
+            async def _end_segment() -> None:
+                nonlocal pending, segment
+                if segment is not None:
+                    self._ensure_wrapped_stream().flush()
+                elif pending.strip():
+                    seg = _Segment(
+                        text=pending,
+                        cached=await self._caching_tts._lookup(pending),
+                        started_at=time.perf_counter(),
+                    )
+                    if seg.cached is None:
+                        wrapped_stream = self._ensure_wrapped_stream()
+                        wrapped_stream.push_text(pending)
+                        wrapped_stream.flush()
+
+                    segment_ch.send_nowait(seg)
+
+                pending, segment = "", None
+
+            async for data in self._input_ch:
+                if isinstance(data, self._FlushSentinel):
+                    await _end_segment()
+                    continue
+
+                if segment is not None:
+                    segment.text += data
+                    self._ensure_wrapped_stream().push_text(data)
+                    continue
+
+                pending += data
+                if not self._caching_tts._is_cached_prefix(pending):
+                    segment = _Segment(text=pending, cached=None, started_at=time.perf_counter())
+                    self._ensure_wrapped_stream().push_text(pending)
+                    segment_ch.send_nowait(segment)
+                    pending = ""
+
+            await _end_segment()
+            if self._wrapped_stream is not None:
+                self._wrapped_stream.end_input()
+
+            segment_ch.close()
+
+        async def _output_task() -> None:
+            async for segment in segment_ch:
+                request_id = utils.shortuuid()
+                segment_id = utils.shortuuid()
+                if segment.cached is not None:
+                    frames = segment.cached.frames()
+                    for i, frame in enumerate(frames):
+                        self._event_ch.send_nowait(
+                            SynthesizedAudio(
+                                frame=frame,
+                                request_id=request_id,
+                                segment_id=segment_id,
+                                is_final=i == len(frames) - 1,
+                            )
+                        )
+                    self._emit_segment_metrics(
+                        segment,
+                        request_id=request_id,
+                        ttfb=time.perf_counter() - segment.started_at,
+                        audio_duration=sum(f.duration for f in frames),
+                    )
+                    continue
+
+                assert self._wrapped_stream is not None
+                ttfb = -1.0
+                completed = False
+                segment_frames: list[rtc.AudioFrame] = []
+                async for audio in self._wrapped_stream:
+                    if ttfb == -1.0:
+                        ttfb = time.perf_counter() - segment.started_at
+
+                    segment_frames.append(audio.frame)
+                    self._event_ch.send_nowait(audio)
+                    if audio.is_final:
+                        completed = True
+                        break
+
+                self._emit_segment_metrics(
+                    segment,
+                    request_id=request_id,
+                    ttfb=ttfb,
+                    audio_duration=sum(f.duration for f in segment_frames),
+                )
+                if completed:
+                    await self._caching_tts._store(segment.text, segment_frames)
+
+        tasks = [
+            asyncio.create_task(_input_task()),
+            asyncio.create_task(_output_task()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await utils.aio.cancel_and_wait(*tasks)
+            if self._wrapped_stream is not None:
+                await self._wrapped_stream.aclose()
@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import dataclasses
+import functools
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from dataclasses import dataclass
 from typing import Literal, Union
 
@@ -13,11 +14,13 @@ from livekit import rtc
 from .. import utils
 from .._exceptions import APIConnectionError, APIError
 from ..log import logger
+from ..metrics import TTSMetrics
 from ..utils import aio
 from .tts import (
     DEFAULT_API_CONNECT_OPTIONS,
     TTS,
     APIConnectOptions,
+    AudioEncoding,
     ChunkedStream,
     SynthesizedAudio,
     SynthesizeStream,
@@ -29,12 +32,16 @@ DEFAULT_FALLBACK_API_CONNECT_OPTIONS = APIConnectOptions(
     max_retry=0, timeout=DEFAULT_API_CONNECT_OPTIONS.timeout
 )
 
+# number of TTFB samples needed before hedging the requests of a TTS
+MIN_HEDGE_SAMPLES = 10
+
 
 @dataclass
 class _TTSStatus:
     available: bool
     recovering_task: asyncio.Task | None
     resampler: rtc.AudioResampler | None
+    stats: utils.ProviderStats
 
 
 @dataclass
@@ -59,6 +66,10 @@ class FallbackAdapter(
         retry_interval: float = 5,
         no_fallback_after_audio_duration: float | None = 3.0,
         sample_rate: int | None = None,
+        hedge_percentile: float | None = None,
+        max_hedge_fraction: float = 0.1,
+        dynamic_ranking: bool = False,
+        exploration: float = 0.05,
     ) -> None:
         """
         Initialize a FallbackAdapter that manages multiple TTS instances.
@@ -71,6 +82,10 @@ class FallbackAdapter(
                 This is used to prevent unnaturally resaying the same text when the first TTS
                 instance fails.
             sample_rate (int | None, optional): Desired sample rate for the synthesized audio. If None, uses the maximum sample rate among the TTS instances.
+            hedge_percentile (float | None, optional): Enables latency hedging of the synthesize requests. When the TTS has not produced audio after this percentile of its recent TTFBs, the request is also sent to the next available TTS, the first one producing audio is used and the other one is cancelled. Defaults to None (disabled).
+            max_hedge_fraction (float, optional): Maximum fraction of the requests that can be hedged, bounding the extra cost. Defaults to 0.1.
+            dynamic_ranking (bool, optional): Try the available TTS instances by their recent TTFB and error rate instead of the list order. Defaults to False.
+            exploration (float, optional): With dynamic ranking, the probability of trying another available TTS first to keep its statistics up to date. Defaults to 0.05.
 
         Raises:
             ValueError: If less than one TTS instance is provided.
@@ -101,6 +116,10 @@ class FallbackAdapter(
         self._max_retry_per_tts = max_retry_per_tts
         self._retry_interval = retry_interval
         self._no_fallback_after_audio_duration = no_fallback_after_audio_duration
+        self._hedge_percentile = hedge_percentile
+        self._hedge_budget = utils.HedgeBudget(max_hedge_fraction)
+        self._dynamic_ranking = dynamic_ranking
+        self._exploration = exploration
 
         self._status: list[_TTSStatus] = []
         for t in tts:
@@ -109,9 +128,48 @@ class FallbackAdapter(
                 logger.info(f"resampling {t.label} from {t.sample_rate}Hz to {sample_rate}Hz")
                 resampler = rtc.AudioResampler(input_rate=t.sample_rate, output_rate=sample_rate)
 
-            self._status.append(
-                _TTSStatus(available=True, recovering_task=None, resampler=resampler)
+            status = _TTSStatus(
+                available=True,
+                recovering_task=None,
+                resampler=resampler,
+                stats=utils.ProviderStats(),
             )
+            self._status.append(status)
+            t.on("metrics_collected", functools.partial(self._on_metrics_collected, status))
+
+    def _on_metrics_collected(self, status: _TTSStatus, metrics: TTSMetrics) -> None:
+        # the ttfb of a stream also includes the time waiting for the text, streams are
+        # measured from the flush by FallbackSynthesizeStream instead
+        if metrics.streamed or metrics.cancelled or metrics.cache_hit or metrics.ttfb < 0:
+            return
+
+        status.stats.add_ttfb(metrics.ttfb)
+
+    def _ranked(self) -> list[int]:
+        """indices of the TTS instances in the order they should be tried"""
+        if not self._dynamic_ranking:
+            return list(range(len(self._status)))
+
+        return utils.rank_providers(
+            [status.stats for status in self._status],
+            available=[status.available for status in self._status],
+            exploration=self._exploration,
+        )
+
+    def _hedge_for(self, index: int, order: list[int]) -> tuple[int, float] | None:
+        """the TTS to hedge a request to the given TTS with, and the hedge delay"""
+        if self._hedge_percentile is None:
+            return None
+
+        ttfb = self._status[index].stats.ttfb
+        if ttfb.size() < MIN_HEDGE_SAMPLES:
+            return None
+
+        for hedge_index in order[order.index(index) + 1 :]:
+            if self._status[hedge_index].available:
+                return hedge_index, ttfb.get_percentile(self._hedge_percentile)
+
+        return None
 
     def synthesize(
         self,
@@ -135,9 +193,13 @@ class FallbackAdapter(
             conn_options=conn_options or DEFAULT_FALLBACK_API_CONNECT_OPTIONS,
         )
 
+    def negotiate_encoding(self) -> AudioEncoding | None:
+        # each instance can be used, the encoding of the first one is returned
+        encodings = [t.negotiate_encoding() for t in self._tts_instances]
+        return encodings[self._ranked()[0]]
+
     def prewarm(self) -> None:
-        if self._tts_instances:
-            self._tts_instances[0].prewarm()
+        self._tts_instances[self._ranked()[0]].prewarm()
 
     async def aclose(self) -> None:
         for tts_status in self._status:
@@ -226,6 +288,90 @@ class FallbackChunkedStream(ChunkedStream):
             )
             raise
 
+    async def _hedged_synthesize(
+        self, index: int, hedge_index: int, hedge_delay: float
+    ) -> tuple[int, AsyncIterator[SynthesizedAudio], bool]:
+        """
+        Synthesize with a TTS, and also with the hedge TTS when no audio was received after
+        the hedge delay. Returns the index of the first TTS producing audio along with its audio
+        and whether the first TTS failed, the other one is cancelled.
+
+        Failures of the first TTS are left to the caller, its error is raised when both fail.
+        """
+        assert isinstance(self._tts, FallbackAdapter)
+        tts_instances = self._tts._tts_instances
+
+        streams: dict[int, AsyncGenerator[SynthesizedAudio, None]] = {}
+        first_audio: dict[int, asyncio.Future[SynthesizedAudio]] = {}
+        started_at: dict[int, float] = {}
+
+        def _start(i: int) -> None:
+            streams[i] = self._try_synthesize(tts=tts_instances[i])
+            first_audio[i] = asyncio.ensure_future(streams[i].__anext__())
+            started_at[i] = time.perf_counter()
+
+        async def _chain(
+            first: SynthesizedAudio, stream: AsyncGenerator[SynthesizedAudio, None]
+        ) -> AsyncGenerator[SynthesizedAudio, None]:
+            yield first
+            async for audio in stream:
+                yield audio
+
+        winner: int | None = None
+        try:
+            _start(index)
+            await asyncio.wait([first_audio[index]], timeout=hedge_delay)
+            if not first_audio[index].done() and self._tts._hedge_budget.try_acquire():
+                tts = tts_instances[index]
+                hedge_tts = tts_instances[hedge_index]
+                logger.info(
+                    f"{tts.label} did not produce audio after {hedge_delay:.3f}s, "
+                    f"hedging with {hedge_tts.label}",
+                    extra={"streamed": False},
+                )
+                _start(hedge_index)
+
+            pending = set(first_audio.values())
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for i, fut in first_audio.items():
+                    if fut not in done:
+                        continue
+
+                    if fut.exception() is None:
+                        winner = i
+                        failed = i != index and first_audio[index].done()
+                        return i, _chain(fut.result(), streams[i]), failed
+
+                    if i == hedge_index:
+                        self._mark_failed(i)
+                        self._try_recovery(tts_instances[i])
+
+            raise first_audio[index].exception()  # type: ignore
+        finally:
+            for i, fut in first_audio.items():
+                if i == winner:
+                    continue
+
+                if not fut.done():
+                    # a lower bound of its TTFB, the metrics of cancelled requests are ignored
+                    self._tts._status[i].stats.add_ttfb(time.perf_counter() - started_at[i])
+                    await aio.cancel_and_wait(fut)
+
+                await streams[i].aclose()
+
+    def _mark_failed(self, index: int) -> None:
+        assert isinstance(self._tts, FallbackAdapter)
+
+        tts, tts_status = self._tts._tts_instances[index], self._tts._status[index]
+        tts_status.stats.add_result(error=True)
+        if tts_status.available:
+            tts_status.available = False
+            self._tts.emit(
+                "tts_availability_changed",
+                AvailabilityChangedEvent(tts=tts, available=False),
+            )
+
     def _try_recovery(self, tts: TTS) -> None:
         assert isinstance(self._tts, FallbackAdapter)
 
@@ -257,14 +403,42 @@ class FallbackChunkedStream(ChunkedStream):
         if all_failed:
             logger.error("all TTSs are unavailable, retrying..")
 
-        for i, tts in enumerate(self._tts._tts_instances):
+        self._tts._hedge_budget.add_request()
+        first_attempt = True
+
+        order = self._tts._ranked()
+        remaining = list(order)
+        while remaining:
+            i = remaining.pop(0)
+            tts = self._tts._tts_instances[i]
             tts_status = self._tts._status[i]
             if tts_status.available or all_failed:
                 audio_duration = 0.0
                 try:
+                    audio_stream: AsyncIterator[SynthesizedAudio]
+                    hedge = (
+                        self._tts._hedge_for(i, order) if first_attempt and not all_failed else None
+                    )
+                    first_attempt = False
+                    if hedge is not None:
+                        winner, audio_stream, failed = await self._hedged_synthesize(i, *hedge)
+                        if failed:
+                            self._mark_failed(i)
+                            self._try_recovery(tts)
+                        elif winner != i:
+                            # the cancelled TTS was only slow, retry it if the hedge fails
+                            remaining.insert(0, i)
+
+                        if winner != i:
+                            remaining.remove(winner)
+                            i = winner
+                            tts, tts_status = self._tts._tts_instances[i], self._tts._status[i]
+                    else:
+                        audio_stream = self._try_synthesize(tts=tts, recovering=False)
+
                     request_id: str | None = None
                     resampler = tts_status.resampler
-                    async for synthesized_audio in self._try_synthesize(tts=tts, recovering=False):
+                    async for synthesized_audio in audio_stream:
                         audio_duration += synthesized_audio.frame.duration
                         request_id = synthesized_audio.request_id
 
@@ -290,14 +464,10 @@ class FallbackChunkedStream(ChunkedStream):
                                 )
                             )
 
+                    tts_status.stats.add_result(error=False)
                     return
                 except Exception:  # exceptions already logged inside _try_synthesize
-                    if tts_status.available:
-                        tts_status.available = False
-                        self._tts.emit(
-                            "tts_availability_changed",
-                            AvailabilityChangedEvent(tts=tts, available=False),
-                        )
+                    self._mark_failed(i)
 
                     if self._tts._no_fallback_after_audio_duration is not None:
                         if audio_duration >= self._tts._no_fallback_after_audio_duration:
@@ -337,9 +507,14 @@ class FallbackSynthesizeStream(SynthesizeStream):
     ) -> AsyncGenerator[SynthesizedAudio, None]:
         stream = tts.stream(conn_options=conn_options)
         input_sent_fut = asyncio.Future()  # type: ignore
+        stats = self._fallback_adapter._status[
+            self._fallback_adapter._tts_instances.index(tts)
+        ].stats
+        flushed_at: float | None = None
 
         @utils.log_exceptions(logger=logger)
         async def _input_task() -> None:
+            nonlocal flushed_at
             try:
                 segment = ""
                 async for data in input_ch:
@@ -350,6 +525,7 @@ class FallbackSynthesizeStream(SynthesizeStream):
                         # start the timeout on flush
                         if segment:
                             segment = ""
+                            flushed_at = time.perf_counter()
                             with contextlib.suppress(asyncio.InvalidStateError):
                                 input_sent_fut.set_result(True)
 
@@ -387,6 +563,13 @@ class FallbackSynthesizeStream(SynthesizeStream):
                                 next_audio_task, self._fallback_adapter._attempt_timeout
                             )
 
+                        if flushed_at is not None:
+                            # the ttfb of a segment is only known when its audio started after
+                            # the flush
+                            if audio_duration == 0.0:
+                                stats.add_ttfb(time.perf_counter() - flushed_at)
+                            flushed_at = None
+
                         audio_duration += audio.frame.duration
                         if audio.is_final:
                             input_sent_fut = asyncio.Future()
@@ -469,7 +652,8 @@ class FallbackSynthesizeStream(SynthesizeStream):
         input_task = asyncio.create_task(_forward_input_task())
 
         try:
-            for i, tts in enumerate(self._fallback_adapter._tts_instances):
+            for i in self._fallback_adapter._ranked():
+                tts = self._fallback_adapter._tts_instances[i]
                 tts_status = self._fallback_adapter._status[i]
                 if tts_status.available or all_failed:
                     audio_duration = 0.0
@@ -534,8 +718,10 @@ class FallbackSynthesizeStream(SynthesizeStream):
 
                             last_segment_id = synthesized_audio.segment_id
 
+                        tts_status.stats.add_result(error=False)
                         return
                     except Exception:
+                        tts_status.stats.add_result(error=True)
                         if tts_status.available:
                             tts_status.available = False
                             self._tts.emit(
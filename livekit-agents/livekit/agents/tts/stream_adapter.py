@@ -5,7 +5,14 @@ from collections.abc import AsyncIterable
 
 from .. import tokenize, utils
 from ..types import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions
-from .tts import TTS, ChunkedStream, SynthesizedAudio, SynthesizeStream, TTSCapabilities
+from .tts import (
+    TTS,
+    AudioEncoding,
+    ChunkedStream,
+    SynthesizedAudio,
+    SynthesizeStream,
+    TTSCapabilities,
+)
 
 
 class StreamAdapter(TTS):
@@ -14,7 +21,19 @@ class StreamAdapter(TTS):
         *,
         tts: TTS,
         sentence_tokenizer: tokenize.SentenceTokenizer,
+        lookahead: int = 2,
+        max_buffered_audio: float = 30.0,
     ) -> None:
+        """
+        Args:
+            tts: The non-streaming TTS to wrap.
+            sentence_tokenizer: Used to split the streamed text into sentences.
+            lookahead: Number of upcoming sentences synthesized concurrently with the current
+                one, hiding the time to first byte of each request. 0 synthesizes the sentences
+                one at a time.
+            max_buffered_audio: Seconds of audio of the upcoming sentences that can be buffered,
+                no new synthesis is started above it.
+        """
         super().__init__(
             capabilities=TTSCapabilities(
                 streaming=True,
@@ -24,6 +43,8 @@ class StreamAdapter(TTS):
         )
         self._tts = tts
         self._sentence_tokenizer = sentence_tokenizer
+        self._lookahead = lookahead
+        self._max_buffered_audio = max_buffered_audio
 
         @self._tts.on("metrics_collected")
         def _forward_metrics(*args, **kwargs):
@@ -47,8 +68,13 @@ class StreamAdapter(TTS):
             conn_options=conn_options,
             wrapped_tts=self._tts,
             sentence_tokenizer=self._sentence_tokenizer,
+            lookahead=self._lookahead,
+            max_buffered_audio=self._max_buffered_audio,
         )
 
+    def negotiate_encoding(self) -> AudioEncoding | None:
+        return self._tts.negotiate_encoding()
+
     def prewarm(self) -> None:
         self._tts.prewarm()
 
@@ -61,10 +87,15 @@ class StreamAdapterWrapper(SynthesizeStream):
         conn_options: APIConnectOptions,
         wrapped_tts: TTS,
         sentence_tokenizer: tokenize.SentenceTokenizer,
+        lookahead: int = 2,
+        max_buffered_audio: float = 30.0,
     ) -> None:
         super().__init__(tts=tts, conn_options=conn_options)
         self._wrapped_tts = wrapped_tts
         self._sent_stream = sentence_tokenizer.stream()
+        self._lookahead = lookahead
+        self._max_buffered_audio = max_buffered_audio
+        self._buffered_audio = 0.0  # seconds received but not emitted yet
 
     async def _metrics_monitor_task(self, event_aiter: AsyncIterable[SynthesizedAudio]) -> None:
         pass  # do nothing
@@ -80,24 +111,63 @@ class StreamAdapterWrapper(SynthesizeStream):
 
             self._sent_stream.end_input()
 
-        async def _synthesize():
+        # the sentences are synthesized concurrently but their audio is emitted in order
+        slots = asyncio.Semaphore(self._lookahead + 1)
+        drained = asyncio.Event()
+        synthesis_ch = utils.aio.Chan[tuple[asyncio.Task[None], utils.aio.Chan[SynthesizedAudio]]]()
+        synthesis_tasks: set[asyncio.Task[None]] = set()
+
+        async def _synthesize_sentence(
+            text: str, audio_ch: utils.aio.Chan[SynthesizedAudio]
+        ) -> None:
+            try:
+                async with self._wrapped_tts.synthesize(text) as stream:
+                    async for audio in stream:
+                        self._buffered_audio += audio.frame.duration
+                        audio_ch.send_nowait(audio)
+            finally:
+                audio_ch.close()
+
+        async def _start_syntheses() -> None:
             async for ev in self._sent_stream:
+                await slots.acquire()
+                while self._buffered_audio >= self._max_buffered_audio:
+                    drained.clear()
+                    await drained.wait()
+
+                audio_ch = utils.aio.Chan[SynthesizedAudio]()
+                task = asyncio.create_task(_synthesize_sentence(ev.token, audio_ch))
+                synthesis_tasks.add(task)
+                task.add_done_callback(synthesis_tasks.discard)
+                synthesis_ch.send_nowait((task, audio_ch))
+
+            synthesis_ch.close()
+
+        async def _emit_audio() -> None:
+            async for task, audio_ch in synthesis_ch:
                 last_audio: SynthesizedAudio | None = None
-                async for audio in self._wrapped_tts.synthesize(ev.token):
+                async for audio in audio_ch:
+                    self._buffered_audio -= audio.frame.duration
+                    drained.set()
                     if last_audio is not None:
                         self._event_ch.send_nowait(last_audio)
 
                     last_audio = audio
 
+                await task  # raise the synthesis error, if any
+                slots.release()
+
                 if last_audio is not None:
                     last_audio.is_final = True
                     self._event_ch.send_nowait(last_audio)
 
         tasks = [
             asyncio.create_task(_forward_input()),
-            asyncio.create_task(_synthesize()),
+            asyncio.create_task(_start_syntheses()),
+            asyncio.create_task(_emit_audio()),
         ]
         try:
             await asyncio.gather(*tasks)
         finally:
-            await utils.aio.cancel_and_wait(*tasks)
+            # interrupted or failed, cancel the outstanding requests
+            await utils.aio.cancel_and_wait(*tasks, *synthesis_tasks)
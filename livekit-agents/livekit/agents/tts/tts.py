@@ -33,10 +33,20 @@ class SynthesizedAudio:
     """Current segment of the synthesized audio (streaming only)"""
 
 
+AudioEncoding = Literal["pcm", "mulaw", "mp3", "opus", "wav"]
+
+# cheapest first: raw PCM is used as is, μ-law is decoded with a lookup table,
+# the compressed formats go through the (threaded) PyAV decoder
+ENCODING_PREFERENCE: tuple[AudioEncoding, ...] = ("pcm", "mulaw", "wav", "opus", "mp3")
+
+
 @dataclass
 class TTSCapabilities:
     streaming: bool
     """Whether this TTS supports streaming (generally using websockets)"""
+    encodings: tuple[AudioEncoding, ...] = ()
+    """Output encodings the TTS can switch to with `set_encoding()` without changing its
+    sample rate, empty when the encoding was set by the user"""
 
 
 class TTSError(BaseModel):
@@ -70,6 +80,7 @@ class TTS(
         self._num_channels = num_channels
         self._label = f"{type(self).__module__}.{type(self).__name__}"
         self._conn_options = conn_options or DEFAULT_API_CONNECT_OPTIONS
+        self._encoding: AudioEncoding | None = None
 
     @property
     def label(self) -> str:
@@ -87,6 +98,43 @@ class TTS(
     def num_channels(self) -> int:
         return self._num_channels
 
+    @property
+    def encoding(self) -> AudioEncoding | None:
+        """Output encoding selected with `set_encoding()`, None when using the plugin default"""
+        return self._encoding
+
+    def set_encoding(self, encoding: AudioEncoding) -> None:
+        """Switch the audio format requested from the provider
+
+        Only the encodings listed in `capabilities.encodings` are supported, the sample rate
+        of the synthesized audio doesn't change.
+        """
+        if encoding not in self._capabilities.encodings:
+            raise ValueError(f"{self._label} can't switch to the {encoding} encoding")
+
+        self._set_encoding(encoding)
+        self._encoding = encoding
+
+    def _set_encoding(self, encoding: AudioEncoding) -> None:
+        """Apply the encoding to the plugin options
+
+        The selected encoding is always recorded in `encoding`, plugins reading it when
+        creating their streams don't need to override this.
+        """
+
+    def negotiate_encoding(self) -> AudioEncoding | None:
+        """Select the supported encoding that is the cheapest to decode
+
+        Returns the selected encoding, or None if the TTS doesn't support switching.
+        """
+        for encoding in ENCODING_PREFERENCE:
+            if encoding in self._capabilities.encodings:
+                if encoding != self._encoding:
+                    self.set_encoding(encoding)
+                return encoding
+
+        return None
+
     @abstractmethod
     def synthesize(
         self,
@@ -135,6 +183,8 @@ class ChunkedStream(ABC):
 
         self._event_aiter, monitor_aiter = aio.itertools.tee(self._event_ch, 2)
         self._current_attempt_has_error = False
+        self._cache_hit: bool | None = None  # set by streams replaying cached audio
+        self._decode_time = 0.0  # time spent decoding the provider audio, added by the plugins
         self._metrics_task = asyncio.create_task(
             self._metrics_monitor_task(monitor_aiter), name="TTS._metrics_task"
         )
@@ -183,7 +233,8 @@ class ChunkedStream(ABC):
             cancelled=self._synthesize_task.cancelled(),
             label=self._tts._label,
             streamed=False,
-            error=None,
+            cache_hit=self._cache_hit,
+            decode_time=self._decode_time,
         )
         self._tts.emit("metrics_collected", metrics)
 
@@ -288,6 +339,7 @@ class SynthesizeStream(ABC):
         self._metrics_task: asyncio.Task | None = None  # started on first push
         self._current_attempt_has_error = False
         self._started_time: float = 0
+        self._decode_time = 0.0  # time spent decoding the provider audio, added by the plugins
 
         # used to track metrics
         self._mtc_pending_texts: list[str] = []
@@ -374,11 +426,13 @@ class SynthesizeStream(ABC):
                 cancelled=self._task.cancelled(),
                 label=self._tts._label,
                 streamed=True,
+                decode_time=self._decode_time,
                 error=None,
             )
             self._tts.emit("metrics_collected", metrics)
 
             audio_duration = 0.0
+            self._decode_time = 0.0
             ttfb = -1.0
             request_id = ""
             self._started_time = 0
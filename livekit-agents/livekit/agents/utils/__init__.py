@@ -1,12 +1,14 @@
 from livekit import rtc
 
-from . import aio, audio, codecs, http_context, hw, images
+from . import aio, audio, codecs, http_context, hw, images, wire
 from .audio import AudioBuffer, combine_frames, merge_frames
-from .connection_pool import ConnectionPool
+from .connection_pool import ConnectionPool, ConnectionPoolStats
 from .exp_filter import ExpFilter
+from .hedging import HedgeBudget
 from .log import log_exceptions
 from .misc import is_given, shortuuid, time_ms
-from .moving_average import MovingAverage
+from .moving_average import MovingAverage, MovingPercentile
+from .provider_stats import ProviderStats, rank_providers
 
 EventEmitter = rtc.EventEmitter
 
@@ -19,13 +21,19 @@ __all__ = [
     "http_context",
     "ExpFilter",
     "MovingAverage",
+    "MovingPercentile",
+    "HedgeBudget",
+    "ProviderStats",
+    "rank_providers",
     "EventEmitter",
     "log_exceptions",
     "codecs",
     "images",
     "audio",
     "aio",
+    "wire",
     "hw",
     "is_given",
     "ConnectionPool",
+    "ConnectionPoolStats",
 ]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import sys
+import threading
 import time
 from asyncio.base_events import _format_handle  # type: ignore
+from collections import Counter
+from types import FrameType
 from typing import Any
 
 from ...log import logger
@@ -24,3 +28,107 @@ def hook_slow_callbacks(slow_duration: float) -> None:
         return val
 
     asyncio.events.Handle._run = instrumented  # type: ignore
+
+
+class StallProfiler:
+    """
+    Watchdog thread sampling the stack of the event loop thread while the loop is stalled.
+
+    The loop is stalled when a callback scheduled on it runs more than ``threshold`` seconds late.
+    The samples are aggregated in the collapsed stack format of flamegraph.pl (also read by
+    speedscope), one ``frame;frame;frame count`` line per stack.
+
+    When the loop isn't stalled, the overhead is a callback on the loop and a wake up of the
+    watchdog thread every ``threshold / 2`` seconds.
+    """
+
+    MAX_STACKS = 5000
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        threshold: float = 0.1,
+        sample_interval: float = 0.005,
+    ) -> None:
+        self._loop = loop
+        self._threshold = threshold
+        self._tick_interval = threshold / 2
+        self._sample_interval = sample_interval
+        self._samples: Counter[str] = Counter()
+        self._stalls = 0
+        self._lock = threading.Lock()
+        self._last_tick = time.monotonic()
+        self._loop_thread_id = 0
+        self._tick_handle: asyncio.TimerHandle | None = None
+        self._stop_ev = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def stalls(self) -> int:
+        """number of stalls detected"""
+        return self._stalls
+
+    def start(self) -> None:
+        """start the watchdog, must be called from the thread running the event loop"""
+        self._loop_thread_id = threading.get_ident()
+        self._tick()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="stall_profiler")
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()
+
+        self._stop_ev.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        """the samples in the collapsed stack format"""
+        with self._lock:
+            return "\n".join(f"{stack} {count}" for stack, count in self._samples.items())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def _tick(self) -> None:
+        self._last_tick = time.monotonic()
+        self._tick_handle = self._loop.call_later(self._tick_interval, self._tick)
+
+    def _run(self) -> None:
+        stalled = False
+        while not self._stop_ev.is_set():
+            late = time.monotonic() - self._last_tick - self._tick_interval
+            if late < self._threshold:
+                stalled = False
+                self._stop_ev.wait(self._threshold - late)
+                continue
+
+            if not stalled:
+                stalled = True
+                self._stalls += 1
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._add_sample(_collapse_stack(frame))
+
+            self._stop_ev.wait(self._sample_interval)
+
+    def _add_sample(self, stack: str) -> None:
+        with self._lock:
+            if stack not in self._samples and len(self._samples) >= self.MAX_STACKS:
+                stack = "[truncated]"
+
+            self._samples[stack] += 1
+
+
+def _collapse_stack(frame: FrameType | None) -> str:
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})".replace(";", ":"))
+        frame = frame.f_back
+
+    return ";".join(reversed(frames))
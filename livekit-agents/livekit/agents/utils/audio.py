@@ -10,6 +10,7 @@ import aiofiles
 from livekit import rtc
 
 from ..log import logger
+from . import aio
 from .aio.utils import cancel_and_wait
 from .codecs import AudioStreamDecoder
 
@@ -99,12 +100,18 @@ class AudioByteStream:
         (e.g., from a stream or file) and receive back a list of
         fixed-size audio frames ready for processing or transmission.
         """
-        self._buf.extend(data)
+        # the frames are sliced from the incoming data directly when nothing is buffered,
+        # slicing a memoryview doesn't copy the data so it is always buffered
+        buf: bytes | bytearray = data
+        if self._buf or isinstance(data, memoryview):
+            self._buf.extend(data)
+            buf = self._buf
 
         frames = []
-        while len(self._buf) >= self._bytes_per_frame:
-            frame_data = self._buf[: self._bytes_per_frame]
-            self._buf = self._buf[self._bytes_per_frame :]
+        offset = 0
+        while len(buf) - offset >= self._bytes_per_frame:
+            frame_data = buf[offset : offset + self._bytes_per_frame]
+            offset += self._bytes_per_frame
 
             frames.append(
                 rtc.AudioFrame(
@@ -115,6 +122,7 @@ class AudioByteStream:
                 )
             )
 
+        self._buf = bytearray(buf[offset:])
         return frames
 
     write = push  # Alias for the push method.
@@ -152,6 +160,79 @@ class AudioByteStream:
         ]
 
 
+class AudioFanout:
+    """
+    Distribute the frames of an audio source to several consumers.
+
+    Each consumer subscribes with the sample rate it needs. The frames are resampled once per
+    sample rate and the resulting frames are shared by the consumers of that rate, e.g the VAD
+    and the STT of a participant both running at 16kHz.
+    """
+
+    def __init__(
+        self, *, quality: rtc.AudioResamplerQuality = rtc.AudioResamplerQuality.HIGH
+    ) -> None:
+        self._quality = quality
+        self._subscribers: dict[int | None, list[aio.Chan[rtc.AudioFrame]]] = {}
+        self._resamplers: dict[int, rtc.AudioResampler] = {}
+        self._input_rate = 0
+
+    def subscribe(self, sample_rate: int | None = None) -> aio.Chan[rtc.AudioFrame]:
+        """
+        Returns a channel receiving the audio at the given sample rate,
+        or at the sample rate of the source if None.
+        """
+        ch = aio.Chan[rtc.AudioFrame]()
+        self._subscribers.setdefault(sample_rate, []).append(ch)
+        return ch
+
+    def unsubscribe(self, ch: aio.Chan[rtc.AudioFrame]) -> None:
+        for sample_rate, channels in list(self._subscribers.items()):
+            if ch in channels:
+                channels.remove(ch)
+                if not channels:
+                    del self._subscribers[sample_rate]
+                    if sample_rate is not None:
+                        self._resamplers.pop(sample_rate, None)
+                break
+
+        ch.close()
+
+    def push(self, frame: rtc.AudioFrame) -> None:
+        if self._input_rate != frame.sample_rate:
+            # the resamplers are created for the sample rate of the source
+            self._input_rate = frame.sample_rate
+            self._resamplers.clear()
+
+        for sample_rate, channels in self._subscribers.items():
+            if sample_rate is None or sample_rate == frame.sample_rate:
+                frames = [frame]
+            else:
+                frames = self._resampler(sample_rate, frame.num_channels).push(frame)
+
+            for ch in channels:
+                for f in frames:
+                    ch.send_nowait(f)
+
+    def _resampler(self, sample_rate: int, num_channels: int) -> rtc.AudioResampler:
+        resampler = self._resamplers.get(sample_rate)
+        if resampler is None:
+            resampler = self._resamplers[sample_rate] = rtc.AudioResampler(
+                self._input_rate, sample_rate, num_channels=num_channels, quality=self._quality
+            )
+
+        return resampler
+
+    def close(self) -> None:
+        """close the channels of every consumer"""
+        for channels in self._subscribers.values():
+            for ch in channels:
+                ch.close()
+
+        self._subscribers.clear()
+        self._resamplers.clear()
+
+
 async def audio_frames_from_file(
     file_path: str, sample_rate: int = 48000, num_channels: int = 1
 ) -> AsyncGenerator[rtc.AudioFrame, None]:
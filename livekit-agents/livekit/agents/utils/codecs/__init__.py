@@ -13,5 +13,7 @@
 # limitations under the License.
 
 from .decoder import AudioStreamDecoder, StreamBuffer
+from .mulaw import decode_mulaw
+from .raw import RawAudioDecoder
 
-__all__ = ["AudioStreamDecoder", "StreamBuffer"]
+__all__ = ["AudioStreamDecoder", "RawAudioDecoder", "StreamBuffer", "decode_mulaw"]
@@ -16,6 +16,7 @@ import asyncio
 import contextlib
 import io
 import threading
+import time
 from collections.abc import AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
@@ -105,11 +106,17 @@ class AudioStreamDecoder:
         self._started = False
         self._input_buf = StreamBuffer()
         self._loop = asyncio.get_event_loop()
+        self._decode_time = 0.0
 
         if self.__class__._executor is None:
             # each decoder instance will submit jobs to the shared pool
             self.__class__._executor = ThreadPoolExecutor(max_workers=self.__class__._max_workers)
 
+    @property
+    def decode_time(self) -> float:
+        """CPU time spent decoding and resampling the stream so far, in seconds"""
+        return self._decode_time
+
     def push(self, chunk: bytes):
         self._input_buf.write(chunk)
         if not self._started:
@@ -125,6 +132,8 @@ class AudioStreamDecoder:
     def _decode_loop(self):
         container: av.container.InputContainer | None = None
         resampler: av.AudioResampler | None = None
+        # thread_time doesn't include the time spent waiting for input
+        last_time = time.thread_time()
         try:
             container = av.open(self._input_buf, mode="r")
             if len(container.streams.audio) == 0:
@@ -139,15 +148,16 @@ class AudioStreamDecoder:
 
                 for resampled_frame in resampler.resample(frame):
                     nchannels = len(resampled_frame.layout.channels)
-                    self._loop.call_soon_threadsafe(
-                        self._output_ch.send_nowait,
-                        rtc.AudioFrame(
-                            data=resampled_frame.to_ndarray().tobytes(),
-                            num_channels=nchannels,
-                            sample_rate=int(resampled_frame.sample_rate),
-                            samples_per_channel=int(resampled_frame.samples / nchannels),
-                        ),
+                    audio_frame = rtc.AudioFrame(
+                        data=resampled_frame.to_ndarray().tobytes(),
+                        num_channels=nchannels,
+                        sample_rate=int(resampled_frame.sample_rate),
+                        samples_per_channel=int(resampled_frame.samples / nchannels),
                     )
+                    now = time.thread_time()
+                    self._decode_time += now - last_time
+                    last_time = now
+                    self._loop.call_soon_threadsafe(self._output_ch.send_nowait, audio_frame)
 
         except Exception:
             logger.exception("error decoding audio")
@@ -0,0 +1,34 @@
+# Copyright 2025 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def _build_table() -> np.ndarray:
+    # G.711 μ-law expansion of every possible byte
+    ulaw = ~np.arange(256, dtype=np.int32) & 0xFF
+    exponent = (ulaw >> 4) & 0x07
+    mantissa = ulaw & 0x0F
+    magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    return np.where(ulaw & 0x80, -magnitude, magnitude).astype("<i2")
+
+
+_TABLE = _build_table()
+
+
+def decode_mulaw(data: bytes | bytearray) -> bytes:
+    """Decode 8-bit G.711 μ-law samples to 16-bit little-endian PCM"""
+    return _TABLE[np.frombuffer(data, dtype=np.uint8)].tobytes()
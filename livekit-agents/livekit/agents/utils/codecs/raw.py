@@ -0,0 +1,112 @@
+# Copyright 2025 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections.abc import AsyncIterator
+from typing import Literal, Optional, Union
+
+from livekit import rtc
+from livekit.agents.utils import aio
+
+from .mulaw import decode_mulaw
+
+
+class RawAudioDecoder:
+    """Decode headerless 16-bit PCM or μ-law audio into AudioFrames.
+
+    Same interface as AudioStreamDecoder, the decoding is cheap enough to run on the event loop
+    so there is no decoding thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        num_channels: int = 1,
+        encoding: Literal["pcm", "mulaw"] = "pcm",
+        output_sample_rate: Optional[int] = None,
+    ):
+        self._sample_rate = sample_rate
+        self._num_channels = num_channels
+        self._encoding = encoding
+        self._bytes_per_sample = num_channels * (2 if encoding == "pcm" else 1)
+        self._buf = bytearray()
+        self._resampler: Optional[rtc.AudioResampler] = None
+        if output_sample_rate is not None and output_sample_rate != sample_rate:
+            self._resampler = rtc.AudioResampler(
+                input_rate=sample_rate, output_rate=output_sample_rate, num_channels=num_channels
+            )
+
+        self._output_ch = aio.Chan[rtc.AudioFrame]()
+        self._decode_time = 0.0
+
+    @property
+    def decode_time(self) -> float:
+        """CPU time spent decoding and resampling the stream so far, in seconds"""
+        return self._decode_time
+
+    def push(self, chunk: bytes) -> None:
+        if self._output_ch.closed:
+            return
+
+        start_time = time.thread_time()
+        buf: Union[bytes, bytearray] = chunk
+        if self._buf:
+            self._buf.extend(chunk)
+            buf = self._buf
+
+        # keep the incomplete sample for the next chunk
+        size = len(buf) - len(buf) % self._bytes_per_sample
+        data, self._buf = buf[:size], bytearray(buf[size:])
+        if data:
+            self._send(self._to_frame(data))
+        self._decode_time += time.thread_time() - start_time
+
+    def end_input(self) -> None:
+        if self._output_ch.closed:
+            return
+
+        if self._resampler is not None:
+            for frame in self._resampler.flush():
+                self._output_ch.send_nowait(frame)
+
+        self._output_ch.close()
+
+    def _to_frame(self, data: Union[bytes, bytearray]) -> rtc.AudioFrame:
+        if self._encoding == "mulaw":
+            data = decode_mulaw(data)
+
+        return rtc.AudioFrame(
+            data=data,
+            sample_rate=self._sample_rate,
+            num_channels=self._num_channels,
+            samples_per_channel=len(data) // (2 * self._num_channels),
+        )
+
+    def _send(self, frame: rtc.AudioFrame) -> None:
+        if self._resampler is None:
+            self._output_ch.send_nowait(frame)
+            return
+
+        for resampled_frame in self._resampler.push(frame):
+            self._output_ch.send_nowait(resampled_frame)
+
+    def __aiter__(self) -> AsyncIterator[rtc.AudioFrame]:
+        return self
+
+    async def __anext__(self) -> rtc.AudioFrame:
+        return await self._output_ch.__anext__()
+
+    async def aclose(self) -> None:
+        self.end_input()
@@ -1,20 +1,41 @@
 import asyncio
 import time
 import weakref
+from collections import deque
 from collections.abc import AsyncGenerator, Awaitable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Callable, Generic, Optional, TypeVar
 
+from ..log import logger
 from . import aio
 
 T = TypeVar("T")
 
 
+@dataclass
+class ConnectionPoolStats:
+    hits: int
+    """number of get() calls served by an idle connection"""
+    misses: int
+    """number of get() calls that had to open a new connection"""
+    wait_time: float
+    """total time spent waiting in get(), in seconds"""
+    connections: int
+    """number of open connections, in use or idle"""
+    available: int
+    """number of idle connections"""
+
+
 class ConnectionPool(Generic[T]):
     """Helper class to manage persistent connections like websockets.
 
     Handles connection pooling and reconnection after max duration.
     Can be used as an async context manager to automatically return connections to the pool.
+
+    Once prewarm() or get() is called, a background task keeps `min_idle` connections open,
+    replaces them before they reach `max_session_duration` and pings them with `ping_cb`,
+    so get() doesn't have to wait for a new connection.
     """
 
     def __init__(
@@ -24,6 +45,10 @@ class ConnectionPool(Generic[T]):
         mark_refreshed_on_get: bool = False,
         connect_cb: Optional[Callable[[], Awaitable[T]]] = None,
         close_cb: Optional[Callable[[T], Awaitable[None]]] = None,
+        ping_cb: Optional[Callable[[T], Awaitable[None]]] = None,
+        min_idle: int = 0,
+        max_size: Optional[int] = None,
+        health_check_interval: float = 5.0,
     ) -> None:
         """Initialize the connection wrapper.
 
@@ -32,18 +57,51 @@ class ConnectionPool(Generic[T]):
             mark_refreshed_on_get: If True, the session will be marked as fresh when get() is called. only used when max_session_duration is set.
             connect_cb: Optional async callback to create new connections
             close_cb: Optional async callback to close connections
+            ping_cb: Optional async callback checking that an idle connection is alive, idle connections are removed when it raises
+            min_idle: Number of idle connections kept open in the background
+            max_size: Maximum number of open connections, get() waits for a connection to be returned or removed when reached
+            health_check_interval: Interval in seconds between the checks of the idle connections
         """  # noqa: E501
+        if max_size is not None and min_idle > max_size:
+            raise ValueError("min_idle must be less than or equal to max_size")
+
         self._max_session_duration = max_session_duration
         self._mark_refreshed_on_get = mark_refreshed_on_get
         self._connect_cb = connect_cb
         self._close_cb = close_cb
+        self._ping_cb = ping_cb
+        self._min_idle = min_idle
+        self._max_size = max_size
+        self._health_check_interval = health_check_interval
         self._connections: dict[T, float] = {}  # conn -> connected_at timestamp
         self._available: set[T] = set()
+        self._connecting = 0
+        # incremented by invalidate(), the connections opened before are not put back
+        self._generation = 0
 
         # store connections to be reaped (closed) later.
         self._to_close: set[T] = set()
 
-        self._prewarm_task: Optional[weakref.ref[asyncio.Task]] = None
+        # get() calls waiting for a connection to be returned when max_size is reached
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+        self._prewarm_task: Optional[weakref.ref[asyncio.Task[None]]] = None
+        self._maintenance_task: Optional[asyncio.Task[None]] = None
+        self._maintenance_wakeup: Optional[asyncio.Future[None]] = None
+
+        self._hits = 0
+        self._misses = 0
+        self._wait_time = 0.0
+
+    @property
+    def stats(self) -> ConnectionPoolStats:
+        return ConnectionPoolStats(
+            hits=self._hits,
+            misses=self._misses,
+            wait_time=self._wait_time,
+            connections=len(self._connections),
+            available=len(self._available),
+        )
 
     async def _connect(self) -> T:
         """Create a new connection.
@@ -56,10 +114,33 @@ class ConnectionPool(Generic[T]):
         """
         if self._connect_cb is None:
             raise NotImplementedError("Must provide connect_cb or implement connect()")
-        connection = await self._connect_cb()
+
+        self._connecting += 1
+        try:
+            connection = await self._connect_cb()
+        except BaseException:
+            self._notify_waiters()
+            raise
+        finally:
+            self._connecting -= 1
+
         self._connections[connection] = time.time()
         return connection
 
+    async def _connect_idle(self) -> Optional[T]:
+        """Create a new connection for the pool.
+
+        Returns:
+            The new connection object, or None if the pool was invalidated while connecting
+        """
+        generation = self._generation
+        conn = await self._connect()
+        if generation != self._generation:
+            # opened before invalidate(), e.g. with outdated options
+            self.remove(conn)
+            return None
+        return conn
+
     async def _drain_to_close(self) -> None:
         """Drain and close all the connections queued for closing."""
         for conn in list(self._to_close):
@@ -88,8 +169,39 @@ class ConnectionPool(Generic[T]):
         Returns:
             An active connection object
         """
-        await self._drain_to_close()
-
+        start_time = time.perf_counter()
+        try:
+            await self._drain_to_close()
+            self._start_maintenance()
+
+            while True:
+                conn = self._pop_available()
+                if conn is not None:
+                    self._hits += 1
+                    return conn
+
+                if not self._is_full():
+                    break
+
+                # every connection is in use, wait for one to be returned or removed
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+                try:
+                    await waiter
+                finally:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+
+                await self._drain_to_close()
+
+            self._misses += 1
+            return await self._connect()
+        finally:
+            self._wait_time += time.perf_counter() - start_time
+            # replace the connection that was handed out
+            self._wakeup_maintenance()
+
+    def _pop_available(self) -> Optional[T]:
         now = time.time()
 
         # try to reuse an available connection that hasn't expired
@@ -105,7 +217,20 @@ class ConnectionPool(Generic[T]):
             # connection expired; mark it for resetting.
             self.remove(conn)
 
-        return await self._connect()
+        return None
+
+    def _is_full(self) -> bool:
+        return (
+            self._max_size is not None
+            and len(self._connections) + self._connecting >= self._max_size
+        )
+
+    def _notify_waiters(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
 
     def put(self, conn: T) -> None:
         """Mark a connection as available for reuse.
@@ -117,6 +242,7 @@ class ConnectionPool(Generic[T]):
         """
         if conn in self._connections:
             self._available.add(conn)
+            self._notify_waiters()
 
     async def _maybe_close_connection(self, conn: T) -> None:
         """Close a connection if close_cb is provided.
@@ -139,6 +265,8 @@ class ConnectionPool(Generic[T]):
         if conn in self._connections:
             self._to_close.add(conn)
             self._connections.pop(conn, None)
+            self._notify_waiters()
+            self._wakeup_maintenance()
 
     def invalidate(self) -> None:
         """Clear all existing connections.
@@ -149,30 +277,149 @@ class ConnectionPool(Generic[T]):
             self._to_close.add(conn)
         self._connections.clear()
         self._available.clear()
+        self._generation += 1
+        for _ in range(len(self._waiters)):
+            self._notify_waiters()
+        self._wakeup_maintenance()
 
     def prewarm(self) -> None:
         """Initiate prewarming of the connection pool without blocking.
 
-        This method starts a background task that creates a new connection if none exist.
+        This method starts a background task that creates a new connection if none exist,
+        or `min_idle` connections when set.
         The task automatically cleans itself up when the connection pool is closed.
         """
+        if self._min_idle > 0:
+            self._start_maintenance()
+            return
+
         if self._prewarm_task is not None or self._connections:
             return
 
-        async def _prewarm_impl():
+        async def _prewarm_impl() -> None:
             if not self._connections:
-                conn = await self._connect()
-                self._available.add(conn)
+                conn = await self._connect_idle()
+                if conn is not None:
+                    self._available.add(conn)
 
         task = asyncio.create_task(_prewarm_impl())
         self._prewarm_task = weakref.ref(task)
+        if self._max_session_duration is not None and self._maintenance_task is None:
+            # refresh the prewarmed connection before it expires
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+        else:
+            self._start_maintenance()
+
+    def _start_maintenance(self) -> None:
+        if self._maintenance_task is not None:
+            return
+
+        if not (self._min_idle or self._ping_cb):
+            return
+
+        self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+
+    def _wakeup_maintenance(self) -> None:
+        if self._maintenance_wakeup is not None and not self._maintenance_wakeup.done():
+            self._maintenance_wakeup.set_result(None)
+
+    async def _maintenance_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._maintenance_wakeup = loop.create_future()
+            try:
+                await self._drain_to_close()
+                await self._check_idle_connections()
+                await self._replenish()
+            except Exception:
+                logger.exception("failed to maintain the connection pool")
+
+            await asyncio.wait([self._maintenance_wakeup], timeout=self._health_check_interval)
+
+    async def _check_idle_connections(self) -> None:
+        now = time.time()
+        refresh: list[T] = []
+        ping: list[T] = []
+        for conn in list(self._available):
+            connected_at = self._connections[conn]
+            if (
+                self._max_session_duration is not None
+                # the connection would expire before the next check
+                and now - connected_at + self._health_check_interval > self._max_session_duration
+            ):
+                refresh.append(conn)
+            elif self._ping_cb is not None:
+                ping.append(conn)
+
+        for conn in refresh:
+            if conn not in self._available:
+                # handed out or removed while replacing the previous ones
+                continue
+
+            if len(self._available) > max(self._min_idle, 1):
+                self.remove(conn)
+                continue
+
+            if self._is_full():
+                self.remove(conn)
+                new_conn = await self._connect_idle()
+            else:
+                # open the replacement first, the expiring connection can still be used
+                new_conn = await self._connect_idle()
+                if conn in self._available:
+                    self.remove(conn)
+
+            if new_conn is not None:
+                self.put(new_conn)
+
+        # skip the connections handed out while replacing the expiring ones
+        ping = [conn for conn in ping if conn in self._available]
+        if ping:
+            # the connections being checked can't be handed out
+            self._available.difference_update(ping)
+            results = await asyncio.gather(
+                *(self._ping(conn) for conn in ping), return_exceptions=True
+            )
+            for conn, result in zip(ping, results):
+                if isinstance(result, BaseException):
+                    logger.debug("removing a dead connection from the pool", exc_info=result)
+                    self.remove(conn)
+                else:
+                    self.put(conn)
+
+        await self._drain_to_close()
+
+    async def _ping(self, conn: T) -> None:
+        assert self._ping_cb is not None
+        await asyncio.wait_for(self._ping_cb(conn), self._health_check_interval)
 
-    async def aclose(self):
+    async def _replenish(self) -> None:
+        missing = self._min_idle - len(self._available) - self._connecting
+        if self._max_size is not None:
+            missing = min(missing, self._max_size - len(self._connections) - self._connecting)
+
+        if missing <= 0:
+            return
+
+        results = await asyncio.gather(
+            *(self._connect_idle() for _ in range(missing)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("failed to open an idle connection", exc_info=result)
+            elif result is not None:
+                self.put(result)
+
+    async def aclose(self) -> None:
         """Close all connections, draining any pending connection closures."""
         if self._prewarm_task is not None:
             task = self._prewarm_task()
             if task:
-                aio.gracefully_cancel(task)
+                await aio.gracefully_cancel(task)
+
+        if self._maintenance_task is not None:
+            await aio.cancel_and_wait(self._maintenance_task)
+            self._maintenance_task = None
 
         self.invalidate()
         await self._drain_to_close()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+
+class HedgeBudget:
+    """
+    Token bucket bounding the fraction of requests that are duplicated to hedge their latency.
+
+    Every request earns `max_fraction` of a token, and a hedged request spends a whole one.
+    """
+
+    def __init__(self, max_fraction: float, max_tokens: float = 10.0) -> None:
+        self._max_fraction = max_fraction
+        self._max_tokens = max(max_tokens, 1.0)
+        self._tokens = 0.0
+
+    def add_request(self) -> None:
+        self._tokens = min(self._tokens + self._max_fraction, self._max_tokens)
+
+    def try_acquire(self) -> bool:
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
@@ -1,3 +1,11 @@
 from .cpu import CGroupV2CPUMonitor, CPUMonitor, DefaultCPUMonitor, get_cpu_monitor
+from .memory import memory_limit, process_tree_pss
 
-__all__ = ["get_cpu_monitor", "CPUMonitor", "CGroupV2CPUMonitor", "DefaultCPUMonitor"]
+__all__ = [
+    "get_cpu_monitor",
+    "CPUMonitor",
+    "CGroupV2CPUMonitor",
+    "DefaultCPUMonitor",
+    "memory_limit",
+    "process_tree_pss",
+]
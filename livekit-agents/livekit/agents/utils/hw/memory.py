@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import os
+
+import psutil
+
+
+def memory_limit() -> int:
+    """Memory available to the processes in bytes, the cgroup limit when there is one."""
+    try:
+        with open("/sys/fs/cgroup/memory.max") as f:
+            limit = f.read().strip()
+        if limit != "max":
+            return int(limit)
+    except (FileNotFoundError, ValueError):
+        pass
+
+    return int(psutil.virtual_memory().total)
+
+
+def process_tree_pss(pid: int | None = None) -> int:
+    """Proportional set size in bytes of a process and of its children.
+
+    The pages shared between the processes (e.g. the forked job processes) are only counted once.
+    Falls back to the RSS when the PSS isn't available on the platform."""
+    root = psutil.Process(pid or os.getpid())
+    total = 0
+    for proc in [root, *root.children(recursive=True)]:
+        try:
+            info = proc.memory_full_info()
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            continue
+        except psutil.AccessDenied:
+            try:
+                info = proc.memory_info()
+            except psutil.Error:
+                continue
+
+        total += getattr(info, "pss", info.rss)
+
+    return total
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import bisect
+import math
+from collections import deque
+
 
 class MovingAverage:
     def __init__(self, window_size: int) -> None:
@@ -26,3 +30,29 @@ class MovingAverage:
 
     def size(self) -> int:
         return min(self._count, len(self._hist))
+
+
+class MovingPercentile:
+    def __init__(self, window_size: int) -> None:
+        self._hist: deque[float] = deque(maxlen=window_size)
+        self._sorted: list[float] = []
+
+    def add_sample(self, sample: float) -> None:
+        if len(self._hist) == self._hist.maxlen:
+            del self._sorted[bisect.bisect_left(self._sorted, self._hist[0])]
+        self._hist.append(sample)
+        bisect.insort(self._sorted, sample)
+
+    def get_percentile(self, percentile: float) -> float:
+        """nearest-rank percentile of the window, percentile is between 0 and 100"""
+        if not self._sorted:
+            return 0
+        rank = math.ceil(percentile / 100 * len(self._sorted))
+        return self._sorted[min(max(rank, 1), len(self._sorted)) - 1]
+
+    def reset(self) -> None:
+        self._hist.clear()
+        self._sorted.clear()
+
+    def size(self) -> int:
+        return len(self._hist)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+
+from .moving_average import MovingAverage, MovingPercentile
+
+
+class ProviderStats:
+    """Rolling TTFB and error rate of a provider"""
+
+    def __init__(self, *, ttfb_window_size: int = 100, error_window_size: int = 20) -> None:
+        self._ttfb = MovingPercentile(ttfb_window_size)
+        self._errors = MovingAverage(error_window_size)
+
+    @property
+    def ttfb(self) -> MovingPercentile:
+        return self._ttfb
+
+    def add_ttfb(self, ttfb: float) -> None:
+        self._ttfb.add_sample(ttfb)
+
+    def add_result(self, *, error: bool) -> None:
+        self._errors.add_sample(1.0 if error else 0.0)
+
+    @property
+    def error_rate(self) -> float:
+        return self._errors.get_avg()
+
+    def expected_ttfb(self) -> float | None:
+        """median TTFB scaled by the expected number of attempts, None without TTFB samples"""
+        if self._ttfb.size() == 0:
+            return None
+
+        return self._ttfb.get_percentile(50) / (1.0 - min(self.error_rate, 0.99))
+
+
+def rank_providers(
+    stats: Sequence[ProviderStats],
+    *,
+    available: Sequence[bool],
+    exploration: float = 0.0,
+) -> list[int]:
+    """
+    Order in which to try the providers: the available ones by expected TTFB, followed by the
+    ones without TTFB samples, then the unavailable ones (keeping the list order for ties).
+
+    With the exploration probability, another random available provider is tried first so its
+    statistics stay up to date.
+    """
+    candidates = [i for i in range(len(stats)) if available[i]]
+    measured = sorted(
+        (i for i in candidates if stats[i].expected_ttfb() is not None),
+        key=lambda i: stats[i].expected_ttfb(),  # type: ignore
+    )
+    order = measured + [i for i in candidates if stats[i].expected_ttfb() is None]
+
+    if len(order) > 1 and random.random() < exploration:
+        explored = random.randrange(1, len(order))
+        order.insert(0, order.pop(explored))
+
+    return order + [i for i in range(len(stats)) if not available[i]]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import binascii
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["loads", "b64decode"]
+
+
+def loads(data: str | bytes) -> Any:
+    """parse a JSON message, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def b64decode(data: str | bytes) -> bytes:
+    """decode base64 audio
+
+    base64.b64decode copies str inputs to bytes before decoding them, binascii decodes
+    ascii strings directly.
+    """
+    return binascii.a2b_base64(data)
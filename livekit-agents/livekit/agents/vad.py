@@ -82,6 +82,12 @@ class VAD(ABC, rtc.EventEmitter[Literal["metrics_collected"]]):
     def capabilities(self) -> VADCapabilities:
         return self._capabilities
 
+    @property
+    def sample_rate(self) -> int | None:
+        """Sample rate the VAD runs at, the audio pushed at another sample rate is resampled.
+        None if the VAD uses the sample rate of the input"""
+        return None
+
     @abstractmethod
     def stream(self) -> VADStream: ...
 
@@ -298,6 +298,17 @@ class Agent:
             wrapped_stt = stt.StreamAdapter(stt=wrapped_stt, vad=activity.vad)
 
         async with wrapped_stt.stream() as stream:
+            audio_gate = self.session.options.stt_audio_gate
+            recognition = (
+                activity._audio_recognition
+                # the StreamAdapter only sends the speech already
+                if audio_gate is not None and activity.vad and activity.stt.capabilities.streaming
+                else None
+            )
+            if recognition is not None:
+                # the gate follows the VAD of the session, it already runs on the same audio
+                stream.enable_audio_gate(audio_gate)
+                recognition.add_vad_listener(stream.push_vad_event)
 
             @utils.log_exceptions(logger=logger)
             async def _forward_input():
@@ -309,6 +320,8 @@ class Agent:
                 async for event in stream:
                     yield event
             finally:
+                if recognition is not None:
+                    recognition.remove_vad_listener(stream.push_vad_event)
                 await utils.aio.cancel_and_wait(forward_task)
 
     async def llm_node(
@@ -402,7 +415,10 @@ class Agent:
 
         if not activity.tts.capabilities.streaming:
             wrapped_tts = tts.StreamAdapter(
-                tts=wrapped_tts, sentence_tokenizer=tokenize.basic.SentenceTokenizer()
+                tts=wrapped_tts,
+                sentence_tokenizer=tokenize.basic.SentenceTokenizer(
+                    early_flush=self.session.options.tts_early_flush
+                ),
             )
 
         async with wrapped_tts.stream() as stream:
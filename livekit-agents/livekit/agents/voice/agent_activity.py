@@ -30,6 +30,8 @@ from .events import (
 )
 from .generation import (
     _AudioOutput,
+    _PythonOutput,
+    _SanitizedOutput,
     _TextOutput,
     _TTSGenerationData,
     perform_audio_forwarding,
@@ -86,6 +88,12 @@ class AgentActivity(RecognitionHooks):
         self._main_atask: asyncio.Task | None = None
         self._speech_tasks: list[asyncio.Task] = []
 
+        # non-blocking tools still running, their outputs are ignored once the activity is drained
+        self._background_tool_tasks: set[asyncio.Task[Any]] = set()
+        self._background_tools_closed = False
+        # outputs of the non-blocking tools waiting for their placeholder to be in the chat_ctx
+        self._background_tool_outputs: dict[str, _SanitizedOutput] = {}
+
         from .. import llm as large_language_model
 
         self._turn_detection_mode = (
@@ -358,6 +366,12 @@ class AgentActivity(RecognitionHooks):
                 min_endpointing_delay=self._session.options.min_endpointing_delay,
                 max_endpointing_delay=self._session.options.max_endpointing_delay,
                 manual_turn_detection=self._turn_detection_mode == "manual",
+                # a custom stt_node may expect the audio at the input sample rate
+                stt_sample_rate=(
+                    self.stt.sample_rate
+                    if self.stt and type(self._agent).stt_node is Agent.stt_node
+                    else None
+                ),
             )
             self._audio_recognition.start()
             self._started = True
@@ -380,6 +394,8 @@ class AgentActivity(RecognitionHooks):
             if self._main_atask is not None:
                 await asyncio.shield(self._main_atask)
 
+            await self._cancel_background_tools()
+
     async def aclose(self) -> None:
         async with self._lock:
             if not self._draining:
@@ -394,6 +410,7 @@ class AgentActivity(RecognitionHooks):
             if self._main_atask is not None:
                 await utils.aio.cancel_and_wait(self._main_atask)
 
+            await self._cancel_background_tools()
             self._agent._activity = None
 
     def push_audio(self, frame: rtc.AudioFrame) -> None:
@@ -748,6 +765,7 @@ class AgentActivity(RecognitionHooks):
         #  - cancel the current generation if it allows interruptions (otherwise skip this current
         #  turn)
         #  - generate a reply to the user input
+        eou_detected_at = time.perf_counter()
 
         if isinstance(self.llm, llm.RealtimeModel):
             if self.llm.capabilities.turn_detection:
@@ -791,6 +809,7 @@ class AgentActivity(RecognitionHooks):
 
         user_message = llm.ChatMessage(role="user", content=[new_transcript])
         start_time = time.time()
+        callback_started_at = time.perf_counter()
         try:
             await self._agent.on_user_turn_completed(
                 self._agent.chat_ctx,
@@ -800,11 +819,25 @@ class AgentActivity(RecognitionHooks):
             return  # ignore this turn
 
         callback_duration = time.time() - start_time
+        callback_ended_at = time.perf_counter()
 
         if isinstance(self.llm, llm.RealtimeModel):
             # ignore stt transcription for realtime model
             new_transcript = ""
         speech_handle = self.generate_reply(user_input=new_transcript)
+
+        # the timeline of the reply starts when the user stopped speaking
+        end_of_speech_at = eou_detected_at - info.end_of_utterance_delay
+        span = speech_handle.span
+        span.start_time = end_of_speech_at
+        span.start_child(
+            "eou_detection",
+            start_time=end_of_speech_at,
+            attributes={"transcription_delay": info.transcription_delay},
+        ).end(end_time=eou_detected_at)
+        span.start_child("on_user_turn_completed", start_time=callback_started_at).end(
+            end_time=callback_ended_at
+        )
         eou_metrics = EOUMetrics(
             timestamp=time.time(),
             end_of_utterance_delay=info.end_of_utterance_delay,
@@ -830,6 +863,7 @@ class AgentActivity(RecognitionHooks):
         model_settings: ModelSettings,
     ) -> None:
         _SpeechHandleContextVar.set(speech_handle)
+        speech_handle._mark_generation_started()
 
         tr_output = (
             self._session.output.transcription
@@ -879,21 +913,25 @@ class AgentActivity(RecognitionHooks):
                     node=self._agent.tts_node,
                     input=audio_source,
                     model_settings=model_settings,
+                    span=speech_handle.span,
                 )
                 tasks.append(tts_task)
 
                 forward_task, audio_out = perform_audio_forwarding(
-                    audio_output=audio_output, tts_output=tts_gen_data.audio_ch
+                    audio_output=audio_output,
+                    tts_output=tts_gen_data.audio_ch,
+                    span=speech_handle.span,
                 )
                 tasks.append(forward_task)
             else:
                 # use the provided audio
                 forward_task, audio_out = perform_audio_forwarding(
-                    audio_output=audio_output, tts_output=audio
+                    audio_output=audio_output, tts_output=audio, span=speech_handle.span
                 )
                 tasks.append(forward_task)
 
             audio_out.first_frame_fut.add_done_callback(_on_first_frame)
+            audio_out.first_frame_fut.add_done_callback(lambda _: speech_handle._mark_first_audio())
 
         await speech_handle.wait_if_not_interrupted([*tasks])
 
@@ -932,6 +970,7 @@ class AgentActivity(RecognitionHooks):
         from .agent import ModelSettings
 
         _SpeechHandleContextVar.set(speech_handle)
+        speech_handle._mark_generation_started()
 
         log_event(
             "generation started",
@@ -966,6 +1005,7 @@ class AgentActivity(RecognitionHooks):
             chat_ctx=chat_ctx,
             tool_ctx=tool_ctx,
             model_settings=model_settings,
+            span=speech_handle.span,
         )
         tasks.append(llm_task)
         tts_text_input, llm_output = utils.aio.itertools.tee(llm_gen_data.text_ch)
@@ -977,6 +1017,7 @@ class AgentActivity(RecognitionHooks):
                 node=self._agent.tts_node,
                 input=tts_text_input,
                 model_settings=model_settings,
+                span=speech_handle.span,
             )
             tasks.append(tts_task)
 
@@ -1002,11 +1043,14 @@ class AgentActivity(RecognitionHooks):
             assert tts_gen_data is not None
             # TODO(theomonnom): should the audio be added to the chat_context too?
             forward_task, audio_out = perform_audio_forwarding(
-                audio_output=audio_output, tts_output=tts_gen_data.audio_ch
+                audio_output=audio_output,
+                tts_output=tts_gen_data.audio_ch,
+                span=speech_handle.span,
             )
             tasks.append(forward_task)
 
             audio_out.first_frame_fut.add_done_callback(_on_first_frame)
+            audio_out.first_frame_fut.add_done_callback(lambda _: speech_handle._mark_first_audio())
         else:
             text_out.first_text_fut.add_done_callback(_on_first_frame)
 
@@ -1017,6 +1061,8 @@ class AgentActivity(RecognitionHooks):
             tool_ctx=tool_ctx,
             tool_choice=model_settings.tool_choice,
             function_stream=llm_gen_data.function_ch,
+            on_background_output=self._on_background_tool_output,
+            background_tasks=self._background_tool_tasks,
         )
 
         await speech_handle.wait_if_not_interrupted([*tasks])
@@ -1032,6 +1078,7 @@ class AgentActivity(RecognitionHooks):
         # add the tools messages that triggers this reply to the chat context
         if _tools_messages:
             self._agent._chat_ctx.items.extend(_tools_messages)
+            self._apply_background_tool_outputs()
 
         if speech_handle.interrupted:
             await utils.aio.cancel_and_wait(*tasks)
@@ -1069,7 +1116,11 @@ class AgentActivity(RecognitionHooks):
             self._session._conversation_item_added(msg)
 
         self._session.emit("agent_stopped_speaking", AgentStoppedSpeakingEvent())
-        log_event("playout completed", speech_id=speech_handle.id)
+        log_event(
+            "playout completed",
+            speech_id=speech_handle.id,
+            time_to_first_audio=speech_handle.time_to_first_audio,
+        )
 
         speech_handle._mark_playout_done()  # mark the playout done before waiting for the tool execution  # noqa: E501
 
@@ -1164,6 +1215,88 @@ class AgentActivity(RecognitionHooks):
                 # add the tool calls and outputs to the chat context even no reply is generated
                 self._agent._chat_ctx.items.extend(new_calls)
                 self._agent._chat_ctx.items.extend(new_fnc_outputs)
+                self._apply_background_tool_outputs()
+
+    async def _cancel_background_tools(self) -> None:
+        self._background_tools_closed = True
+        self._background_tool_outputs.clear()
+        await utils.aio.cancel_and_wait(*self._background_tool_tasks)
+
+    def _on_background_tool_output(self, py_out: _PythonOutput) -> None:
+        # the follow-up LLM step received a placeholder, it is replaced by the output
+        if self._background_tools_closed:
+            logger.debug(
+                "ignoring the output of a non-blocking tool completed after the agent was drained",
+                extra={"function": py_out.fnc_call.name},
+            )
+            return
+
+        sanitized_out = py_out.sanitize()
+        if sanitized_out.agent_task is not None:
+            logger.error(
+                "non-blocking tools can't return an AgentTask, ignoring it",
+                extra={"function": sanitized_out.fnc_call.name},
+            )
+
+        fnc_executed_ev = FunctionToolsExecutedEvent(
+            function_calls=[],
+            function_call_outputs=[],
+        )
+        fnc_executed_ev.function_calls.append(sanitized_out.fnc_call)
+        if sanitized_out.fnc_call_out is not None:
+            fnc_executed_ev.function_call_outputs.append(sanitized_out.fnc_call_out)
+
+        self._session.emit("function_tools_executed", fnc_executed_ev)
+
+        if sanitized_out.fnc_call_out is None:
+            # StopResponse, the placeholder is kept and no reply is generated
+            return
+
+        self._background_tool_outputs[sanitized_out.fnc_call.call_id] = sanitized_out
+        self._apply_background_tool_outputs()
+
+    def _apply_background_tool_outputs(self) -> None:
+        """replace the placeholders added to the chat_ctx by the outputs of the completed tools,
+        the placeholder is added by the follow-up step and can come after the output"""
+        if not self._background_tool_outputs:
+            return
+
+        generate_reply = False
+        for item in self._agent._chat_ctx.items:
+            if item.type != "function_call_output":
+                continue
+
+            sanitized_out = self._background_tool_outputs.pop(item.call_id, None)
+            if sanitized_out is None:
+                continue
+
+            assert sanitized_out.fnc_call_out is not None
+            item.output = sanitized_out.fnc_call_out.output
+            item.is_error = sanitized_out.fnc_call_out.is_error
+            generate_reply = generate_reply or sanitized_out.reply_required
+
+        if not generate_reply or self.draining:
+            return
+
+        # let the LLM use the output
+        handle = SpeechHandle.create(allow_interruptions=self.allow_interruptions)
+        self._session.emit(
+            "speech_created",
+            SpeechCreatedEvent(speech_handle=handle, user_initiated=False, source="tool_response"),
+        )
+        self._create_speech_task(
+            self._pipeline_reply_task(
+                speech_handle=handle,
+                chat_ctx=self._agent._chat_ctx,
+                tools=self._agent.tools,
+                model_settings=ModelSettings(
+                    tool_choice=self._tool_choice if self._tool_choice is not None else NOT_GIVEN
+                ),
+            ),
+            owned_speech_handle=handle,
+            name="AgentActivity.pipeline_reply",
+        )
+        self._schedule_speech(handle, SpeechHandle.SPEECH_PRIORITY_NORMAL)
 
     @utils.log_exceptions(logger=logger)
     async def _realtime_reply_task(
@@ -1220,6 +1353,7 @@ class AgentActivity(RecognitionHooks):
         model_settings: ModelSettings,
     ) -> None:
         _SpeechHandleContextVar.set(speech_handle)
+        speech_handle._mark_generation_started()
 
         assert self._rt_session is not None, "rt_session is not available"
 
@@ -1275,9 +1409,13 @@ class AgentActivity(RecognitionHooks):
                             tts_output=self._agent.realtime_audio_output_node(
                                 msg.audio_stream, model_settings
                             ),
+                            span=speech_handle.span,
                         )
                         forward_tasks.append(forward_task)
                         audio_out.first_frame_fut.add_done_callback(_on_first_frame)
+                        audio_out.first_frame_fut.add_done_callback(
+                            lambda _: speech_handle._mark_first_audio()
+                        )
                     else:
                         text_out.first_text_fut.add_done_callback(_on_first_frame)
 
@@ -8,7 +8,7 @@ from typing import Generic, Literal, TypeVar, Union
 
 from livekit import rtc
 
-from .. import debug, llm, stt, tts, utils, vad
+from .. import debug, llm, stt, tokenize, tts, utils, vad
 from ..cli import cli
 from ..llm import ChatContext
 from ..log import logger
@@ -35,6 +35,8 @@ class VoiceOptions:
     min_endpointing_delay: float
     max_endpointing_delay: float
     max_tool_steps: int
+    tts_early_flush: tokenize.EarlyFlushOptions | None
+    stt_audio_gate: stt.AudioGateOptions | None
 
 
 Userdata_T = TypeVar("Userdata_T")
@@ -70,6 +72,8 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
         min_endpointing_delay: float = 0.5,
         max_endpointing_delay: float = 6.0,
         max_tool_steps: int = 3,
+        tts_early_flush: tokenize.EarlyFlushOptions | None = None,
+        stt_audio_gate: stt.AudioGateOptions | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
         super().__init__()
@@ -83,6 +87,8 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
             min_endpointing_delay=min_endpointing_delay,
             max_endpointing_delay=max_endpointing_delay,
             max_tool_steps=max_tool_steps,
+            tts_early_flush=tts_early_flush,
+            stt_audio_gate=stt_audio_gate,
         )
         self._started = False
         self._turn_detection = turn_detection or None
@@ -198,6 +204,16 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
             self._agent = agent
             self._update_agent_state(AgentState.INITIALIZING)
 
+            tts_service = agent.tts or self._tts
+            if tts_service is not None:
+                # request the output format that is the cheapest to decode
+                tts_service.negotiate_encoding()
+
+            # connect to the STT and TTS services while the room is being joined
+            for service in (agent.stt or self._stt, tts_service):
+                if service is not None:
+                    service.prewarm()
+
             if cli.CLI_ARGUMENTS is not None and cli.CLI_ARGUMENTS.console:
                 from .chat_cli import ChatCLI
 
@@ -305,7 +321,8 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
         await self._aclose_impl()
 
     def emit(self, event: EventTypes, ev: AgentEvent) -> None:  # type: ignore
-        debug.Tracing.log_event(f'agent.on("{event}")', ev.model_dump())
+        if debug.Tracing.enabled():
+            debug.Tracing.log_event(f'agent.on("{event}")', ev.model_dump())
         return super().emit(event, ev)
 
     def update_options(self) -> None:
@@ -4,7 +4,7 @@ import asyncio
 import time
 from collections.abc import AsyncIterable
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Callable, Protocol
 
 from livekit import rtc
 
@@ -23,6 +23,9 @@ class _EndOfTurnInfo:
     end_of_utterance_delay: float
 
 
+_VADListener = Callable[[vad.VADEvent], None]
+
+
 class _TurnDetector(Protocol):
     # TODO: Move those two functions to EOU ctor (capabilities dataclass)
     def unlikely_threshold(self, language: str | None) -> float: ...
@@ -53,6 +56,7 @@ class AudioRecognition:
         min_endpointing_delay: float,
         max_endpointing_delay: float,
         manual_turn_detection: bool,
+        stt_sample_rate: int | None = None,
     ) -> None:
         self._hooks = hooks
         self._audio_input_atask: asyncio.Task[None] | None = None
@@ -63,6 +67,7 @@ class AudioRecognition:
         self._max_endpointing_delay = max_endpointing_delay
         self._turn_detector = turn_detector
         self._stt = stt
+        self._stt_sample_rate = stt_sample_rate
         self._vad = vad
         self._manual_turn_detection = manual_turn_detection
 
@@ -81,8 +86,12 @@ class AudioRecognition:
             max_data_points=int(30 * 30),
         )
 
+        # the audio is resampled once for the STT and the VAD when they use the same sample rate
+        self._audio_fanout = utils.audio.AudioFanout()
         self._stt_ch: aio.Chan[rtc.AudioFrame] | None = None
         self._vad_ch: aio.Chan[rtc.AudioFrame] | None = None
+        # e.g. the STT audio gates, they reuse the VAD running on the same audio
+        self._vad_listeners: set[_VADListener] = set()
 
     def start(self) -> None:
         self.update_stt(self._stt)
@@ -93,13 +102,11 @@ class AudioRecognition:
         self.update_vad(None)
 
     def push_audio(self, frame: rtc.AudioFrame) -> None:
-        if self._stt_ch is not None:
-            self._stt_ch.send_nowait(frame)
-
-        if self._vad_ch is not None:
-            self._vad_ch.send_nowait(frame)
+        self._audio_fanout.push(frame)
 
     async def aclose(self) -> None:
+        self._audio_fanout.close()
+
         if self._stt_atask is not None:
             await aio.cancel_and_wait(self._stt_atask)
 
@@ -111,27 +118,39 @@ class AudioRecognition:
 
     def update_stt(self, stt: io.STTNode | None) -> None:
         self._stt = stt
+        if self._stt_ch is not None:
+            self._audio_fanout.unsubscribe(self._stt_ch)
+            self._stt_ch = None
+
         if stt:
-            self._stt_ch = aio.Chan[rtc.AudioFrame]()
+            self._stt_ch = self._audio_fanout.subscribe(self._stt_sample_rate)
             self._stt_atask = asyncio.create_task(
                 self._stt_task(stt, self._stt_ch, self._stt_atask)
             )
         elif self._stt_atask is not None:
             self._stt_atask.cancel()
             self._stt_atask = None
-            self._stt_ch = None
 
     def update_vad(self, vad: vad.VAD | None) -> None:
         self._vad = vad
+        if self._vad_ch is not None:
+            self._audio_fanout.unsubscribe(self._vad_ch)
+            self._vad_ch = None
+
         if vad:
-            self._vad_ch = aio.Chan[rtc.AudioFrame]()
+            self._vad_ch = self._audio_fanout.subscribe(vad.sample_rate)
             self._vad_atask = asyncio.create_task(
                 self._vad_task(vad, self._vad_ch, self._vad_atask)
             )
         elif self._vad_atask is not None:
             self._vad_atask.cancel()
             self._vad_atask = None
-            self._vad_ch = None
+
+    def add_vad_listener(self, listener: _VADListener) -> None:
+        self._vad_listeners.add(listener)
+
+    def remove_vad_listener(self, listener: _VADListener) -> None:
+        self._vad_listeners.discard(listener)
 
     def clear_user_turn(self) -> None:
         self._audio_transcript = ""
@@ -191,6 +210,9 @@ class AudioRecognition:
             self._audio_interim_transcript = ev.alternatives[0].text
 
     async def _on_vad_event(self, ev: vad.VADEvent) -> None:
+        for listener in self._vad_listeners:
+            listener(ev)
+
         if ev.type == vad.VADEventType.START_OF_SPEECH:
             self._hooks.on_start_of_speech(ev)
             self._speaking = True
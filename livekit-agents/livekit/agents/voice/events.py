@@ -141,6 +141,7 @@ AgentEvent = Union[
     MetricsCollectedEvent,
     ConversationItemAddedEvent,
     SpeechCreatedEvent,
+    FunctionToolsExecutedEvent,
     ErrorEvent,
     CloseEvent,
 ]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from collections.abc import AsyncIterable
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Callable, Protocol, runtime_checkable
 
 from pydantic import ValidationError
 
@@ -18,7 +19,9 @@ from ..llm import (
     ToolError,
     utils as llm_utils,
 )
+from ..llm.tool_context import get_function_info
 from ..log import logger
+from ..metrics import ToolMetrics
 from ..types import NotGivenOr
 from ..utils import aio
 from . import io
@@ -49,11 +52,17 @@ def perform_llm_inference(
     chat_ctx: ChatContext,
     tool_ctx: ToolContext | None,
     model_settings: ModelSettings,
+    span: debug.spans.Span | None = None,
 ) -> tuple[asyncio.Task, _LLMGenerationData]:
     text_ch = aio.Chan()
     function_ch = aio.Chan()
 
     data = _LLMGenerationData(text_ch=text_ch, function_ch=function_ch)
+    llm_span = span.start_child("llm_inference") if span is not None else None
+
+    def _mark_first_token() -> None:
+        if llm_span is not None and not llm_span.events:
+            llm_span.add_event("first_token")
 
     @utils.log_exceptions(logger=logger)
     async def _inference_task():
@@ -66,6 +75,7 @@ def perform_llm_inference(
             llm_node = await llm_node
 
         if isinstance(llm_node, str):
+            _mark_first_token()
             data.generated_text = llm_node
             text_ch.send_nowait(llm_node)
             return True
@@ -76,6 +86,7 @@ def perform_llm_inference(
                 async for chunk in llm_node:
                     # io.LLMNode can either return a string or a ChatChunk
                     if isinstance(chunk, str):
+                        _mark_first_token()
                         data.generated_text += chunk
                         text_ch.send_nowait(chunk)
 
@@ -88,6 +99,7 @@ def perform_llm_inference(
                                 if tool.type != "function":
                                     continue
 
+                                _mark_first_token()
                                 fnc_call = llm.FunctionCall(
                                     id=f"{data.id}/fnc_{len(data.generated_functions)}",
                                     call_id=tool.call_id,
@@ -98,6 +110,7 @@ def perform_llm_inference(
                                 function_ch.send_nowait(fnc_call)
 
                         if chunk.delta.content:
+                            _mark_first_token()
                             data.generated_text += chunk.delta.content
                             text_ch.send_nowait(chunk.delta.content)
                     else:
@@ -115,6 +128,9 @@ def perform_llm_inference(
     llm_task = asyncio.create_task(_inference_task())
     llm_task.add_done_callback(lambda _: text_ch.close())
     llm_task.add_done_callback(lambda _: function_ch.close())
+    if llm_span is not None:
+        llm_task.add_done_callback(lambda _: llm_span.end())
+
     return llm_task, data
 
 
@@ -124,9 +140,14 @@ class _TTSGenerationData:
 
 
 def perform_tts_inference(
-    *, node: io.TTSNode, input: AsyncIterable[str], model_settings: ModelSettings
+    *,
+    node: io.TTSNode,
+    input: AsyncIterable[str],
+    model_settings: ModelSettings,
+    span: debug.spans.Span | None = None,
 ) -> tuple[asyncio.Task, _TTSGenerationData]:
     audio_ch = aio.Chan[rtc.AudioFrame]()
+    tts_span = span.start_child("tts_inference") if span is not None else None
 
     @utils.log_exceptions(logger=logger)
     async def _inference_task():
@@ -136,6 +157,9 @@ def perform_tts_inference(
 
         if isinstance(tts_node, AsyncIterable):
             async for audio_frame in tts_node:
+                if tts_span is not None and not tts_span.events:
+                    tts_span.add_event("first_audio")
+
                 audio_ch.send_nowait(audio_frame)
 
             return True
@@ -144,6 +168,8 @@ def perform_tts_inference(
 
     tts_task = asyncio.create_task(_inference_task())
     tts_task.add_done_callback(lambda _: audio_ch.close())
+    if tts_span is not None:
+        tts_task.add_done_callback(lambda _: tts_span.end())
 
     return tts_task, _TTSGenerationData(audio_ch=audio_ch)
 
@@ -194,9 +220,14 @@ def perform_audio_forwarding(
     *,
     audio_output: io.AudioOutput,
     tts_output: AsyncIterable[rtc.AudioFrame],
+    span: debug.spans.Span | None = None,
 ) -> tuple[asyncio.Task, _AudioOutput]:
     out = _AudioOutput(audio=[], first_frame_fut=asyncio.Future())
-    task = asyncio.create_task(_audio_forwarding_task(audio_output, tts_output, out))
+    forward_span = span.start_child("audio_forwarding") if span is not None else None
+    task = asyncio.create_task(_audio_forwarding_task(audio_output, tts_output, out, forward_span))
+    if forward_span is not None:
+        task.add_done_callback(lambda _: forward_span.end())
+
     return task, out
 
 
@@ -205,7 +236,10 @@ async def _audio_forwarding_task(
     audio_output: io.AudioOutput,
     tts_output: AsyncIterable[rtc.AudioFrame],
     out: _AudioOutput,
+    span: debug.spans.Span | None,
 ) -> None:
+    # the audio outputs add the events of the frames they publish to this span
+    debug.spans.set_current_span(span)
     resampler: rtc.AudioResampler | None = None
     try:
         async for frame in tts_output:
@@ -242,10 +276,15 @@ async def _audio_forwarding_task(
         audio_output.flush()
 
 
+# output given to the follow-up LLM step while a non-blocking tool is running
+BACKGROUND_TOOL_OUTPUT = "The tool is running in the background, its result will follow."
+
+
 @dataclass
 class _ToolOutput:
     output: list[_PythonOutput]
     first_tool_fut: asyncio.Future
+    background_tasks: set[asyncio.Task[Any]] = field(default_factory=set)
 
 
 def perform_tool_executions(
@@ -255,8 +294,22 @@ def perform_tool_executions(
     tool_ctx: ToolContext,
     tool_choice: NotGivenOr[llm.ToolChoice],
     function_stream: AsyncIterable[llm.FunctionCall],
+    on_background_output: Callable[[_PythonOutput], None] | None = None,
+    background_tasks: set[asyncio.Task[Any]] | None = None,
 ) -> tuple[asyncio.Task, _ToolOutput]:
-    tool_output = _ToolOutput(output=[], first_tool_fut=asyncio.Future())
+    """
+    Args:
+        on_background_output: called when a non-blocking tool completes. Until then, the
+            tool output is BACKGROUND_TOOL_OUTPUT. If None, non-blocking tools are awaited like
+            the other ones.
+        background_tasks: the tasks of the running non-blocking tools are added to this set,
+            so the caller can cancel them.
+    """
+    tool_output = _ToolOutput(
+        output=[],
+        first_tool_fut=asyncio.Future(),
+        background_tasks=background_tasks if background_tasks is not None else set(),
+    )
     task = asyncio.create_task(
         _execute_tools_task(
             session=session,
@@ -265,6 +318,7 @@ def perform_tool_executions(
             tool_choice=tool_choice,
             function_stream=function_stream,
             tool_output=tool_output,
+            on_background_output=on_background_output,
         ),
         name="execute_tools_task",
     )
@@ -280,11 +334,17 @@ async def _execute_tools_task(
     tool_choice: NotGivenOr[llm.ToolChoice],
     function_stream: AsyncIterable[llm.FunctionCall],
     tool_output: _ToolOutput,
+    on_background_output: Callable[[_PythonOutput], None] | None,
 ) -> None:
-    """execute tools, when cancelled, stop executing new tools but wait for the pending ones"""
+    """execute tools, when cancelled, stop executing new tools but wait for the pending ones
+    (non-blocking tools aren't waited for, they keep running in the background and output a
+    placeholder)"""
 
     from .agent import _authorize_inline_task
-    from .events import RunContext
+    from .events import MetricsCollectedEvent, RunContext
+
+    def _on_tool_metrics(metrics: ToolMetrics) -> None:
+        session.emit("metrics_collected", MetricsCollectedEvent(metrics=metrics))
 
     tasks: list[asyncio.Task] = []
     try:
@@ -354,12 +414,58 @@ async def _execute_tools_task(
             )
 
             task = asyncio.create_task(
-                function_tool(*fnc_args, **fnc_kwargs),
+                tool_ctx.executor.execute(
+                    function_tool,
+                    fnc_args,
+                    fnc_kwargs,
+                    speech_id=speech_handle.id,
+                    on_metrics=_on_tool_metrics,
+                ),
                 name=f"function_tool_{fnc_call.name}",
             )
-            tasks.append(task)
             _authorize_inline_task(task, function_call=fnc_call)
 
+            if not get_function_info(function_tool).blocking and on_background_output is not None:
+
+                def _on_background_done(
+                    task: asyncio.Task[Any],
+                    *,
+                    py_out: _PythonOutput,
+                    on_output: Callable[[_PythonOutput], None],
+                ) -> None:
+                    if task.cancelled():
+                        return
+
+                    if task.exception() is not None:
+                        logger.error(
+                            "exception occurred while executing non-blocking tool",
+                            extra={
+                                "function": py_out.fnc_call.name,
+                                "speech_id": speech_handle.id,
+                            },
+                            exc_info=task.exception(),
+                        )
+                        py_out.exception = task.exception()
+                    else:
+                        py_out.output = task.result()
+
+                    on_output(py_out)
+
+                tool_output.background_tasks.add(task)
+                task.add_done_callback(tool_output.background_tasks.discard)
+                task.add_done_callback(
+                    functools.partial(
+                        _on_background_done, py_out=py_out, on_output=on_background_output
+                    )
+                )
+                # the follow-up LLM step knows the tool was called and doesn't call it again
+                tool_output.output.append(
+                    _PythonOutput(fnc_call=fnc_call, output=BACKGROUND_TOOL_OUTPUT, exception=None)
+                )
+                continue
+
+            tasks.append(task)
+
             def _log_exceptions(
                 task: asyncio.Task,
                 *,
@@ -4,7 +4,7 @@ import asyncio
 
 from livekit import rtc
 
-from ... import utils
+from ... import debug, utils
 from ...log import logger
 from ...types import (
     ATTRIBUTE_TRANSCRIPTION_FINAL,
@@ -64,9 +64,13 @@ class _ParticipantAudioOutput(io.AudioOutput):
             logger.error("capture_frame called while flush is in progress")
             await self._flush_task
 
+        first_frame = not self._pushed_duration
         self._pushed_duration += frame.duration
         await self._audio_source.capture_frame(frame)
 
+        if first_frame and (span := debug.spans.current_span()) is not None:
+            span.add_event("first_frame_published")
+
     def flush(self) -> None:
         super().flush()
 
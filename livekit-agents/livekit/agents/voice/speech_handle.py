@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from typing import Callable
 
 from .. import utils
+from ..debug import spans
 
 
 class SpeechHandle:
@@ -30,6 +32,18 @@ class SpeechHandle:
         self._authorize_fut = asyncio.Future()
         self._playout_done_fut = asyncio.Future()
         self._parent = parent
+        self._generation_started_at: float | None = None
+        self._first_audio_at: float | None = None
+        self._span: spans.Span = spans.Span(
+            "speech",
+            trace_id=parent.span.trace_id if parent else None,
+            attributes={
+                "speech_id": speech_id,
+                "step_index": step_index,
+                "parent_speech_id": parent.id if parent else None,
+            },
+        )
+        self._playout_span: spans.Span | None = None
 
     @staticmethod
     def create(
@@ -68,6 +82,25 @@ class SpeechHandle:
         """  # noqa: E501
         return self._parent
 
+    @property
+    def span(self) -> spans.Span:
+        """
+        Root of the span tree timing the stages of this speech, from the end of the user speech
+        (when the speech replies to a user turn) to the end of the playout.
+        """
+        return self._span
+
+    @property
+    def time_to_first_audio(self) -> float | None:
+        """
+        Seconds between the start of the generation and the first audio frame being
+        pushed to the audio output, None if no audio was played yet.
+        """
+        if self._generation_started_at is None or self._first_audio_at is None:
+            return None
+
+        return self._first_audio_at - self._generation_started_at
+
     def done(self) -> bool:
         return self._playout_done_fut.done()
 
@@ -116,7 +149,25 @@ class SpeechHandle:
     async def _wait_for_authorization(self) -> None:
         await asyncio.shield(self._authorize_fut)
 
+    def _mark_generation_started(self) -> None:
+        if self._generation_started_at is None:
+            self._generation_started_at = time.perf_counter()
+            self._span.add_event("generation_started", timestamp=self._generation_started_at)
+
+    def _mark_first_audio(self) -> None:
+        if self._first_audio_at is None:
+            self._first_audio_at = time.perf_counter()
+            self._playout_span = self._span.start_child("playout", start_time=self._first_audio_at)
+
     def _mark_playout_done(self) -> None:
+        if self._span.end_time is None:
+            now = time.perf_counter()
+            if self._playout_span is not None:
+                self._playout_span.end(end_time=now)
+
+            self._span.set_attribute("interrupted", self.interrupted)
+            self._span.end(end_time=now)
+
         with contextlib.suppress(asyncio.InvalidStateError):
             # will raise InvalidStateError if the future is already done (interrupted)
             self._playout_done_fut.set_result(None)
@@ -19,6 +19,7 @@ from .. import io
 from ._speaking_rate import SpeakingRateDetector, SpeakingRateStream
 
 STANDARD_SPEECH_RATE = 3.83  # hyphens (syllables) per second
+HYPHEN_CACHE_SIZE = 4096  # words
 
 
 @dataclass
@@ -28,6 +29,13 @@ class _TextSyncOptions:
     split_words: Callable[[str], list[tuple[str, int, int]]]
     sentence_tokenizer: tokenize.SentenceTokenizer
     speaking_rate_detector: SpeakingRateDetector
+    count_hyphens: Callable[[str], int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # transcripts repeat the same words a lot, only the count is needed by the synchronizer
+        self.count_hyphens = functools.lru_cache(maxsize=HYPHEN_CACHE_SIZE)(
+            lambda word: len(self.hyphenate_word(word))
+        )
 
 
 @dataclass
@@ -58,7 +66,7 @@ class _SpeakingRateData:
         text: str,
         start_time: float | None,
         end_time: float | None,
-        text_to_hyphens: Callable[[str], list[str]],
+        count_hyphens: Callable[[str], int],
     ) -> None:
         if start_time is not None:
             # calculate the integral of the speaking rate up to the start time
@@ -66,7 +74,7 @@ class _SpeakingRateData:
 
             dt = start_time - self.pushed_duration
             full_text = "".join(self._text_buffer)
-            d_hyphens = len(text_to_hyphens(full_text))
+            d_hyphens = count_hyphens(full_text)
             integral += d_hyphens
             rate = d_hyphens / dt if dt > 0 else 0
 
@@ -79,7 +87,7 @@ class _SpeakingRateData:
 
         if end_time is not None:
             self.add_by_annotation(
-                "", start_time=end_time, end_time=None, text_to_hyphens=text_to_hyphens
+                "", start_time=end_time, end_time=None, count_hyphens=count_hyphens
             )
 
     def accumulate_to(self, timestamp: float) -> float:
@@ -125,7 +133,10 @@ class _AudioData:
 @dataclass
 class _TextData:
     sentence_stream: tokenize.SentenceStream
-    pushed_text: str = ""
+    pushed_hyphens: int = 0
+    """hyphens of the pushed words, excluding `pending_text`"""
+    pending_text: str = ""
+    """pushed text whose last word may still be continued by the next push"""
     done: bool = False
     forwarded_hyphens: int = 0
 
@@ -204,11 +215,11 @@ class _SegmentSynchronizerImpl:
                 text=text,
                 start_time=start_time,
                 end_time=end_time,
-                text_to_hyphens=self._calc_hyphens,
+                count_hyphens=self._count_hyphens,
             )
 
         self._text_data.sentence_stream.push_text(text)
-        self._text_data.pushed_text += text
+        self._push_hyphens(text)
 
         if start_time is not None or end_time is not None:
             self._text_data.sentence_stream.flush()
@@ -220,6 +231,8 @@ class _SegmentSynchronizerImpl:
 
         self._text_data.done = True
         self._text_data.sentence_stream.end_input()
+        self._text_data.pushed_hyphens += self._count_hyphens(self._text_data.pending_text)
+        self._text_data.pending_text = ""
 
         self._reestimate_speed()
 
@@ -227,7 +240,7 @@ class _SegmentSynchronizerImpl:
         if not self._text_data.done or not self._audio_data.done:
             return
 
-        pushed_hyphens = len(self._calc_hyphens(self._text_data.pushed_text))
+        pushed_hyphens = self._text_data.pushed_hyphens
         # hyphens per second
         if self._audio_data.pushed_duration > 0:
             self._speed = pushed_hyphens / self._audio_data.pushed_duration
@@ -291,7 +304,7 @@ class _SegmentSynchronizerImpl:
                     text_cursor = end_pos
                     continue
 
-                word_hyphens = len(self._opts.hyphenate_word(word))
+                word_hyphens = self._opts.count_hyphens(word)
                 elapsed = time.time() - self._start_wall_time
 
                 target_hyphens: float | None = None
@@ -324,14 +337,27 @@ class _SegmentSynchronizerImpl:
                 # send the remaining text (e.g. new line or spaces)
                 self._out_ch.send_nowait(sentence[text_cursor:])
 
-    def _calc_hyphens(self, text: str) -> list[str]:
-        """Calculate hyphens for text."""
-        hyphens: list[str] = []
-        words: list[tuple[str, int, int]] = self._opts.split_words(text=text)
-        for word, _, _ in words:
-            new = self._opts.hyphenate_word(word)
-            hyphens.extend(new)
-        return hyphens
+    def _count_hyphens(self, text: str) -> int:
+        """Count the hyphens of text."""
+        return sum(self._opts.count_hyphens(word) for word, _, _ in self._opts.split_words(text))
+
+    def _push_hyphens(self, text: str) -> None:
+        """Add the hyphens of the newly pushed text to the running total.
+
+        Only the words that can't be continued anymore are counted, so the whole pushed text
+        doesn't need to be hyphenated again when re-estimating the speed.
+        """
+        pending = self._text_data.pending_text + text
+        words = self._opts.split_words(pending)
+        if words and words[-1][2] == len(pending):
+            # the last word may be continued by the next push
+            cut = words[-1][1]
+            words = words[:-1]
+        else:
+            cut = words[-1][2] if words else 0
+
+        self._text_data.pushed_hyphens += sum(self._opts.count_hyphens(w) for w, _, _ in words)
+        self._text_data.pending_text = pending[cut:]
 
     async def _sleep_if_not_closed(self, delay: float) -> None:
         with contextlib.suppress(asyncio.TimeoutError):
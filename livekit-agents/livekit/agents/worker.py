@@ -34,6 +34,7 @@ from urllib.parse import urljoin, urlparse
 
 import aiohttp
 import jwt
+import psutil
 from aiohttp import web
 
 from livekit import api, rtc
@@ -52,12 +53,13 @@ from .job import (
     RunningJobInfo,
 )
 from .log import DEV_LEVEL, logger
-from .utils.hw import get_cpu_monitor
+from .utils.hw import get_cpu_monitor, memory_limit, process_tree_pss
 from .version import __version__
 
 ASSIGNMENT_TIMEOUT = 7.5
 UPDATE_STATUS_INTERVAL = 2.5
 UPDATE_LOAD_INTERVAL = 0.5
+UPDATE_MEMORY_INTERVAL = 2.5
 
 
 def _default_initialize_process_fnc(proc: JobProcess) -> Any:
@@ -79,12 +81,34 @@ class SimulateJobInfo:
     participant_identity: str | None = None
 
 
+@dataclass
+class WorkerLoadOptions:
+    """Signals combined by the default ``load_fnc``, each signal is a usage between 0 and 1.
+
+    The load of the worker is the highest weighted signal, so a single exhausted resource marks
+    the worker as full. A weight of 0 ignores the signal."""
+
+    cpu_weight: float = 1.0
+    """CPU usage of the machine, or of the cgroup when running in a container"""
+    memory_weight: float = 1.0
+    """PSS of the worker and of its job processes over the memory limit"""
+    loop_lag_weight: float = 1.0
+    """p99 event loop lag of the most lagging job over ``max_loop_lag``"""
+    inference_weight: float = 1.0
+    """requests pending on the inference process over ``max_pending_inferences``"""
+    max_loop_lag: float = 0.5
+    """event loop lag (in seconds) of a job considered as a full load"""
+    max_pending_inferences: int = 16
+    """pending inference requests considered as a full load"""
+
+
 class _DefaultLoadCalc:
     _instance = None
 
     def __init__(self) -> None:
         self._m_avg = utils.MovingAverage(5)  # avg over 2.5
         self._cpu_monitor = get_cpu_monitor()
+        self._memory_usage = 0.0
         self._thread = threading.Thread(
             target=self._calc_load, daemon=True, name="worker_cpu_load_monitor"
         )
@@ -92,21 +116,73 @@ class _DefaultLoadCalc:
         self._thread.start()
 
     def _calc_load(self) -> None:
+        last_memory_check = 0.0
         while True:
             cpu_p = self._cpu_monitor.cpu_percent(interval=0.5)
             with self._lock:
                 self._m_avg.add_sample(cpu_p)
 
+            # reading the PSS of every process is slower, sample it less often
+            if time.monotonic() - last_memory_check < UPDATE_MEMORY_INTERVAL:
+                continue
+
+            last_memory_check = time.monotonic()
+            try:
+                memory_usage = process_tree_pss() / memory_limit()
+            except psutil.Error:
+                continue
+
+            with self._lock:
+                self._memory_usage = min(memory_usage, 1.0)
+
     def _get_avg(self) -> float:
         with self._lock:
             return self._m_avg.get_avg()
 
+    def _get_memory_usage(self) -> float:
+        with self._lock:
+            return self._memory_usage
+
     @classmethod
-    def get_load(cls, worker: Worker) -> float:
+    def get_signals(cls, worker: Worker) -> dict[str, float]:
+        """usage of each resource between 0 and 1"""
         if cls._instance is None:
             cls._instance = _DefaultLoadCalc()
 
-        return cls._instance._m_avg.get_avg()
+        opts = worker._opts.load_options
+        loop_lag = max(
+            (
+                proc.stats.loop_lag_p99
+                for proc in worker._proc_pool.processes
+                if proc.running_job and proc.stats
+            ),
+            default=0.0,
+        )
+        pending_inferences = 0
+        if worker._inference_executor is not None:
+            pending_inferences = worker._inference_executor.pending_requests
+
+        return {
+            "cpu": cls._instance._get_avg(),
+            "memory": cls._instance._get_memory_usage(),
+            "loop_lag": min(loop_lag / opts.max_loop_lag, 1.0),
+            "inference": min(pending_inferences / opts.max_pending_inferences, 1.0),
+        }
+
+    @staticmethod
+    def get_weights(worker: Worker) -> dict[str, float]:
+        opts = worker._opts.load_options
+        return {
+            "cpu": opts.cpu_weight,
+            "memory": opts.memory_weight,
+            "loop_lag": opts.loop_lag_weight,
+            "inference": opts.inference_weight,
+        }
+
+    @classmethod
+    def get_load(cls, worker: Worker) -> float:
+        signals, weights = cls.get_signals(worker), cls.get_weights(worker)
+        return max(signals[name] * weights[name] for name in signals)
 
 
 @dataclass
@@ -154,6 +230,8 @@ class WorkerOptions:
     """A function to perform any necessary initialization before the job starts."""
     load_fnc: Callable[[Worker], float] | Callable[[], float] = _DefaultLoadCalc.get_load
     """Called to determine the current load of the worker. Should return a value between 0 and 1."""
+    load_options: WorkerLoadOptions = field(default_factory=WorkerLoadOptions)
+    """Weights of the signals combined by the default ``load_fnc``."""
     job_executor_type: JobExecutorType = _default_job_executor_type
     """Which executor to use to run jobs. (currently thread or process are supported)"""
     load_threshold: float | _WorkerEnvOption[float] = _WorkerEnvOption(
@@ -170,6 +248,11 @@ class WorkerOptions:
     """Maximum memory usage for a job in MB, the job process will be killed if it exceeds this limit.
     Defaults to 0 (disabled).
     """  # noqa: E501
+    stall_profiler_threshold: float = 0.0
+    """Sample the stack of the job event loop when it is stalled for more than this many seconds.
+    The samples are served as collapsed stacks (flame graph input) on /debug/runner/stalls/.
+    Defaults to 0 (disabled).
+    """
 
     """Number of idle processes to keep warm."""
     num_idle_processes: int | _WorkerEnvOption[int] = _WorkerEnvOption(
@@ -297,6 +380,7 @@ class Worker(utils.EventEmitter[EventTypes]):
             close_timeout=opts.shutdown_process_timeout,
             memory_warn_mb=opts.job_memory_warn_mb,
             memory_limit_mb=opts.job_memory_limit_mb,
+            stall_profiler_threshold=opts.stall_profiler_threshold,
         )
 
         self._previous_status = agent.WorkerStatus.WS_AVAILABLE
@@ -45,6 +45,9 @@ from .log import logger
 ENGLISH = "en"
 DEFAULT_ENCODING = "pcm_s16le"
 
+# a prewarmed connection is replaced if it isn't used before this duration
+_MAX_IDLE_DURATION = 20.0
+
 # Define bytes per frame for different encoding types
 bytes_per_frame = {
     "pcm_s16le": 2,
@@ -107,6 +110,11 @@ class STT(stt.STT):
         )
         self._session = http_session
         self._streams = weakref.WeakSet[SpeechStream]()
+        self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
+            connect_cb=self._connect_ws,
+            close_cb=self._close_ws,
+            max_session_duration=_MAX_IDLE_DURATION,
+        )
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -114,6 +122,28 @@ class STT(stt.STT):
             self._session = utils.http_context.http_session()
         return self._session
 
+    async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
+        return await _connect_realtime_ws(
+            self.session,
+            self._opts,
+            api_key=self._api_key,
+            timeout=DEFAULT_API_CONNECT_OPTIONS.timeout,
+        )
+
+    async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        await ws.close()
+
+    def prewarm(self) -> None:
+        self._pool.prewarm()
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+        await super().aclose()
+
+    @property
+    def sample_rate(self) -> int:
+        return self._opts.sample_rate
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
@@ -136,6 +166,7 @@ class STT(stt.STT):
             opts=config,
             api_key=self._api_key,
             http_session=self.session,
+            pool=self._pool,
         )
         self._streams.add(stream)
         return stream
@@ -160,6 +191,9 @@ class STT(stt.STT):
         if is_given(buffer_size_seconds):
             self._opts.buffer_size_seconds = buffer_size_seconds
 
+        # the prewarmed connections use the previous options
+        self._pool.invalidate()
+
         for stream in self._streams:
             stream.update_options(
                 disable_partial_transcripts=disable_partial_transcripts,
@@ -182,12 +216,14 @@ class SpeechStream(stt.SpeechStream):
         conn_options: APIConnectOptions,
         api_key: str,
         http_session: aiohttp.ClientSession,
+        pool: utils.ConnectionPool[aiohttp.ClientWebSocketResponse],
     ) -> None:
         super().__init__(stt=stt, conn_options=conn_options, sample_rate=opts.sample_rate)
 
         self._opts = opts
         self._api_key = api_key
         self._session = http_session
+        self._pool = pool
         self._speech_duration: float = 0
 
         # keep a list of final transcripts to combine them inside the END_OF_SPEECH event
@@ -320,29 +356,26 @@ class SpeechStream(stt.SpeechStream):
                     await utils.aio.gracefully_cancel(*tasks, wait_reconnect_task)
             finally:
                 if ws is not None:
+                    # a realtime session can't be reused once terminated
+                    self._pool.remove(ws)
                     await ws.close()
 
     async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
-        live_config = {
-            "sample_rate": self._opts.sample_rate,
-            "word_boost": json.dumps(self._opts.word_boost)
-            if is_given(self._opts.word_boost)
-            else None,
-            "encoding": self._opts.encoding if is_given(self._opts.encoding) else DEFAULT_ENCODING,
-            "disable_partial_transcripts": self._opts.disable_partial_transcripts,
-            "enable_extra_session_information": self._opts.enable_extra_session_information,
-        }
-
-        headers = {
-            "Authorization": self._api_key,
-            "Content-Type": "application/json",
-        }
-
-        ws_url = "wss://api.assemblyai.com/v2/realtime/ws"
-        filtered_config = {k: v for k, v in live_config.items() if v is not None}
-        url = f"{ws_url}?{urlencode(filtered_config).lower()}"
-        ws = await self._session.ws_connect(url, headers=headers)
-        return ws
+        assert isinstance(self._stt, STT)
+        # the pooled connections are opened with the current options of the STT
+        if self._opts == self._stt._opts:
+            ws = await self._pool.get()
+            if not ws.closed:
+                return ws
+
+            self._pool.remove(ws)
+
+        return await _connect_realtime_ws(
+            self._session,
+            self._opts,
+            api_key=self._api_key,
+            timeout=self._conn_options.timeout,
+        )
 
     def _process_stream_event(self, data: dict, closing_ws: bool) -> None:
         # see this page:
@@ -403,6 +436,28 @@ class SpeechStream(stt.SpeechStream):
             )
 
 
+async def _connect_realtime_ws(
+    session: aiohttp.ClientSession, opts: STTOptions, *, api_key: str, timeout: float
+) -> aiohttp.ClientWebSocketResponse:
+    live_config = {
+        "sample_rate": opts.sample_rate,
+        "word_boost": json.dumps(opts.word_boost) if is_given(opts.word_boost) else None,
+        "encoding": opts.encoding if is_given(opts.encoding) else DEFAULT_ENCODING,
+        "disable_partial_transcripts": opts.disable_partial_transcripts,
+        "enable_extra_session_information": opts.enable_extra_session_information,
+    }
+
+    headers = {
+        "Authorization": api_key,
+        "Content-Type": "application/json",
+    }
+
+    ws_url = "wss://api.assemblyai.com/v2/realtime/ws"
+    filtered_config = {k: v for k, v in live_config.items() if v is not None}
+    url = f"{ws_url}?{urlencode(filtered_config).lower()}"
+    return await asyncio.wait_for(session.ws_connect(url, headers=headers), timeout)
+
+
 def live_transcription_to_speech_data(
     language: str,
     data: dict,
@@ -117,6 +117,10 @@ class STT(stt.STT):
         await self._pool.aclose()
         await super().aclose()
 
+    @property
+    def sample_rate(self) -> int:
+        return self._config.sample_rate
+
     async def _recognize_impl(
         self,
         buffer: utils.AudioBuffer,
@@ -127,6 +127,10 @@ class STT(stt.STT):
         )
         self._streams = weakref.WeakSet[SpeechStream]()
 
+    @property
+    def sample_rate(self) -> int:
+        return self._config.sample_rate
+
     async def _recognize_impl(
         self,
         buffer: utils.AudioBuffer,
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import json
 import os
 import weakref
@@ -352,12 +351,12 @@ class SynthesizeStream(tts.SynthesizeStream):
                     logger.warning("unexpected Cartesia message type %s", msg.type)
                     continue
 
-                data = json.loads(msg.data)
+                data = utils.wire.loads(msg.data)
                 segment_id = data.get("context_id")
                 emitter._segment_id = segment_id
 
                 if data.get("data"):
-                    b64data = base64.b64decode(data["data"])
+                    b64data = utils.wire.b64decode(data["data"])
                     for frame in audio_bstream.write(b64data):
                         emitter.push(frame)
                 elif data.get("done"):
@@ -49,6 +49,9 @@ from .models import DeepgramLanguages, DeepgramModels
 
 BASE_URL = "https://api.deepgram.com/v1/listen"
 
+# deepgram closes the connections not receiving audio or KeepAlive messages for 10s
+_KEEPALIVE_INTERVAL = 5.0
+
 
 # This is the magic number during testing that we use to determine if a frame is loud enough
 # to possibly contain speech. It's very conservative.
@@ -211,6 +214,12 @@ class STT(stt.STT):
         )
         self._session = http_session
         self._streams = weakref.WeakSet[SpeechStream]()
+        self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
+            connect_cb=self._connect_ws,
+            close_cb=self._close_ws,
+            ping_cb=self._keepalive_ws,
+            health_check_interval=_KEEPALIVE_INTERVAL,
+        )
 
     def _ensure_session(self) -> aiohttp.ClientSession:
         if not self._session:
@@ -218,6 +227,35 @@ class STT(stt.STT):
 
         return self._session
 
+    async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
+        return await _connect_live_ws(
+            self._ensure_session(),
+            self._sanitize_options(),
+            api_key=self._api_key,
+            base_url=self._base_url,
+            timeout=DEFAULT_API_CONNECT_OPTIONS.timeout,
+        )
+
+    async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        await ws.close()
+
+    async def _keepalive_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        if ws.closed:
+            raise APIConnectionError("deepgram connection closed")
+
+        await ws.send_str(SpeechStream._KEEPALIVE_MSG)
+
+    def prewarm(self) -> None:
+        self._pool.prewarm()
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+        await super().aclose()
+
+    @property
+    def sample_rate(self) -> int:
+        return self._opts.sample_rate
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
@@ -284,6 +322,7 @@ class STT(stt.STT):
             api_key=self._api_key,
             http_session=self._ensure_session(),
             base_url=self._base_url,
+            pool=self._pool,
         )
         self._streams.add(stream)
         return stream
@@ -338,6 +377,9 @@ class STT(stt.STT):
         if is_given(tags):
             self._opts.tags = _validate_tags(tags)
 
+        # the prewarmed connections use the previous options
+        self._pool.invalidate()
+
         for stream in self._streams:
             stream.update_options(
                 language=language,
@@ -370,6 +412,7 @@ class STT(stt.STT):
 
 
 class SpeechStream(stt.SpeechStream):
+    _sends_keepalive = True
     _KEEPALIVE_MSG: str = json.dumps({"type": "KeepAlive"})
     _CLOSE_MSG: str = json.dumps({"type": "CloseStream"})
     _FINALIZE_MSG: str = json.dumps({"type": "Finalize"})
@@ -383,6 +426,7 @@ class SpeechStream(stt.SpeechStream):
         api_key: str,
         http_session: aiohttp.ClientSession,
         base_url: str,
+        pool: utils.ConnectionPool[aiohttp.ClientWebSocketResponse],
     ) -> None:
         super().__init__(stt=stt, conn_options=conn_options, sample_rate=opts.sample_rate)
 
@@ -396,6 +440,7 @@ class SpeechStream(stt.SpeechStream):
         self._api_key = api_key
         self._session = http_session
         self._base_url = base_url
+        self._pool = pool
         self._speaking = False
         self._audio_duration_collector = PeriodicCollector(
             callback=self._on_audio_duration_report,
@@ -474,7 +519,7 @@ class SpeechStream(stt.SpeechStream):
             try:
                 while True:
                     await ws.send_str(SpeechStream._KEEPALIVE_MSG)
-                    await asyncio.sleep(5)
+                    await asyncio.sleep(_KEEPALIVE_INTERVAL)
             except Exception:
                 return
 
@@ -584,46 +629,27 @@ class SpeechStream(stt.SpeechStream):
                     await utils.aio.gracefully_cancel(*tasks, wait_reconnect_task)
             finally:
                 if ws is not None:
+                    # a live session can't be reused once closed
+                    self._pool.remove(ws)
                     await ws.close()
 
     async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
-        live_config: dict[str, Any] = {
-            "model": self._opts.model,
-            "punctuate": self._opts.punctuate,
-            "smart_format": self._opts.smart_format,
-            "no_delay": self._opts.no_delay,
-            "interim_results": self._opts.interim_results,
-            "encoding": "linear16",
-            "vad_events": True,
-            "sample_rate": self._opts.sample_rate,
-            "channels": self._opts.num_channels,
-            "endpointing": False if self._opts.endpointing_ms == 0 else self._opts.endpointing_ms,
-            "filler_words": self._opts.filler_words,
-            "profanity_filter": self._opts.profanity_filter,
-            "numerals": self._opts.numerals,
-            "mip_opt_out": self._opts.mip_opt_out,
-        }
-        if self._opts.keywords:
-            live_config["keywords"] = self._opts.keywords
-        if self._opts.keyterms:
-            # the query param is `keyterm`
-            # See: https://developers.deepgram.com/docs/keyterm
-            live_config["keyterm"] = self._opts.keyterms
-
-        if self._opts.language:
-            live_config["language"] = self._opts.language
-
-        if self._opts.tags:
-            live_config["tag"] = self._opts.tags
-
-        ws = await asyncio.wait_for(
-            self._session.ws_connect(
-                _to_deepgram_url(live_config, base_url=self._base_url, websocket=True),
-                headers={"Authorization": f"Token {self._api_key}"},
-            ),
-            self._conn_options.timeout,
+        assert isinstance(self._stt, STT)
+        # the pooled connections are opened with the current options of the STT
+        if self._opts == self._stt._sanitize_options():
+            ws = await self._pool.get()
+            if not ws.closed:
+                return ws
+
+            self._pool.remove(ws)
+
+        return await _connect_live_ws(
+            self._session,
+            self._opts,
+            api_key=self._api_key,
+            base_url=self._base_url,
+            timeout=self._conn_options.timeout,
         )
-        return ws
 
     def _check_energy_state(self, frame: rtc.AudioFrame) -> AudioEnergyFilter.State:
         if self._audio_energy_filter:
@@ -749,6 +775,52 @@ def prerecorded_transcription_to_speech_event(
     )
 
 
+async def _connect_live_ws(
+    session: aiohttp.ClientSession,
+    opts: STTOptions,
+    *,
+    api_key: str,
+    base_url: str,
+    timeout: float,
+) -> aiohttp.ClientWebSocketResponse:
+    live_config: dict[str, Any] = {
+        "model": opts.model,
+        "punctuate": opts.punctuate,
+        "smart_format": opts.smart_format,
+        "no_delay": opts.no_delay,
+        "interim_results": opts.interim_results,
+        "encoding": "linear16",
+        "vad_events": True,
+        "sample_rate": opts.sample_rate,
+        "channels": opts.num_channels,
+        "endpointing": False if opts.endpointing_ms == 0 else opts.endpointing_ms,
+        "filler_words": opts.filler_words,
+        "profanity_filter": opts.profanity_filter,
+        "numerals": opts.numerals,
+        "mip_opt_out": opts.mip_opt_out,
+    }
+    if opts.keywords:
+        live_config["keywords"] = opts.keywords
+    if opts.keyterms:
+        # the query param is `keyterm`
+        # See: https://developers.deepgram.com/docs/keyterm
+        live_config["keyterm"] = opts.keyterms
+
+    if opts.language:
+        live_config["language"] = opts.language
+
+    if opts.tags:
+        live_config["tag"] = opts.tags
+
+    return await asyncio.wait_for(
+        session.ws_connect(
+            _to_deepgram_url(live_config, base_url=base_url, websocket=True),
+            headers={"Authorization": f"Token {api_key}"},
+        ),
+        timeout,
+    )
+
+
 def _to_deepgram_url(opts: dict, base_url: str, *, websocket: bool) -> str:
     # don't modify the original opts
     opts = opts.copy()
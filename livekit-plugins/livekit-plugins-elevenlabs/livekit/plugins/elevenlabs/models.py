@@ -18,4 +18,9 @@ TTSEncoding = Literal[
     "mp3_44100_96",
     "mp3_44100_128",
     "mp3_44100_192",
+    "pcm_16000",
+    "pcm_22050",
+    "pcm_24000",
+    "pcm_44100",
+    "ulaw_8000",
 ]
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import dataclasses
 import json
 import os
@@ -48,6 +47,12 @@ from .models import TTSEncoding, TTSModels
 # in our testing,  reduce TTFB by about ~110ms
 _DefaultEncoding: TTSEncoding = "mp3_22050_32"
 
+# output formats with the sample rate of the default encoding, used by negotiate_encoding()
+_NEGOTIABLE_ENCODINGS: dict[tts.AudioEncoding, TTSEncoding] = {
+    "pcm": "pcm_22050",
+    "mp3": _DefaultEncoding,
+}
+
 
 def _sample_rate_from_format(output_format: TTSEncoding) -> int:
     split = output_format.split("_")  # e.g: mp3_44100
@@ -142,12 +147,15 @@ class TTS(tts.TTS):
         if not is_given(chunk_length_schedule):
             chunk_length_schedule = [80, 120, 200, 260]
 
+        encodings: tuple[tts.AudioEncoding, ...] = ()
         if not is_given(encoding):
             encoding = _DefaultEncoding
+            encodings = tuple(_NEGOTIABLE_ENCODINGS)
 
         super().__init__(
             capabilities=tts.TTSCapabilities(
                 streaming=True,
+                encodings=encodings,
             ),
             sample_rate=_sample_rate_from_format(encoding),
             num_channels=1,
@@ -180,6 +188,12 @@ class TTS(tts.TTS):
         )
         self._session = http_session
         self._streams = weakref.WeakSet[SynthesizeStream]()
+        # 11labs closes the idle connections after the inactivity timeout
+        self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
+            connect_cb=self._connect_ws,
+            close_cb=self._close_ws,
+            max_session_duration=inactivity_timeout * 0.9,
+        )
 
     def _ensure_session(self) -> aiohttp.ClientSession:
         if not self._session:
@@ -187,6 +201,26 @@ class TTS(tts.TTS):
 
         return self._session
 
+    async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
+        return await asyncio.wait_for(
+            self._ensure_session().ws_connect(
+                _stream_url(self._opts),
+                headers={AUTHORIZATION_HEADER: self._opts.api_key},
+            ),
+            self._conn_options.timeout,
+        )
+
+    async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        await ws.close()
+
+    def prewarm(self) -> None:
+        self._pool.prewarm()
+
+    def _set_encoding(self, encoding: tts.AudioEncoding) -> None:
+        self._opts.encoding = _NEGOTIABLE_ENCODINGS[encoding]
+        # the output format is part of the websocket url
+        self._pool.invalidate()
+
     async def list_voices(self) -> list[Voice]:
         async with self._ensure_session().get(
             f"{self._opts.base_url}/voices",
@@ -214,6 +248,9 @@ class TTS(tts.TTS):
         if is_given(language):
             self._opts.language = language
 
+        # the prewarmed connections use the previous options
+        self._pool.invalidate()
+
     def synthesize(
         self,
         text: str,
@@ -235,7 +272,7 @@ class TTS(tts.TTS):
             tts=self,
             conn_options=conn_options,
             opts=self._opts,
-            session=self._ensure_session(),
+            pool=self._pool,
         )
         self._streams.add(stream)
         return stream
@@ -244,6 +281,7 @@ class TTS(tts.TTS):
         for stream in list(self._streams):
             await stream.aclose()
         self._streams.clear()
+        await self._pool.aclose()
         await super().aclose()
 
 
@@ -275,11 +313,7 @@ class ChunkedStream(tts.ChunkedStream):
             "voice_settings": voice_settings,
         }
 
-        decoder = utils.codecs.AudioStreamDecoder(
-            sample_rate=self._opts.sample_rate,
-            num_channels=1,
-        )
-
+        decoder = _create_decoder(self._opts)
         decode_task: asyncio.Task | None = None
         try:
             async with self._session.post(
@@ -287,7 +321,10 @@ class ChunkedStream(tts.ChunkedStream):
                 headers={AUTHORIZATION_HEADER: self._opts.api_key},
                 json=data,
             ) as resp:
-                if not resp.content_type.startswith("audio/"):
+                # raw pcm can be served as application/octet-stream
+                if not resp.content_type.startswith("audio/") and (
+                    resp.content_type != "application/octet-stream"
+                ):
                     content = await resp.text()
                     logger.error("11labs returned non-audio data: %s", content)
                     return
@@ -306,6 +343,7 @@ class ChunkedStream(tts.ChunkedStream):
                 )
                 async for frame in decoder:
                     emitter.push(frame)
+                self._decode_time += decoder.decode_time
                 emitter.flush()
         except asyncio.TimeoutError as e:
             raise APITimeoutError() from e
@@ -331,12 +369,12 @@ class SynthesizeStream(tts.SynthesizeStream):
         self,
         *,
         tts: TTS,
-        session: aiohttp.ClientSession,
         opts: _TTSOptions,
+        pool: utils.ConnectionPool[aiohttp.ClientWebSocketResponse],
         conn_options: APIConnectOptions,
     ):
         super().__init__(tts=tts, conn_options=conn_options)
-        self._opts, self._session = opts, session
+        self._opts, self._pool = opts, pool
 
     async def _run(self) -> None:
         request_id = utils.shortuuid()
@@ -391,16 +429,13 @@ class SynthesizeStream(tts.SynthesizeStream):
         word_stream: tokenize.WordStream,
         request_id: str,
     ) -> None:
-        ws_conn = await self._session.ws_connect(
-            _stream_url(self._opts),
-            headers={AUTHORIZATION_HEADER: self._opts.api_key},
-        )
+        ws_conn = await self._pool.get()
+        if ws_conn.closed:
+            self._pool.remove(ws_conn)
+            ws_conn = await self._pool.get()
 
         segment_id = utils.shortuuid()
-        decoder = utils.codecs.AudioStreamDecoder(
-            sample_rate=self._opts.sample_rate,
-            num_channels=1,
-        )
+        decoder = _create_decoder(self._opts)
 
         # 11labs protocol expects the first message to be an "init msg"
         init_pkt = {
@@ -453,6 +488,7 @@ class SynthesizeStream(tts.SynthesizeStream):
             )
             async for frame in decoder:
                 emitter.push(frame)
+            self._decode_time += decoder.decode_time
             emitter.flush()
 
         # receives from ws and decodes audio
@@ -478,9 +514,9 @@ class SynthesizeStream(tts.SynthesizeStream):
                     logger.warning("unexpected 11labs message type %s", msg.type)
                     continue
 
-                data = json.loads(msg.data)
+                data = utils.wire.loads(msg.data)
                 if data.get("audio"):
-                    b64data = base64.b64decode(data["audio"])
+                    b64data = utils.wire.b64decode(data["audio"])
                     decoder.push(b64data)
 
                 elif data.get("isFinal"):
@@ -524,8 +560,9 @@ class SynthesizeStream(tts.SynthesizeStream):
         finally:
             await utils.aio.gracefully_cancel(*tasks)
             await decoder.aclose()
-            if ws_conn is not None:
-                await ws_conn.close()
+            # the connection is closed by 11labs at the end of the segment
+            self._pool.remove(ws_conn)
+            await ws_conn.close()
 
 
 def _dict_to_voices_list(data: dict[str, Any]):
@@ -542,6 +579,20 @@ def _dict_to_voices_list(data: dict[str, Any]):
     return voices
 
 
+def _create_decoder(
+    opts: _TTSOptions,
+) -> utils.codecs.AudioStreamDecoder | utils.codecs.RawAudioDecoder:
+    # pcm and ulaw are headerless, they don't need the PyAV decoder
+    if opts.encoding.startswith("pcm_"):
+        return utils.codecs.RawAudioDecoder(sample_rate=opts.sample_rate, num_channels=1)
+    if opts.encoding.startswith("ulaw_"):
+        return utils.codecs.RawAudioDecoder(
+            sample_rate=opts.sample_rate, num_channels=1, encoding="mulaw"
+        )
+
+    return utils.codecs.AudioStreamDecoder(sample_rate=opts.sample_rate, num_channels=1)
+
+
 def _strip_nones(data: dict[str, Any]):
     return {k: v for k, v in data.items() if is_given(v) and v is not None}
 
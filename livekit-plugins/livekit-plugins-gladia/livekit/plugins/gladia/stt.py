@@ -46,6 +46,9 @@ BASE_URL = "https://api.gladia.io/v2/live"
 
 MAGIC_NUMBER_THRESHOLD = 0.004**2
 
+# a prewarmed live session is replaced if it isn't used before this duration
+_MAX_IDLE_DURATION = 20.0
+
 
 class AudioEnergyFilter:
     class State(Enum):
@@ -98,6 +101,12 @@ class TranslationConfiguration:
     match_original_utterances: bool = True
 
 
+@dataclass(eq=False)
+class _LiveSession:
+    id: str
+    ws: aiohttp.ClientWebSocketResponse
+
+
 @dataclass
 class STTOptions:
     language_config: LanguageConfiguration
@@ -198,6 +207,11 @@ class STT(stt.STT):
         )
         self._session = http_session
         self._streams = weakref.WeakSet()
+        self._pool = utils.ConnectionPool[_LiveSession](
+            connect_cb=self._connect_live_session,
+            close_cb=self._close_live_session,
+            max_session_duration=_MAX_IDLE_DURATION,
+        )
 
     def _ensure_session(self) -> aiohttp.ClientSession:
         if not self._session:
@@ -205,6 +219,29 @@ class STT(stt.STT):
 
         return self._session
 
+    async def _connect_live_session(self) -> _LiveSession:
+        return await _start_live_session(
+            self._ensure_session(),
+            self._sanitize_options(),
+            api_key=self._api_key,
+            base_url=self._base_url,
+            timeout=DEFAULT_API_CONNECT_OPTIONS.timeout,
+        )
+
+    async def _close_live_session(self, session: _LiveSession) -> None:
+        await session.ws.close()
+
+    def prewarm(self) -> None:
+        self._pool.prewarm()
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+        await super().aclose()
+
+    @property
+    def sample_rate(self) -> int:
+        return self._opts.sample_rate
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
@@ -444,6 +481,7 @@ class STT(stt.STT):
             api_key=self._api_key,
             http_session=self._ensure_session(),
             base_url=self._base_url,
+            pool=self._pool,
         )
         self._streams.add(stream)
         return stream
@@ -509,6 +547,9 @@ class STT(stt.STT):
         if encoding is not None:
             self._opts.encoding = encoding
 
+        # the prewarmed sessions use the previous options
+        self._pool.invalidate()
+
         for stream in self._streams:
             stream.update_options(
                 languages=languages,
@@ -545,6 +586,7 @@ class SpeechStream(stt.SpeechStream):
         api_key: str,
         http_session: aiohttp.ClientSession,
         base_url: str,
+        pool: utils.ConnectionPool[_LiveSession],
     ) -> None:
         super().__init__(stt=stt, conn_options=conn_options, sample_rate=opts.sample_rate)
 
@@ -552,6 +594,7 @@ class SpeechStream(stt.SpeechStream):
         self._api_key = api_key
         self._session = http_session
         self._base_url = base_url
+        self._pool = pool
         self._speaking = False
         self._audio_duration_collector = PeriodicCollector(
             callback=self._on_audio_duration_report,
@@ -638,17 +681,16 @@ class SpeechStream(stt.SpeechStream):
         max_backoff = 30.0
 
         while True:
+            live_session: _LiveSession | None = None
             try:
-                # Initialize the Gladia session
-                session_info = await self._init_live_session()
-                session_url = session_info["url"]
-                self._request_id = session_info["id"]
+                # Initialize the Gladia session and connect to the WebSocket
+                live_session = await self._connect_live_session()
+                self._request_id = live_session.id
 
                 # Reset backoff on success
                 backoff_time = 1.0
 
-                # Connect to the WebSocket
-                async with self._session.ws_connect(session_url) as ws:
+                async with live_session.ws as ws:
                     self._ws = ws
                     logger.info(f"Connected to Gladia session {self._request_id}")
 
@@ -689,54 +731,28 @@ class SpeechStream(stt.SpeechStream):
                 logger.exception(f"Error in speech stream: {e}")
                 # Wait a bit before reconnecting to avoid rapid reconnection attempts
                 await asyncio.sleep(backoff_time)
-
-    async def _init_live_session(self) -> dict:
-        """Initialize a live session with Gladia."""
-        streaming_config = {
-            "encoding": self._opts.encoding,
-            "sample_rate": self._opts.sample_rate,
-            "bit_depth": self._opts.bit_depth,
-            "channels": self._opts.channels,
-            "language_config": {
-                "languages": self._opts.language_config.languages or [],
-                "code_switching": self._opts.language_config.code_switching,
-            },
-            "realtime_processing": {},
-        }
-
-        # Add translation configuration if enabled
-        if self._opts.translation_config.enabled:
-            streaming_config["realtime_processing"]["translation"] = True
-            streaming_config["realtime_processing"]["translation_config"] = {
-                "target_languages": self._opts.translation_config.target_languages,
-                "model": self._opts.translation_config.model,
-                "match_original_utterances": (
-                    self._opts.translation_config.match_original_utterances
-                ),
-            }
-
-        try:
-            async with self._session.post(
-                url=self._base_url,
-                json=streaming_config,
-                headers={"X-Gladia-Key": self._api_key},
-                timeout=aiohttp.ClientTimeout(
-                    total=30,
-                    sock_connect=self._conn_options.timeout,
-                ),
-            ) as res:
-                # Gladia returns 201 Created when successfully creating a session
-                if res.status not in (200, 201):
-                    raise APIStatusError(
-                        message=f"Failed to initialize Gladia session: {res.status}",
-                        status_code=res.status,
-                        request_id=None,
-                        body=await res.text(),
-                    )
-                return await res.json()
-        except Exception as e:
-            logger.exception(f"Failed to initialize Gladia session: {e}")
-            raise APIConnectionError(f"Failed to initialize Gladia session: {str(e)}") from e
+            finally:
+                if live_session is not None:
+                    # a live session can't be reused once closed
+                    self._pool.remove(live_session)
+
+    async def _connect_live_session(self) -> _LiveSession:
+        assert isinstance(self._stt, STT)
+        # the pooled sessions are initialized with the current options of the STT
+        if self._opts == self._stt._sanitize_options():
+            live_session = await self._pool.get()
+            if not live_session.ws.closed:
+                return live_session
+
+            self._pool.remove(live_session)
+
+        return await _start_live_session(
+            self._session,
+            self._opts,
+            api_key=self._api_key,
+            base_url=self._base_url,
+            timeout=self._conn_options.timeout,
+        )
 
     async def _send_audio_task(self):
         """Send audio data to Gladia WebSocket."""
@@ -949,3 +965,57 @@ class SpeechStream(stt.SpeechStream):
             recognition_usage=stt.RecognitionUsage(audio_duration=duration),
         )
         self._event_ch.send_nowait(usage_event)
+
+
+async def _start_live_session(
+    session: aiohttp.ClientSession,
+    opts: STTOptions,
+    *,
+    api_key: str,
+    base_url: str,
+    timeout: float,
+) -> _LiveSession:
+    """Initialize a live session with Gladia and connect to its WebSocket."""
+    streaming_config = {
+        "encoding": opts.encoding,
+        "sample_rate": opts.sample_rate,
+        "bit_depth": opts.bit_depth,
+        "channels": opts.channels,
+        "language_config": {
+            "languages": opts.language_config.languages or [],
+            "code_switching": opts.language_config.code_switching,
+        },
+        "realtime_processing": {},
+    }
+
+    # Add translation configuration if enabled
+    if opts.translation_config.enabled:
+        streaming_config["realtime_processing"]["translation"] = True
+        streaming_config["realtime_processing"]["translation_config"] = {
+            "target_languages": opts.translation_config.target_languages,
+            "model": opts.translation_config.model,
+            "match_original_utterances": opts.translation_config.match_original_utterances,
+        }
+
+    try:
+        async with session.post(
+            url=base_url,
+            json=streaming_config,
+            headers={"X-Gladia-Key": api_key},
+            timeout=aiohttp.ClientTimeout(total=30, sock_connect=timeout),
+        ) as res:
+            # Gladia returns 201 Created when successfully creating a session
+            if res.status not in (200, 201):
+                raise APIStatusError(
+                    message=f"Failed to initialize Gladia session: {res.status}",
+                    status_code=res.status,
+                    request_id=None,
+                    body=await res.text(),
+                )
+            session_info = await res.json()
+    except Exception as e:
+        logger.exception(f"Failed to initialize Gladia session: {e}")
+        raise APIConnectionError(f"Failed to initialize Gladia session: {str(e)}") from e
+
+    ws = await asyncio.wait_for(session.ws_connect(session_info["url"]), timeout)
+    return _LiveSession(id=session_info["id"], ws=ws)
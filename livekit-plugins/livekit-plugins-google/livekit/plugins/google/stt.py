@@ -205,6 +205,10 @@ class STT(stt.STT):
 
         return config
 
+    @property
+    def sample_rate(self) -> int:
+        return self._config.sample_rate
+
     async def _recognize_impl(
         self,
         buffer: utils.AudioBuffer,
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import json
 import os
 import weakref
@@ -309,7 +308,7 @@ class ChunkedStream(tts.ChunkedStream):
                             parsed_message is not None
                             and parsed_message.get("data", {}).get("audio") is not None
                         ):
-                            audio_bytes = base64.b64decode(parsed_message["data"]["audio"])
+                            audio_bytes = utils.wire.b64decode(parsed_message["data"]["audio"])
 
                             for frame in bstream.write(audio_bytes):
                                 emitter.push(frame)
@@ -381,10 +380,10 @@ class SynthesizeStream(tts.SynthesizeStream):
                     logger.warning("Unexpected Neuphonic message type %s", msg.type)
                     continue
 
-                data = json.loads(msg.data)
+                data = utils.wire.loads(msg.data)
 
                 if data.get("data"):
-                    b64data = base64.b64decode(data["data"]["audio"])
+                    b64data = utils.wire.b64decode(data["data"]["audio"])
                     for frame in audio_bstream.write(b64data):
                         emitter.push(frame)
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import functools
+import re
 from dataclasses import dataclass
 
 import nltk  # type: ignore
@@ -20,6 +21,12 @@ class _TokenizerOptions:
     stream_context_len: int
 
 
+@functools.cache
+def _punkt_tokenizer(language: str) -> nltk.tokenize.punkt.PunktSentenceTokenizer:
+    """load the punkt parameters of a language once per process"""
+    return nltk.tokenize.punkt.PunktTokenizer(language)
+
+
 class SentenceTokenizer(agents.tokenize.SentenceTokenizer):
     def __init__(
         self,
@@ -43,7 +50,7 @@ class SentenceTokenizer(agents.tokenize.SentenceTokenizer):
 
     def tokenize(self, text: str, *, language: str | None = None) -> list[str]:
         config = self._sanitize_options(language=language)
-        sentences = nltk.tokenize.sent_tokenize(text, config.language)
+        sentences = _punkt_tokenizer(config.language).tokenize(text)
         new_sentences = []
         buff = ""
         for sentence in sentences:
@@ -59,8 +66,131 @@ class SentenceTokenizer(agents.tokenize.SentenceTokenizer):
 
     def stream(self, *, language: str | None = None) -> agents.tokenize.SentenceStream:
         config = self._sanitize_options(language=language)
-        return agents.tokenize.BufferedSentenceStream(
-            tokenizer=functools.partial(nltk.tokenize.sent_tokenize, language=config.language),
-            min_token_len=self._config.min_sentence_len,
-            min_ctx_len=self._config.stream_context_len,
+        return SentenceStream(
+            punkt=_punkt_tokenizer(config.language),
+            min_token_len=config.min_sentence_len,
+            min_ctx_len=config.stream_context_len,
+        )
+
+
+class SentenceStream(agents.tokenize.SentenceStream):
+    def __init__(
+        self,
+        *,
+        punkt: nltk.tokenize.punkt.PunktSentenceTokenizer,
+        min_token_len: int,
+        min_ctx_len: int,
+    ) -> None:
+        """
+        Incremental punkt sentence stream.
+
+        Punkt decides whether a sentence ends at a period (or ?, !) from the token holding it
+        and the token following it. The unconsumed text is only tokenized again once one of
+        these candidates is followed by a complete token, and a sentence is only emitted once
+        the first token of the next sentence is complete, so the decision is final.
+        """
+        super().__init__()
+        self._punkt = punkt
+        self._min_token_len = min_token_len
+        self._min_ctx_len = min_ctx_len
+        self._current_segment_id = agents.utils.shortuuid()
+
+        end_chars = re.escape("".join(punkt._lang_vars.sent_end_chars))
+        self._candidate_re = re.compile(rf"[{end_chars}]")
+        self._decidable_re = re.compile(rf"[{end_chars}](?=\S*\s+\S+\s)")
+        self._settled_re = re.compile(r"\S*\s+\S+\s")
+        # candidates before this index of _in_buf were already seen by punkt with their next
+        # token complete
+        self._scan_from = 0
+
+        self._in_buf = ""
+        self._in_pending: list[str] = []  # pushed text not yet joined into _in_buf
+        self._in_pending_len = 0
+        self._out_buf = ""
+
+    def push_text(self, text: str) -> None:
+        self._check_not_closed()
+        self._in_pending.append(text)
+        self._in_pending_len += len(text)
+
+        if len(self._in_buf) + self._in_pending_len < self._min_ctx_len:
+            return
+
+        self._in_buf += "".join(self._in_pending)
+        self._in_pending.clear()
+        self._in_pending_len = 0
+
+        candidate = self._candidate_re.search(self._in_buf, self._scan_from)
+        if candidate is None:
+            self._scan_from = len(self._in_buf)
+            return
+
+        last_candidate = None
+        for last_candidate in self._decidable_re.finditer(self._in_buf, candidate.start()):  # noqa: B007
+            pass
+
+        if last_candidate is None:
+            self._scan_from = candidate.start()
+            return
+
+        self._scan_from = last_candidate.start() + 1
+
+        # a sentence is final once the token following its end is complete, otherwise
+        # punkt may still merge it with the next one
+        settled: list[tuple[int, int]] = []
+        for start, end in self._punkt.span_tokenize(self._in_buf):
+            if not self._settled_re.match(self._in_buf, end):
+                break
+
+            settled.append((start, end))
+
+        if not settled:
+            return
+
+        for start, end in settled:
+            if self._out_buf:
+                self._out_buf += " "
+
+            self._out_buf += self._in_buf[start:end]
+            if len(self._out_buf) >= self._min_token_len:
+                self._emit(self._out_buf)
+                self._out_buf = ""
+
+        rest = self._in_buf[settled[-1][1] :].lstrip()
+        self._scan_from = max(0, self._scan_from - (len(self._in_buf) - len(rest)))
+        self._in_buf = rest
+
+    def flush(self) -> None:
+        self._check_not_closed()
+        self._in_buf += "".join(self._in_pending)
+        self._in_pending.clear()
+        self._in_pending_len = 0
+
+        if self._in_buf or self._out_buf:
+            sentences = self._punkt.tokenize(self._in_buf)
+            if sentences:
+                if self._out_buf:
+                    self._out_buf += " "
+
+                self._out_buf += " ".join(sentences)
+
+            if self._out_buf:
+                self._emit(self._out_buf)
+
+            self._current_segment_id = agents.utils.shortuuid()
+
+        self._in_buf = ""
+        self._out_buf = ""
+        self._scan_from = 0
+
+    def end_input(self) -> None:
+        self.flush()
+        self._event_ch.close()
+
+    async def aclose(self) -> None:
+        self._event_ch.close()
+
+    def _emit(self, token: str) -> None:
+        self._event_ch.send_nowait(
+            agents.tokenize.TokenData(token=token, segment_id=self._current_segment_id)
         )
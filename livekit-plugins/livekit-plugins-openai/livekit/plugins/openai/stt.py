@@ -185,6 +185,11 @@ class STT(stt.STT):
             use_realtime=False,
         )
 
+    @property
+    def sample_rate(self) -> int | None:
+        # the audio is only resampled by the realtime streams
+        return SAMPLE_RATE if self.capabilities.streaming else None
+
     def stream(
         self,
         *,
@@ -237,6 +242,9 @@ class STT(stt.STT):
         if is_given(noise_reduction_type):
             self._opts.noise_reduction_type = noise_reduction_type
 
+        # the prewarmed connections use the previous options
+        self._pool.invalidate()
+
         for stream in self._streams:
             if is_given(language):
                 stream.update_options(language=language)
@@ -287,6 +295,14 @@ class STT(stt.STT):
     async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse):
         await ws.close()
 
+    def prewarm(self) -> None:
+        if self.capabilities.streaming:
+            self._pool.prewarm()
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+        await super().aclose()
+
     def _ensure_session(self) -> aiohttp.ClientSession:
         if not self._session:
             self._session = utils.http_context.http_session()
@@ -49,6 +49,9 @@ DEFAULT_VOICE = "ash"
 
 _RESPONSE_FORMATS = Literal["mp3", "opus", "aac", "flac", "wav", "pcm"] | str
 
+# raw pcm is 24kHz 16-bit mono, it is resampled to OPENAI_TTS_SAMPLE_RATE
+_PCM_SAMPLE_RATE = 24000
+
 
 @dataclass
 class _TTSOptions:
@@ -82,6 +85,7 @@ class TTS(tts.TTS):
         super().__init__(
             capabilities=tts.TTSCapabilities(
                 streaming=False,
+                encodings=() if is_given(response_format) else ("pcm", "opus"),
             ),
             sample_rate=OPENAI_TTS_SAMPLE_RATE,
             num_channels=OPENAI_TTS_CHANNELS,
@@ -110,6 +114,9 @@ class TTS(tts.TTS):
             ),
         )
 
+    def _set_encoding(self, encoding: tts.AudioEncoding) -> None:
+        self._opts.response_format = encoding
+
     def update_options(
         self,
         *,
@@ -216,10 +223,18 @@ class ChunkedStream(tts.ChunkedStream):
         )
 
         request_id = utils.shortuuid()
-        decoder = utils.codecs.AudioStreamDecoder(
-            sample_rate=OPENAI_TTS_SAMPLE_RATE,
-            num_channels=OPENAI_TTS_CHANNELS,
-        )
+        decoder: utils.codecs.AudioStreamDecoder | utils.codecs.RawAudioDecoder
+        if self._opts.response_format == "pcm":
+            decoder = utils.codecs.RawAudioDecoder(
+                sample_rate=_PCM_SAMPLE_RATE,
+                num_channels=OPENAI_TTS_CHANNELS,
+                output_sample_rate=OPENAI_TTS_SAMPLE_RATE,
+            )
+        else:
+            decoder = utils.codecs.AudioStreamDecoder(
+                sample_rate=OPENAI_TTS_SAMPLE_RATE,
+                num_channels=OPENAI_TTS_CHANNELS,
+            )
 
         @utils.log_exceptions(logger=logger)
         async def _decode_loop():
@@ -239,6 +254,7 @@ class ChunkedStream(tts.ChunkedStream):
             )
             async for frame in decoder:
                 emitter.push(frame)
+            self._decode_time += decoder.decode_time
             emitter.flush()
         except openai.APITimeoutError:
             raise APITimeoutError() from None
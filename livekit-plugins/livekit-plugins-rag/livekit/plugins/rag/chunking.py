@@ -1,7 +1,16 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from typing import Callable
 
 from livekit.agents import tokenize
 
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
 
 class SentenceChunker:
     def __init__(
@@ -20,38 +29,103 @@ class SentenceChunker:
         self._paragraph_tokenizer = paragraph_tokenizer
         self._sentence_tokenizer = sentence_tokenizer
         self._word_tokenizer = word_tokenizer
+        # `format_words` is expected to join the words with a separator
+        self._sep_len = len(word_tokenizer.format_words(["", ""]))
 
     def chunk(self, *, text: str) -> list[str]:
-        chunks = []
+        return list(self.chunk_iter(text))
+
+    def chunk_iter(self, text: str | Iterable[str]) -> Iterator[str]:
+        """
+        Lazily yield the chunks of the text.
+
+        The text can also be an iterable of pieces of text (e.g. the lines of a large file), it
+        is then cut at blank lines so only complete paragraphs are given to the
+        paragraph_tokenizer.
+        """
+        if isinstance(text, str):
+            for paragraph in self._paragraph_tokenizer(text):
+                yield from self._chunk_paragraph(paragraph)
+            return
+
+        pending = ""
+        for piece in text:
+            # a paragraph break touching the new piece starts in the trailing whitespace
+            scan_from = len(pending.rstrip())
+            pending += piece
+
+            last_break = None
+            for last_break in _PARAGRAPH_BREAK.finditer(pending, scan_from):  # noqa: B007
+                pass
+
+            if last_break is None:
+                continue
+
+            complete, pending = pending[: last_break.end()], pending[last_break.end() :]
+            for paragraph in self._paragraph_tokenizer(complete):
+                yield from self._chunk_paragraph(paragraph)
+
+        for paragraph in self._paragraph_tokenizer(pending):
+            yield from self._chunk_paragraph(paragraph)
+
+    def chunk_many(
+        self, documents: Iterable[str], *, max_workers: int | None = None
+    ) -> list[list[str]]:
+        """
+        Chunk the documents using a pool of processes.
+
+        Returns the chunks of each document, in the same order as the documents.
+        """
+        documents = list(documents)
+        max_workers = min(max_workers or os.cpu_count() or 1, len(documents))
+        if max_workers <= 1:
+            return [self.chunk(text=document) for document in documents]
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp.get_context("spawn")
+        ) as executor:
+            chunksize = max(1, len(documents) // (max_workers * 4))
+            return list(executor.map(self._chunk_document, documents, chunksize=chunksize))
+
+    def _chunk_document(self, text: str) -> list[str]:
+        return self.chunk(text=text)
+
+    def _chunk_paragraph(self, paragraph: str) -> Iterator[str]:
+        format_words = self._word_tokenizer.format_words
+        sep_len = self._sep_len
 
+        # keep the formatted length of the buffers up to date instead of formatting them again
+        # for every word
         buf_words: list[str] = []
-        for paragraph in self._paragraph_tokenizer(text):
-            last_buf_words: list[str] = []
+        buf_len = 0
+        last_buf_words: list[str] = []
+        last_len = 0
 
-            for sentence in self._sentence_tokenizer.tokenize(text=paragraph):
-                for word in self._word_tokenizer.tokenize(text=sentence):
-                    reconstructed = self._word_tokenizer.format_words(buf_words + [word])
+        for sentence in self._sentence_tokenizer.tokenize(text=paragraph):
+            for word in self._word_tokenizer.tokenize(text=sentence):
+                new_len = buf_len + sep_len + len(word) if buf_words else len(word)
 
-                    if len(reconstructed) > self._max_chunk_size:
-                        while (
-                            len(self._word_tokenizer.format_words(last_buf_words))
-                            > self._chunk_overlap
-                        ):
-                            last_buf_words = last_buf_words[1:]
+                if new_len > self._max_chunk_size:
+                    overlap_start = self._overlap_start(last_buf_words, last_len)
+                    yield format_words(last_buf_words[overlap_start:] + buf_words)
 
-                        new_chunk = self._word_tokenizer.format_words(last_buf_words + buf_words)
-                        chunks.append(new_chunk)
-                        last_buf_words = buf_words
-                        buf_words = []
+                    last_buf_words, last_len = buf_words, buf_len
+                    buf_words, new_len = [], len(word)
 
-                    buf_words.append(word)
+                buf_words.append(word)
+                buf_len = new_len
 
-            if buf_words:
-                while len(self._word_tokenizer.format_words(last_buf_words)) > self._chunk_overlap:
-                    last_buf_words = last_buf_words[1:]
+        if buf_words:
+            overlap_start = self._overlap_start(last_buf_words, last_len)
+            yield format_words(last_buf_words[overlap_start:] + buf_words)
 
-                new_chunk = self._word_tokenizer.format_words(last_buf_words + buf_words)
-                chunks.append(new_chunk)
-                buf_words = []
+    def _overlap_start(self, words: list[str], length: int) -> int:
+        """Index of the first word kept so the formatted words[start:] fit in the chunk overlap"""
+        start = 0
+        while length > self._chunk_overlap:
+            length -= len(words[start])
+            if start < len(words) - 1:
+                length -= self._sep_len
+            start += 1
 
-        return chunks
+        return start
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import json
 import os
 import weakref
@@ -252,7 +251,7 @@ class ChunkedStream(tts.ChunkedStream):
                     )
 
                 # Decode base64 to get raw audio bytes
-                audio_bytes = base64.b64decode(audio_content_b64)
+                audio_bytes = utils.wire.b64decode(audio_content_b64)
                 decoder.push(audio_bytes)
                 decoder.end_input()
 
@@ -412,11 +411,11 @@ class SynthesizeStream(tts.SynthesizeStream):
                         logger.warning("Unexpected Resemble message type %s", msg.type)
                         continue
 
-                    data = json.loads(msg.data)
+                    data = utils.wire.loads(msg.data)
 
                     if data.get("type") == "audio":
                         if data.get("audio_content", None):
-                            b64data = base64.b64decode(data["audio_content"])
+                            b64data = utils.wire.b64decode(data["audio_content"])
                             decoder.push(b64data)
 
                     elif data.get("type") == "audio_end":
@@ -142,6 +142,10 @@ class VAD(agents.vad.VAD):
         self._opts = opts
         self._streams = weakref.WeakSet[VADStream]()
 
+    @property
+    def sample_rate(self) -> int:
+        return self._opts.sample_rate
+
     def stream(self) -> VADStream:
         """
         Create a new VADStream for processing audio data.
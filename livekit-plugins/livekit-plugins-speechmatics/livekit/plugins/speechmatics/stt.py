@@ -46,6 +46,9 @@ from .types import (
 )
 from .utils import get_access_token, sanitize_url
 
+# a prewarmed connection is replaced if it isn't used before this duration
+_MAX_IDLE_DURATION = 20.0
+
 
 class STT(stt.STT):
     def __init__(
@@ -83,6 +86,11 @@ class STT(stt.STT):
         self._extra_headers = extra_headers or {}
         self._session = http_session
         self._streams = weakref.WeakSet[SpeechStream]()
+        self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
+            connect_cb=self._connect_ws,
+            close_cb=self._close_ws,
+            max_session_duration=_MAX_IDLE_DURATION,
+        )
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -90,6 +98,28 @@ class STT(stt.STT):
             self._session = utils.http_context.http_session()
         return self._session
 
+    async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
+        return await _connect_recognition_ws(
+            self.session,
+            self._connection_settings,
+            self._transcription_config,
+            extra_headers=self._extra_headers,
+        )
+
+    async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        await ws.close()
+
+    def prewarm(self) -> None:
+        self._pool.prewarm()
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+        await super().aclose()
+
+    @property
+    def sample_rate(self) -> int:
+        return self._audio_settings.sample_rate
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
@@ -116,6 +146,7 @@ class STT(stt.STT):
             conn_options=conn_options,
             http_session=self.session,
             extra_headers=self._extra_headers,
+            pool=self._pool,
         )
         self._streams.add(stream)
         return stream
@@ -132,6 +163,7 @@ class SpeechStream(stt.SpeechStream):
         conn_options: APIConnectOptions,
         http_session: aiohttp.ClientSession,
         extra_headers: dict,
+        pool: utils.ConnectionPool[aiohttp.ClientWebSocketResponse],
     ) -> None:
         super().__init__(stt=stt, conn_options=conn_options, sample_rate=audio_settings.sample_rate)
         self._transcription_config = transcription_config
@@ -139,6 +171,7 @@ class SpeechStream(stt.SpeechStream):
         self._connection_settings = connection_settings
         self._session = http_session
         self._extra_headers = extra_headers
+        self._pool = pool
         self._speech_duration: float = 0
 
         self._reconnect_event = asyncio.Event()
@@ -235,27 +268,21 @@ class SpeechStream(stt.SpeechStream):
                     await utils.aio.gracefully_cancel(*tasks, wait_reconnect_task)
             finally:
                 if ws is not None:
+                    # a recognition session can't be reused once ended
+                    self._pool.remove(ws)
                     await ws.close()
 
     async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
-        api_key = self._connection_settings.api_key or os.environ.get("SPEECHMATICS_API_KEY")
-        if api_key is None:
-            raise ValueError(
-                "Speechmatics API key is required. "
-                "Pass one in via ConnectionSettings.api_key parameter, "
-                "or set `SPEECHMATICS_API_KEY` environment variable"
-            )
-        if self._connection_settings.get_access_token:
-            api_key = await get_access_token(api_key)
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            **self._extra_headers,
-        }
-        url = sanitize_url(self._connection_settings.url, self._transcription_config.language)
-        return await self._session.ws_connect(
-            url,
-            ssl=self._connection_settings.ssl_context,
-            headers=headers,
+        ws = await self._pool.get()
+        if not ws.closed:
+            return ws
+
+        self._pool.remove(ws)
+        return await _connect_recognition_ws(
+            self._session,
+            self._connection_settings,
+            self._transcription_config,
+            extra_headers=self._extra_headers,
         )
 
     def _process_stream_event(self, data: dict, closing_ws: bool) -> None:
@@ -298,6 +325,34 @@ class SpeechStream(stt.SpeechStream):
                 raise Exception("Speechmatics connection closed unexpectedly")
 
 
+async def _connect_recognition_ws(
+    session: aiohttp.ClientSession,
+    connection_settings: ConnectionSettings,
+    transcription_config: TranscriptionConfig,
+    *,
+    extra_headers: dict,
+) -> aiohttp.ClientWebSocketResponse:
+    api_key = connection_settings.api_key or os.environ.get("SPEECHMATICS_API_KEY")
+    if api_key is None:
+        raise ValueError(
+            "Speechmatics API key is required. "
+            "Pass one in via ConnectionSettings.api_key parameter, "
+            "or set `SPEECHMATICS_API_KEY` environment variable"
+        )
+    if connection_settings.get_access_token:
+        api_key = await get_access_token(api_key)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        **extra_headers,
+    }
+    url = sanitize_url(connection_settings.url, transcription_config.language)
+    return await session.ws_connect(
+        url,
+        ssl=connection_settings.ssl_context,
+        headers=headers,
+    )
+
+
 def live_transcription_to_speech_data(data: dict) -> list[stt.SpeechData]:
     speech_data: list[stt.SpeechData] = []
 
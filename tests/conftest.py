@@ -9,6 +9,25 @@ from livekit.agents.cli import log
 TEST_CONNECT_OPTIONS = dataclasses.replace(DEFAULT_API_CONNECT_OPTIONS, retry_interval=0.0)
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        help="run the benchmarks comparing the optimized code with the previous implementations",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    # the benchmarks are timing dependent, they don't run with the unit tests
+    if config.getoption("--benchmark"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture
 def job_process(event_loop):
     utils.http_context._new_session_ctx()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from livekit.agents import NOT_GIVEN, NotGivenOr, utils
+from livekit.agents.llm import (
+    LLM,
+    ChatChunk,
+    ChatContext,
+    ChoiceDelta,
+    CompletionUsage,
+    FunctionTool,
+    FunctionToolCall,
+    LLMStream,
+    ToolChoice,
+)
+from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions
+
+
+class FakeLLM(LLM):
+    def __init__(
+        self,
+        *,
+        fake_response: str = "Hello, how can I help you today?",
+        fake_chunk_interval: float = 0.0,
+        fake_ttft: float = 0.0,
+        fake_tool_calls: list[FunctionToolCall] | None = None,
+    ) -> None:
+        """fake_tool_calls are returned by the first request only"""
+        super().__init__()
+        self._fake_response = fake_response
+        self._fake_chunk_interval = fake_chunk_interval
+        self._fake_ttft = fake_ttft
+        self._fake_tool_calls = fake_tool_calls or []
+        self.chat_count = 0
+        self.chat_ctxs: list[ChatContext] = []
+
+    def chat(
+        self,
+        *,
+        chat_ctx: ChatContext,
+        tools: list[FunctionTool] | None = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+        parallel_tool_calls: NotGivenOr[bool] = NOT_GIVEN,
+        tool_choice: NotGivenOr[ToolChoice] = NOT_GIVEN,
+        extra_kwargs: NotGivenOr[dict[str, Any]] = NOT_GIVEN,
+    ) -> FakeLLMStream:
+        self.chat_count += 1
+        # the items can be updated after the request, e.g. the output of a non-blocking tool
+        self.chat_ctxs.append(ChatContext([item.model_copy() for item in chat_ctx.items]))
+        return FakeLLMStream(
+            self,
+            chat_ctx=chat_ctx,
+            tools=tools or [],
+            conn_options=conn_options,
+            tool_calls=self._fake_tool_calls if self.chat_count == 1 else [],
+        )
+
+
+class FakeLLMStream(LLMStream):
+    def __init__(
+        self,
+        llm: FakeLLM,
+        *,
+        chat_ctx: ChatContext,
+        tools: list[FunctionTool],
+        conn_options: APIConnectOptions,
+        tool_calls: list[FunctionToolCall],
+    ) -> None:
+        super().__init__(llm, chat_ctx=chat_ctx, tools=tools, conn_options=conn_options)
+        self._fake_llm = llm
+        self._tool_calls = tool_calls
+
+    async def _run(self) -> None:
+        request_id = utils.shortuuid()
+        if self._tool_calls:
+            self._event_ch.send_nowait(
+                ChatChunk(
+                    id=request_id, delta=ChoiceDelta(role="assistant", tool_calls=self._tool_calls)
+                )
+            )
+
+        words = self._fake_llm._fake_response.split(" ")
+        if self._fake_llm._fake_ttft > 0:
+            await asyncio.sleep(self._fake_llm._fake_ttft)
+
+        for i, word in enumerate(words):
+            if i > 0 and self._fake_llm._fake_chunk_interval > 0:
+                await asyncio.sleep(self._fake_llm._fake_chunk_interval)
+
+            content = word if i == 0 else f" {word}"
+            self._event_ch.send_nowait(
+                ChatChunk(id=request_id, delta=ChoiceDelta(role="assistant", content=content))
+            )
+
+        self._event_ch.send_nowait(
+            ChatChunk(
+                id=request_id,
+                usage=CompletionUsage(
+                    completion_tokens=len(words), prompt_tokens=10, total_tokens=len(words) + 10
+                ),
+            )
+        )
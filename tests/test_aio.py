@@ -1,4 +1,5 @@
 import asyncio
+import time
 
 from livekit.agents.utils import aio
 
@@ -39,3 +40,30 @@ async def test_sleep():
     sleep = aio.sleep(5)
     sleep.reset(0.1)
     await sleep
+
+
+def _blocking_work():
+    end = time.perf_counter() + 0.3
+    while time.perf_counter() < end:
+        pass
+
+
+async def test_stall_profiler():
+    profiler = aio.debug.StallProfiler(asyncio.get_running_loop(), threshold=0.05)
+    profiler.start()
+
+    await asyncio.sleep(0.2)
+    assert profiler.stalls == 0
+    assert profiler.collapsed() == ""
+
+    _blocking_work()
+    await asyncio.sleep(0.1)
+    profiler.stop()
+
+    assert profiler.stalls == 1
+    lines = profiler.collapsed().splitlines()
+    samples = {line.rsplit(" ", 1)[0]: int(line.rsplit(" ", 1)[1]) for line in lines}
+    blocking = [stack for stack in samples if "_blocking_work" in stack.split(";")[-1]]
+    assert blocking
+    assert "test_stall_profiler" in blocking[0]
+    assert sum(samples[stack] for stack in blocking) > 10
@@ -0,0 +1,159 @@
+import base64
+import json
+import random
+import time
+import timeit
+
+import pytest
+
+from livekit import rtc
+from livekit.agents import utils
+
+SAMPLE_RATE = 24000
+
+
+# previous implementation of AudioByteStream.push, copying the remaining buffer for every frame
+class _ReferenceAudioByteStream:
+    def __init__(self, sample_rate: int, num_channels: int) -> None:
+        self._sample_rate = sample_rate
+        self._num_channels = num_channels
+        self._bytes_per_frame = num_channels * (sample_rate // 10) * 2
+        self._buf = bytearray()
+
+    def write(self, data: bytes) -> list[rtc.AudioFrame]:
+        self._buf.extend(data)
+
+        frames = []
+        while len(self._buf) >= self._bytes_per_frame:
+            frame_data = self._buf[: self._bytes_per_frame]
+            self._buf = self._buf[self._bytes_per_frame :]
+            frames.append(
+                rtc.AudioFrame(
+                    data=frame_data,
+                    sample_rate=self._sample_rate,
+                    num_channels=self._num_channels,
+                    samples_per_channel=len(frame_data) // 2,
+                )
+            )
+
+        return frames
+
+
+def _audio(duration: float, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    return rng.randbytes(int(SAMPLE_RATE * duration) * 2)
+
+
+def _chunks(data: bytes, chunk_size: int) -> list[bytes]:
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+# the audio messages of the websocket TTS plugins
+def _cartesia_message(chunk: bytes) -> str:
+    return json.dumps(
+        {
+            "type": "chunk",
+            "data": base64.b64encode(chunk).decode(),
+            "done": False,
+            "status_code": 206,
+            "step_time": 12.3,
+            "context_id": "e6e2a4b0c0a54a4c",
+        }
+    )
+
+
+def _elevenlabs_message(chunk: bytes) -> str:
+    return json.dumps(
+        {
+            "audio": base64.b64encode(chunk).decode(),
+            "isFinal": None,
+            "normalizedAlignment": {
+                "charStartTimesMs": list(range(0, 500, 25)),
+                "charsDurationsMs": [25] * 20,
+                "chars": list("the quick brown fox "),
+            },
+        }
+    )
+
+
+def _neuphonic_message(chunk: bytes) -> str:
+    return json.dumps(
+        {
+            "data": {
+                "audio": base64.b64encode(chunk).decode(),
+                "text": "the quick brown fox",
+                "sampling_rate": SAMPLE_RATE,
+            }
+        }
+    )
+
+
+_PLUGINS = {
+    "cartesia": (_cartesia_message, lambda data: data["data"]),
+    "elevenlabs": (_elevenlabs_message, lambda data: data["audio"]),
+    "neuphonic": (_neuphonic_message, lambda data: data["data"]["audio"]),
+}
+
+
+def test_b64decode():
+    data = _audio(0.5)
+    encoded = base64.b64encode(data)
+    assert utils.wire.b64decode(encoded) == data
+    assert utils.wire.b64decode(encoded.decode()) == data
+
+
+def test_loads():
+    message = _elevenlabs_message(_audio(0.1))
+    assert utils.wire.loads(message) == json.loads(message)
+    assert utils.wire.loads(message.encode()) == json.loads(message)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 480, 4800, 4801, 96000])
+def test_audio_byte_stream_matches_reference(chunk_size: int):
+    data = _audio(2.0)
+    bstream = utils.audio.AudioByteStream(sample_rate=SAMPLE_RATE, num_channels=1)
+    reference = _ReferenceAudioByteStream(sample_rate=SAMPLE_RATE, num_channels=1)
+
+    frames, reference_frames = [], []
+    for chunk in _chunks(data, chunk_size):
+        frames.extend(bstream.write(chunk))
+        reference_frames.extend(reference.write(chunk))
+
+    assert [bytes(f.data) for f in frames] == [bytes(f.data) for f in reference_frames]
+    assert bytes(bstream._buf) == bytes(reference._buf)
+
+
+def test_audio_byte_stream_memoryview():
+    data = bytearray(_audio(0.1))
+    bstream = utils.audio.AudioByteStream(sample_rate=SAMPLE_RATE, num_channels=1)
+    (frame,) = bstream.write(memoryview(data))
+
+    # the frame doesn't share the memory of the caller
+    expected = bytes(data)
+    data[:] = bytes(len(data))
+    assert bytes(frame.data) == expected
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("plugin", list(_PLUGINS))
+def test_decode_throughput(plugin: str):
+    make_message, get_audio = _PLUGINS[plugin]
+    duration = 10.0
+    messages = [make_message(chunk) for chunk in _chunks(_audio(duration), 8192)]
+
+    def _reference():
+        bstream = _ReferenceAudioByteStream(sample_rate=SAMPLE_RATE, num_channels=1)
+        for msg in messages:
+            bstream.write(base64.b64decode(get_audio(json.loads(msg))))
+
+    def _current():
+        bstream = utils.audio.AudioByteStream(sample_rate=SAMPLE_RATE, num_channels=1)
+        for msg in messages:
+            bstream.write(utils.wire.b64decode(get_audio(utils.wire.loads(msg))))
+
+    reference = min(timeit.repeat(_reference, timer=time.process_time, number=1, repeat=5))
+    current = min(timeit.repeat(_current, timer=time.process_time, number=1, repeat=5))
+    assert current < reference, (
+        f"{plugin}: {current / duration * 1000:.3f} ms of CPU per second of audio, "
+        f"previous: {reference / duration * 1000:.3f} ms"
+    )
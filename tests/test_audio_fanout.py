@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+import time
+import timeit
+
+import pytest
+
+from livekit import rtc
+from livekit.agents import utils
+from livekit.agents.utils.aio.channel import ChanEmpty
+
+
+def _frames(sample_rate: int, duration: float) -> list[rtc.AudioFrame]:
+    samples = sample_rate // 100  # 10ms frames
+    data = random.Random(0).randbytes(int(sample_rate * duration) * 2)
+    return [
+        rtc.AudioFrame(
+            data=data[i : i + samples * 2],
+            sample_rate=sample_rate,
+            num_channels=1,
+            samples_per_channel=samples,
+        )
+        for i in range(0, len(data) - samples * 2 + 1, samples * 2)
+    ]
+
+
+def _drain(ch: utils.aio.Chan[rtc.AudioFrame]) -> list[rtc.AudioFrame]:
+    frames = []
+    while True:
+        try:
+            frames.append(ch.recv_nowait())
+        except ChanEmpty:
+            return frames
+
+
+async def test_audio_fanout_shares_frames():
+    fanout = utils.audio.AudioFanout()
+    vad_ch = fanout.subscribe(16000)
+    stt_ch = fanout.subscribe(16000)
+    raw_ch = fanout.subscribe()
+
+    input_frames = _frames(48000, 1.0)
+    for frame in input_frames:
+        fanout.push(frame)
+
+    vad_frames, stt_frames = _drain(vad_ch), _drain(stt_ch)
+    # resampled once, the consumers of the same sample rate get the same frames
+    assert len(fanout._resamplers) == 1
+    assert len(vad_frames) == len(stt_frames) > 0
+    assert all(a is b for a, b in zip(vad_frames, stt_frames))
+    assert all(f.sample_rate == 16000 for f in vad_frames)
+    assert sum(f.samples_per_channel for f in vad_frames) > 15000
+
+    assert _drain(raw_ch) == input_frames
+
+    fanout.unsubscribe(vad_ch)
+    fanout.unsubscribe(stt_ch)
+    assert vad_ch.closed
+    assert not fanout._resamplers
+
+    fanout.close()
+    assert raw_ch.closed
+
+
+@pytest.mark.benchmark
+async def test_audio_fanout_throughput():
+    # 48kHz room audio used by a VAD and a STT running at 16kHz
+    input_frames = _frames(48000, 10.0)
+
+    def _separate():
+        vad_resampler = rtc.AudioResampler(48000, 16000, quality=rtc.AudioResamplerQuality.QUICK)
+        stt_resampler = rtc.AudioResampler(48000, 16000, quality=rtc.AudioResamplerQuality.HIGH)
+        for frame in input_frames:
+            vad_resampler.push(frame)
+            stt_resampler.push(frame)
+
+    def _fanout():
+        fanout = utils.audio.AudioFanout()
+        vad_ch, stt_ch = fanout.subscribe(16000), fanout.subscribe(16000)
+        for frame in input_frames:
+            fanout.push(frame)
+            _drain(vad_ch)
+            _drain(stt_ch)
+
+    separate = min(timeit.repeat(_separate, timer=time.process_time, number=1, repeat=3))
+    fanout = min(timeit.repeat(_fanout, timer=time.process_time, number=1, repeat=3))
+    assert fanout < separate, (
+        f"fanout: {fanout / 10 * 1000:.3f} ms of CPU per second of audio, "
+        f"separate resamplers: {separate / 10 * 1000:.3f} ms"
+    )
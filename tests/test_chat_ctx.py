@@ -23,6 +23,26 @@ def test_args_model():
     print(model.model_json_schema())
 
 
+def test_args_model_cached():
+    from livekit.agents.llm import function_tool
+
+    class Tools:
+        @function_tool
+        async def lookup(self, query: str) -> str:
+            """Lookup something"""
+            return query
+
+    tools = Tools()
+    model = utils.function_arguments_to_pydantic_model(tools.lookup)
+    assert model is utils.function_arguments_to_pydantic_model(tools.lookup)
+    assert list(model.model_fields) == ["query"]
+
+    schema = utils.build_strict_openai_schema(tools.lookup)
+    assert schema is utils.build_strict_openai_schema(tools.lookup)
+    legacy = utils.build_legacy_openai_schema(tools.lookup, internally_tagged=True)
+    assert legacy["name"] == "lookup"
+
+
 def test_dict():
     from livekit import rtc
     from livekit.agents.llm import ChatContext, ImageContent
@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+import asyncio
+import json
 import time
 
+import aiohttp
 import pytest
+from aiohttp import web
 
+from livekit import rtc
 from livekit.agents.utils import ConnectionPool
+from livekit.plugins import deepgram, gladia
 
 
 # A simple dummy connection object.
@@ -96,3 +104,323 @@ async def test_get_expired():
 
     conn2 = await pool.get()
     assert conn2 is not conn, "Expected a new connection to be returned."
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    async def _wait():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_wait(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_max_size():
+    """
+    Test that get() waits for a connection to be returned when max_size is reached.
+    """
+    dummy_connect = dummy_connect_factory()
+    pool = ConnectionPool(connect_cb=dummy_connect, max_size=1)
+
+    conn1 = await pool.get()
+    get_task = asyncio.create_task(pool.get())
+    await asyncio.sleep(0.05)
+    assert not get_task.done(), "Expected get() to wait while the pool is full."
+
+    pool.put(conn1)
+    conn2 = await asyncio.wait_for(get_task, 1)
+    assert conn2 is conn1, "Expected the returned connection to be handed to the waiting get()."
+
+    # removing the connection frees a slot for a new one
+    get_task = asyncio.create_task(pool.get())
+    await asyncio.sleep(0.05)
+    pool.remove(conn2)
+    conn3 = await asyncio.wait_for(get_task, 1)
+    assert conn3 is not conn1
+    assert pool.stats.connections == 1
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_min_idle():
+    """
+    Test that the pool keeps min_idle connections open and replaces the ones handed out.
+    """
+    dummy_connect = dummy_connect_factory()
+    pool = ConnectionPool(connect_cb=dummy_connect, min_idle=2, health_check_interval=1)
+
+    pool.prewarm()
+    await _wait_until(lambda: pool.stats.available == 2)
+
+    conn = await pool.get()
+    assert conn.id in (1, 2)
+    await _wait_until(lambda: pool.stats.available == 2)
+
+    stats = pool.stats
+    assert stats.hits == 1
+    assert stats.misses == 0
+    assert stats.connections == 3
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh():
+    """
+    Test that idle connections are replaced in the background before they expire.
+    """
+    closed = []
+
+    async def dummy_close(conn):
+        closed.append(conn)
+
+    dummy_connect = dummy_connect_factory()
+    pool = ConnectionPool(
+        connect_cb=dummy_connect,
+        close_cb=dummy_close,
+        max_session_duration=0.3,
+        health_check_interval=0.1,
+    )
+
+    pool.prewarm()
+    await _wait_until(lambda: pool.stats.available == 1)
+    (conn1,) = pool._available
+
+    await _wait_until(lambda: conn1 in closed)
+    assert pool.stats.available == 1
+
+    conn2 = await pool.get()
+    assert conn2 is not conn1
+    assert pool.stats.misses == 0
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_keeps_connection_available():
+    """
+    Test that the expiring connection can still be handed out while its replacement connects.
+    """
+    connect_started = asyncio.Event()
+    dummy_connect = dummy_connect_factory()
+
+    async def slow_connect():
+        conn = await dummy_connect()
+        if conn.id > 1:
+            connect_started.set()
+            await asyncio.sleep(0.2)
+        return conn
+
+    pool = ConnectionPool(
+        connect_cb=slow_connect,
+        max_session_duration=0.3,
+        health_check_interval=0.1,
+    )
+
+    pool.prewarm()
+    await _wait_until(lambda: pool.stats.available == 1)
+    (conn1,) = pool._available
+
+    await asyncio.wait_for(connect_started.wait(), 1)
+    conn = await pool.get()
+    assert conn is conn1
+    assert pool.stats.misses == 0
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_while_connecting():
+    """
+    Test that a connection opened in the background before invalidate() isn't put back.
+    """
+    closed = []
+    release = asyncio.Event()
+    dummy_connect = dummy_connect_factory()
+
+    async def blocking_connect():
+        conn = await dummy_connect()
+        if conn.id == 1:
+            await release.wait()
+        return conn
+
+    async def dummy_close(conn):
+        closed.append(conn)
+
+    pool = ConnectionPool(
+        connect_cb=blocking_connect, close_cb=dummy_close, min_idle=1, health_check_interval=0.05
+    )
+
+    pool.prewarm()
+    await _wait_until(lambda: pool._connecting == 1)
+    pool.invalidate()
+    release.set()
+
+    await _wait_until(lambda: len(closed) == 1)
+    assert closed[0].id == 1
+    await _wait_until(lambda: pool.stats.available == 1)
+    conn = await pool.get()
+    assert conn.id == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ping_evicts_dead_connections():
+    """
+    Test that the idle connections failing the ping are closed and replaced.
+    """
+    dead = set()
+    closed = []
+
+    async def dummy_ping(conn):
+        if conn in dead:
+            raise ConnectionResetError()
+
+    async def dummy_close(conn):
+        closed.append(conn)
+
+    dummy_connect = dummy_connect_factory()
+    pool = ConnectionPool(
+        connect_cb=dummy_connect,
+        close_cb=dummy_close,
+        ping_cb=dummy_ping,
+        min_idle=1,
+        health_check_interval=0.05,
+    )
+
+    pool.prewarm()
+    await _wait_until(lambda: pool.stats.available == 1)
+    (conn1,) = pool._available
+    dead.add(conn1)
+
+    await _wait_until(lambda: conn1 in closed)
+    await _wait_until(lambda: pool.stats.available == 1)
+    conn2 = await pool.get()
+    assert conn2 is not conn1
+    await pool.aclose()
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = asyncio.Event()
+        self.keepalives = 0
+
+    async def wait_closed(self) -> None:
+        await self.closed.wait()
+
+
+class _FakeSTTServer:
+    """a local websocket server recording the connections and the audio they received"""
+
+    def __init__(self) -> None:
+        self.connections: list[_FakeConnection] = []
+        self.audio_received = asyncio.Event()
+        self.audio_connection: int | None = None
+
+    async def handler(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        conn = _FakeConnection()
+        self.connections.append(conn)
+        async for msg in ws:
+            # gladia sends the audio as base64 in json messages
+            msg_type = json.loads(msg.data)["type"] if msg.type == aiohttp.WSMsgType.TEXT else None
+            if msg_type == "KeepAlive":
+                conn.keepalives += 1
+            elif msg.type == aiohttp.WSMsgType.BINARY or msg_type == "audio_chunk":
+                if not self.audio_received.is_set():
+                    self.audio_connection = self.connections.index(conn)
+                    self.audio_received.set()
+        conn.closed.set()
+        return ws
+
+    async def gladia_init(self, request: web.Request) -> web.Response:
+        ws_url = str(request.url.with_path("/v1/listen"))
+        return web.json_response({"id": f"session-{len(self.connections)}", "url": ws_url})
+
+    async def wait_connections(self, count: int) -> None:
+        while len(self.connections) < count:
+            await asyncio.sleep(0.01)
+
+
+async def _serve_fake_stt() -> tuple[_FakeSTTServer, web.AppRunner, str]:
+    server = _FakeSTTServer()
+    app = web.Application()
+    app.router.add_get("/v1/listen", server.handler)
+    app.router.add_post("/v2/live", server.gladia_init)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return server, runner, f"http://127.0.0.1:{port}/v1/listen"
+
+
+async def _stream_audio(stt: deepgram.STT | gladia.STT, server: _FakeSTTServer) -> None:
+    stream = stt.stream()
+    stream.push_frame(
+        rtc.AudioFrame(
+            data=b"\x00\x00" * 1600, sample_rate=16000, num_channels=1, samples_per_channel=1600
+        )
+    )
+    await asyncio.wait_for(server.audio_received.wait(), 5)
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stt_prewarmed_connection():
+    """
+    Test that a stream uses the connection opened by prewarm() instead of connecting again.
+    """
+    server, runner, url = await _serve_fake_stt()
+    async with aiohttp.ClientSession() as session:
+        stt = deepgram.STT(api_key="test", base_url=url, http_session=session)
+        stt.prewarm()
+        await asyncio.wait_for(server.wait_connections(1), 5)
+
+        await _stream_audio(stt, server)
+        assert len(server.connections) == 1
+        assert server.audio_connection == 0
+
+        await stt.aclose()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_stt_prewarmed_connection_keepalive():
+    """
+    Test that the prewarmed connection is kept alive while it is idle.
+    """
+    server, runner, url = await _serve_fake_stt()
+    async with aiohttp.ClientSession() as session:
+        stt = deepgram.STT(api_key="test", base_url=url, http_session=session)
+        stt._pool._health_check_interval = 0.05
+        stt.prewarm()
+        await asyncio.wait_for(server.wait_connections(1), 5)
+        await _wait_until(lambda: server.connections[0].keepalives >= 2)
+
+        await _stream_audio(stt, server)
+        assert len(server.connections) == 1
+        assert server.audio_connection == 0
+
+        await stt.aclose()
+        await asyncio.wait_for(server.connections[0].wait_closed(), 5)
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_gladia_stt_prewarmed_session():
+    """
+    Test that a gladia stream uses the live session opened by prewarm().
+    """
+    server, runner, url = await _serve_fake_stt()
+    async with aiohttp.ClientSession() as session:
+        stt = gladia.STT(
+            api_key="test", base_url=url.replace("/v1/listen", "/v2/live"), http_session=session
+        )
+        stt.prewarm()
+        await asyncio.wait_for(server.wait_connections(1), 5)
+
+        await _stream_audio(stt, server)
+        assert len(server.connections) == 1
+        assert server.audio_connection == 0
+
+        await stt.aclose()
+    await runner.cleanup()
@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import ctypes
+import gc
 import io
 import multiprocessing as mp
 import socket
 import time
 import uuid
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from multiprocessing.context import BaseContext
-from typing import ClassVar
+from typing import Callable, ClassVar
 
 import psutil
 
@@ -322,12 +324,13 @@ def _create_proc(
     close_timeout: float,
     mp_ctx: BaseContext,
     initialize_timeout: float = 20.0,
+    job_entrypoint_fnc: Callable[[JobContext], Awaitable[None]] = _job_entrypoint,
 ) -> tuple[ipc.job_proc_executor.ProcJobExecutor, _StartArgs]:
     start_args = _new_start_args(mp_ctx)
     loop = asyncio.get_running_loop()
     proc = ipc.job_proc_executor.ProcJobExecutor(
         initialize_process_fnc=_initialize_proc,
-        job_entrypoint_fnc=_job_entrypoint,
+        job_entrypoint_fnc=job_entrypoint_fnc,
         initialize_timeout=initialize_timeout,
         close_timeout=close_timeout,
         memory_warn_mb=0,
@@ -391,3 +394,59 @@ async def test_job_graceful_shutdown():
     assert proc.exitcode == 0, "process should have exited cleanly"
     assert not proc.killed
     assert start_args.shutdown_counter.value == 1
+
+
+async def _blocking_job_entrypoint(job_ctx: JobContext) -> None:
+    for _ in range(15):
+        time.sleep(0.2)  # block the event loop of the job
+        await asyncio.sleep(0.05)
+
+    job_ctx.shutdown()
+
+
+async def test_job_stats():
+    mp_ctx = mp.get_context("spawn")
+    proc, _ = _create_proc(
+        close_timeout=10.0, mp_ctx=mp_ctx, job_entrypoint_fnc=_blocking_job_entrypoint
+    )
+    await proc.start()
+    await proc.initialize()
+    assert proc.stats is None
+
+    await proc.launch_job(_generate_fake_job())
+    await asyncio.sleep(3.0)  # wait for the stats sent after a pong while the job is running
+
+    stats = proc.stats
+    assert stats is not None
+    assert stats.loop_lag_p99 > 0.1
+    assert stats.loop_lag_p50 <= stats.loop_lag_p95 <= stats.loop_lag_p99
+    assert stats.cpu_user + stats.cpu_system > 0.0
+    assert stats.tasks > 0
+    await proc.aclose()
+
+
+async def test_thread_job_stats():
+    proc = ipc.job_thread_executor.ThreadJobExecutor(
+        initialize_process_fnc=_initialize_proc,
+        job_entrypoint_fnc=_blocking_job_entrypoint,
+        inference_executor=None,
+        initialize_timeout=20.0,
+        close_timeout=10.0,
+        ping_interval=2.5,
+        high_ping_threshold=1.0,
+        loop=asyncio.get_running_loop(),
+    )
+    proc.user_arguments = _new_start_args(mp.get_context("spawn"))
+    await proc.start()
+    await proc.initialize()
+    await proc.launch_job(_generate_fake_job())
+    gc.collect()  # collected by the worker, not by the job
+    await asyncio.sleep(3.0)
+
+    stats = proc.stats
+    assert stats is not None
+    assert stats.cpu_user > 0.0
+    # the garbage collector runs for the whole process, it isn't reported for the thread jobs
+    assert stats.gc_collections == 0
+    assert stats.gc_pause == 0.0
+    await proc.aclose()
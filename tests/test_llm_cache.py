@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from livekit.agents.llm import CachingAdapter, ChatContext, SqliteLLMCache
+from livekit.agents.metrics import LLMMetrics
+
+from .fake_llm import FakeLLM
+
+
+async def _collect(llm: CachingAdapter, chat_ctx: ChatContext) -> str:
+    text = ""
+    async with llm.chat(chat_ctx=chat_ctx) as stream:
+        async for chunk in stream:
+            if chunk.delta and chunk.delta.content:
+                text += chunk.delta.content
+
+    return text
+
+
+def _greeting_ctx() -> ChatContext:
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(role="system", content="Greet the user")
+    return chat_ctx
+
+
+async def test_cache_hit_and_miss():
+    fake_llm = FakeLLM()
+    llm = CachingAdapter(fake_llm, replay_pacing=False)
+    metrics: list[LLMMetrics] = []
+    llm.on("metrics_collected", metrics.append)
+
+    first = await _collect(llm, _greeting_ctx())
+    # item ids are random, the cache key must ignore them
+    second = await _collect(llm, _greeting_ctx())
+
+    assert first == second == "Hello, how can I help you today?"
+    assert fake_llm.chat_count == 1
+    assert [m.cache_hit for m in metrics] == [False, True]
+    assert metrics[1].completion_tokens == 0
+
+    other_ctx = _greeting_ctx()
+    other_ctx.add_message(role="user", content="What are your opening hours?")
+    await _collect(llm, other_ctx)
+    assert fake_llm.chat_count == 2
+
+
+async def test_cache_replay_pacing():
+    fake_llm = FakeLLM(fake_response="one two three", fake_chunk_interval=0.1)
+    llm = CachingAdapter(fake_llm)
+
+    await _collect(llm, _greeting_ctx())
+
+    start = time.perf_counter()
+    await _collect(llm, _greeting_ctx())
+    assert time.perf_counter() - start >= 0.18
+
+
+async def test_sqlite_cache_ttl(tmp_path):
+    fake_llm = FakeLLM()
+    llm = CachingAdapter(
+        fake_llm, backend=SqliteLLMCache(str(tmp_path / "cache.db")), ttl=0.0, replay_pacing=False
+    )
+
+    await _collect(llm, _greeting_ctx())
+    await _collect(llm, _greeting_ctx())
+    assert fake_llm.chat_count == 2  # expired immediately
+    await llm.aclose()
+
+    llm = CachingAdapter(
+        fake_llm, backend=SqliteLLMCache(str(tmp_path / "cache.db")), replay_pacing=False
+    )
+    await _collect(llm, _greeting_ctx())
+    assert await _collect(llm, _greeting_ctx()) == "Hello, how can I help you today?"
+    assert fake_llm.chat_count == 3
+    await llm.aclose()
+
+
+@dataclass
+class _FakeLLMOptions:
+    model: str
+    temperature: float
+
+
+async def test_cache_key_llm_options():
+    fake_llm = FakeLLM()
+    fake_llm._opts = _FakeLLMOptions(model="fake-1", temperature=0.0)  # type: ignore[attr-defined]
+    llm = CachingAdapter(fake_llm, replay_pacing=False)
+
+    await _collect(llm, _greeting_ctx())
+    await _collect(llm, _greeting_ctx())
+    assert fake_llm.chat_count == 1
+
+    # the responses cached with other options of the wrapped LLM aren't replayed
+    fake_llm._opts.temperature = 0.8  # type: ignore[attr-defined]
+    await _collect(llm, _greeting_ctx())
+    assert fake_llm.chat_count == 2
+
+    fake_llm._opts.model = "fake-2"  # type: ignore[attr-defined]
+    await _collect(llm, _greeting_ctx())
+    assert fake_llm.chat_count == 3
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from livekit.agents.llm import ChatContext, FallbackAdapter
+
+from .fake_llm import FakeLLM
+
+
+async def _collect(llm: FallbackAdapter) -> str:
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(role="user", content="Hello")
+
+    text = ""
+    async with llm.chat(chat_ctx=chat_ctx) as stream:
+        async for chunk in stream:
+            if chunk.delta and chunk.delta.content:
+                text += chunk.delta.content
+
+    return text
+
+
+async def test_dynamic_ranking() -> None:
+    slow = FakeLLM(fake_response="slow", fake_ttft=0.1)
+    fast = FakeLLM(fake_response="fast")
+
+    # always explore the other LLM to measure both of them
+    fallback_adapter = FallbackAdapter([slow, fast], dynamic_ranking=True, exploration=1.0)
+    assert [await _collect(fallback_adapter) for _ in range(2)] == ["fast", "slow"]
+
+    # the fastest LLM is tried first, without being marked as unavailable
+    fallback_adapter._exploration = 0.0
+    assert [await _collect(fallback_adapter) for _ in range(3)] == ["fast"] * 3
+    assert all(status.available for status in fallback_adapter._status)
+
+    # the list order is kept without dynamic ranking
+    fallback_adapter = FallbackAdapter([slow, fast])
+    assert [await _collect(fallback_adapter) for _ in range(3)] == ["slow"] * 3
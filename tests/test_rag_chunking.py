@@ -0,0 +1,107 @@
+import random
+import timeit
+from pathlib import Path
+
+import pytest
+
+from livekit.agents import tokenize
+from livekit.plugins.rag import SentenceChunker
+
+LONG_TRANSCRIPT = (Path(__file__).parent / "long_transcript.txt").read_text()
+LONG_SYNTHESIZE = (Path(__file__).parent / "long_synthesize.txt").read_text()
+
+
+# previous implementation of SentenceChunker.chunk, formatting the buffers for every word
+def _reference_chunk(text: str, max_chunk_size: int = 120, chunk_overlap: int = 30) -> list[str]:
+    sentence_tokenizer = tokenize.basic.SentenceTokenizer()
+    word_tokenizer = tokenize.basic.WordTokenizer(ignore_punctuation=False)
+    chunks = []
+
+    buf_words: list[str] = []
+    for paragraph in tokenize.basic.tokenize_paragraphs(text):
+        last_buf_words: list[str] = []
+
+        for sentence in sentence_tokenizer.tokenize(text=paragraph):
+            for word in word_tokenizer.tokenize(text=sentence):
+                reconstructed = word_tokenizer.format_words(buf_words + [word])
+
+                if len(reconstructed) > max_chunk_size:
+                    while len(word_tokenizer.format_words(last_buf_words)) > chunk_overlap:
+                        last_buf_words = last_buf_words[1:]
+
+                    new_chunk = word_tokenizer.format_words(last_buf_words + buf_words)
+                    chunks.append(new_chunk)
+                    last_buf_words = buf_words
+                    buf_words = []
+
+                buf_words.append(word)
+
+        if buf_words:
+            while len(word_tokenizer.format_words(last_buf_words)) > chunk_overlap:
+                last_buf_words = last_buf_words[1:]
+
+            new_chunk = word_tokenizer.format_words(last_buf_words + buf_words)
+            chunks.append(new_chunk)
+            buf_words = []
+
+    return chunks
+
+
+def _documents(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    corpus = LONG_TRANSCRIPT + "\n\n" + LONG_SYNTHESIZE
+    documents = []
+    for _ in range(count):
+        start = rng.randrange(len(corpus))
+        paragraphs = [
+            corpus[start : start + rng.randint(20, 2000)] for _ in range(rng.randint(1, 5))
+        ]
+        documents.append("\n\n".join(paragraphs))
+    return documents
+
+
+@pytest.mark.parametrize("max_chunk_size, chunk_overlap", [(5, 0), (120, 30), (400, 100)])
+def test_chunk_matches_reference(max_chunk_size: int, chunk_overlap: int):
+    chunker = SentenceChunker(max_chunk_size=max_chunk_size, chunk_overlap=chunk_overlap)
+    for text in [LONG_TRANSCRIPT, LONG_SYNTHESIZE, *_documents(20)]:
+        assert chunker.chunk(text=text) == _reference_chunk(text, max_chunk_size, chunk_overlap)
+
+
+def test_chunk_iter_pieces():
+    chunker = SentenceChunker()
+    rng = random.Random(1)
+    for text in _documents(20, seed=1):
+        pieces = []
+        cursor = 0
+        while cursor < len(text):
+            size = rng.randint(1, 200)
+            pieces.append(text[cursor : cursor + size])
+            cursor += size
+
+        assert list(chunker.chunk_iter(iter(pieces))) == chunker.chunk(text=text)
+
+
+def test_chunk_many():
+    chunker = SentenceChunker()
+    documents = _documents(8, seed=2)
+    expected = [chunker.chunk(text=document) for document in documents]
+    assert chunker.chunk_many(documents, max_workers=2) == expected
+
+
+@pytest.mark.benchmark
+def test_chunk_throughput(record_property):
+    # a single long paragraph, the previous implementation was quadratic in the chunk size
+    text = " ".join([LONG_SYNTHESIZE.replace("\n", " ")] * 20)
+    megabytes = len(text.encode()) / 1e6
+
+    reference = min(timeit.repeat(lambda: _reference_chunk(text, 1000, 200), number=1, repeat=3))
+    chunker = SentenceChunker(max_chunk_size=1000, chunk_overlap=200)
+    current = min(timeit.repeat(lambda: chunker.chunk(text=text), number=1, repeat=3))
+
+    report = (
+        f"SentenceChunker: {megabytes / current:.2f} MB/s, "
+        f"previous: {megabytes / reference:.2f} MB/s"
+    )
+    print(report)
+    record_property("chunk_throughput_mb_s", round(megabytes / current, 2))
+    assert reference / current > 2, report
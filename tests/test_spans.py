@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from livekit import rtc
+from livekit.agents import debug
+from livekit.agents.debug import spans
+from livekit.agents.voice import io
+from livekit.agents.voice.generation import (
+    perform_audio_forwarding,
+    perform_llm_inference,
+    perform_tts_inference,
+)
+from livekit.agents.voice.room_io._output import _ParticipantAudioOutput
+from livekit.agents.voice.speech_handle import SpeechHandle
+
+
+@pytest.fixture
+def exporter():
+    exporter = spans.InMemorySpanExporter()
+    spans.add_exporter(exporter)
+    yield exporter
+    spans.remove_exporter(exporter)
+
+
+def test_span_tree_export(exporter: spans.InMemorySpanExporter):
+    root = spans.Span("speech", start_time=10.0, attributes={"speech_id": "speech_1"})
+    llm_span = root.start_child("llm_inference", start_time=10.5)
+    llm_span.add_event("first_token", timestamp=10.8)
+    llm_span.end(end_time=11.0)
+    assert not exporter.spans  # only the root span is exported
+
+    root.end(end_time=12.0)
+    root.end(end_time=13.0)  # already ended
+    assert exporter.spans == [root]
+    assert root.duration == 2.0
+    assert llm_span.trace_id == root.trace_id
+
+    assert root.to_dict()["children"][0] == {
+        "name": "llm_inference",
+        "span_id": llm_span.span_id,
+        "start": 0.5,
+        "end": 1.0,
+        "attributes": {},
+        "events": [{"name": "first_token", "time": pytest.approx(0.8), "attributes": {}}],
+        "children": [],
+    }
+
+
+def test_otlp_file_exporter(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    exporter = spans.OTLPFileSpanExporter(str(path))
+    spans.add_exporter(exporter)
+    try:
+        for i in range(2):
+            root = spans.Span("speech", attributes={"turn": i, "interrupted": False})
+            root.start_child("tts_inference").end()
+            root.end()
+    finally:
+        spans.remove_exporter(exporter)
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+
+    request = json.loads(lines[0])
+    otlp_spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in otlp_spans] == ["speech", "tts_inference"]
+    assert otlp_spans[1]["parentSpanId"] == otlp_spans[0]["spanId"]
+    assert otlp_spans[1]["traceId"] == otlp_spans[0]["traceId"]
+    assert len(otlp_spans[0]["traceId"]) == 32
+    assert int(otlp_spans[0]["endTimeUnixNano"]) >= int(otlp_spans[0]["startTimeUnixNano"])
+    assert {"key": "turn", "value": {"intValue": "0"}} in otlp_spans[0]["attributes"]
+    assert {"key": "interrupted", "value": {"boolValue": False}} in otlp_spans[0]["attributes"]
+
+
+async def test_speech_handle_span(exporter: spans.InMemorySpanExporter):
+    handle = SpeechHandle.create()
+    handle._mark_generation_started()
+    handle._mark_first_audio()
+    handle._mark_playout_done()
+
+    assert exporter.spans == [handle.span]
+    assert handle.span.attributes["interrupted"] is False
+    playout = handle.span.find("playout")
+    assert playout is not None and playout.end_time == handle.span.end_time
+
+    # the tool responses are in the trace of the speech calling the tools
+    assert SpeechHandle.create(parent=handle).span.trace_id == handle.span.trace_id
+
+
+class _FakeAudioOutput(io.AudioOutput):
+    def __init__(self) -> None:
+        super().__init__()
+        self.spans: list[spans.Span | None] = []
+
+    async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        await super().capture_frame(frame)
+        self.spans.append(debug.spans.current_span())
+
+    def flush(self) -> None:
+        super().flush()
+
+    def clear_buffer(self) -> None:
+        pass
+
+
+async def test_generation_spans():
+    root = spans.Span("speech")
+
+    async def _llm_node(*args):
+        await asyncio.sleep(0.05)
+        yield "hello"
+        yield " world"
+
+    llm_task, llm_data = perform_llm_inference(
+        node=_llm_node, chat_ctx=None, tool_ctx=None, model_settings=None, span=root
+    )
+
+    async def _tts_node(text, _):
+        async for _ in text:
+            yield rtc.AudioFrame.create(24000, 1, 240)
+
+    tts_task, tts_data = perform_tts_inference(
+        node=_tts_node, input=llm_data.text_ch, model_settings=None, span=root
+    )
+    audio_output = _FakeAudioOutput()
+    forward_task, _ = perform_audio_forwarding(
+        audio_output=audio_output, tts_output=tts_data.audio_ch, span=root
+    )
+    await asyncio.gather(llm_task, tts_task, forward_task)
+
+    llm_span, tts_span, forward_span = root.children
+    assert [s.name for s in root.children] == ["llm_inference", "tts_inference", "audio_forwarding"]
+    assert all(s.end_time is not None for s in root.children)
+    assert [ev.name for ev in llm_span.events] == ["first_token"]
+    assert llm_span.events[0].timestamp - llm_span.start_time >= 0.05
+    assert [ev.name for ev in tts_span.events] == ["first_audio"]
+    assert tts_span.events[0].timestamp >= llm_span.events[0].timestamp
+
+    # the audio output runs in the context of the forwarding span
+    assert audio_output.spans == [forward_span, forward_span]
+
+
+async def test_room_audio_output_first_frame_event():
+    output = _ParticipantAudioOutput(
+        None,  # type: ignore
+        sample_rate=24000,
+        num_channels=1,
+        track_publish_options=rtc.TrackPublishOptions(),
+    )
+    span = spans.Span("audio_forwarding")
+    spans.set_current_span(span)
+    for _ in range(3):
+        await output.capture_frame(rtc.AudioFrame.create(24000, 1, 240))
+
+    assert [ev.name for ev in span.events] == ["first_frame_published"]
+    spans.set_current_span(None)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from livekit import rtc
+from livekit.agents.metrics import STTMetrics
+from livekit.agents.stt import (
+    STT,
+    AudioGateOptions,
+    RecognizeStream,
+    SpeechEvent,
+    STTCapabilities,
+)
+from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions
+from livekit.agents.utils.audio import AudioBuffer
+from livekit.agents.vad import VADEvent, VADEventType
+
+from .test_stt_stream_adapter import _frame
+
+
+class _RecordingSTT(STT):
+    def __init__(self, *, sends_keepalive: bool = False) -> None:
+        super().__init__(capabilities=STTCapabilities(streaming=True, interim_results=False))
+        self.sends_keepalive = sends_keepalive
+
+    async def _recognize_impl(
+        self, buffer: AudioBuffer, *, language: str | None, conn_options: APIConnectOptions
+    ) -> SpeechEvent:
+        raise NotImplementedError
+
+    def stream(
+        self, *, language: str | None = None, conn_options: APIConnectOptions | None = None
+    ) -> _RecordingStream:
+        stream = _RecordingStream(stt=self, conn_options=DEFAULT_API_CONNECT_OPTIONS)
+        stream._sends_keepalive = self.sends_keepalive
+        return stream
+
+
+class _RecordingStream(RecognizeStream):
+    def __init__(self, *, stt: STT, conn_options: APIConnectOptions) -> None:
+        super().__init__(stt=stt, conn_options=conn_options)
+        self.received: list[int] = []
+
+    async def _run(self) -> None:
+        async for data in self._input_ch:
+            if isinstance(data, rtc.AudioFrame):
+                self.received.append(data.data[0])
+
+
+async def _push(stream: RecognizeStream, value: int, frames: int) -> None:
+    for _ in range(frames):
+        stream.push_frame(_frame(value))
+    await asyncio.sleep(0)
+
+
+def _vad_event(type: VADEventType) -> VADEvent:
+    return VADEvent(
+        type=type, samples_index=0, timestamp=0.0, speech_duration=0.0, silence_duration=0.0
+    )
+
+
+@pytest.mark.parametrize("sends_keepalive", [False, True])
+async def test_audio_gate(sends_keepalive: bool):
+    stt = _RecordingSTT(sends_keepalive=sends_keepalive)
+    metrics: list[STTMetrics] = []
+    stt.on("metrics_collected", metrics.append)
+
+    stream = stt.stream()
+    stream.enable_audio_gate(AudioGateOptions(pre_roll=0.3, hangover=0.25, keepalive_interval=0.95))
+
+    await _push(stream, 0, 20)
+    # only the keepalive silence is sent
+    assert stream.received == ([] if sends_keepalive else [0, 0])
+
+    stream.received.clear()
+    stream.push_vad_event(_vad_event(VADEventType.START_OF_SPEECH))
+    await _push(stream, 1, 3)
+    # the pre-roll is sent before the speech
+    assert stream.received == [0, 0, 0, 1, 1, 1]
+
+    stream.received.clear()
+    await _push(stream, 0, 2)
+    stream.push_vad_event(_vad_event(VADEventType.END_OF_SPEECH))
+    await _push(stream, 0, 6)
+    # the silence is sent until the VAD ends the speech and for the hangover
+    assert stream.received == [0, 0, 0, 0, 0]
+
+    stream.end_input()
+    await stream.aclose()
+
+    gated = sum(m.gated_audio_duration for m in metrics)
+    # the audio left in the pre-roll isn't counted
+    assert gated == pytest.approx(1.7)
+    assert sum(m.gated_audio_bytes for m in metrics) == pytest.approx(gated * 16000 * 2, rel=0.01)
@@ -19,12 +19,20 @@ class FallbackAdapterTester(FallbackAdapter):
         attempt_timeout: float = 10.0,
         max_retry_per_stt: int = 1,
         retry_interval: float = 5,
+        hedge_percentile: float | None = None,
+        max_hedge_fraction: float = 0.1,
+        dynamic_ranking: bool = False,
+        exploration: float = 0.05,
     ) -> None:
         super().__init__(
             stt,
             attempt_timeout=attempt_timeout,
             max_retry_per_stt=max_retry_per_stt,
             retry_interval=retry_interval,
+            hedge_percentile=hedge_percentile,
+            max_hedge_fraction=max_hedge_fraction,
+            dynamic_ranking=dynamic_ranking,
+            exploration=exploration,
         )
 
         self.on("stt_availability_changed", self._on_stt_availability_changed)
@@ -134,3 +142,90 @@ async def test_stt_recover() -> None:
         fallback_adapter.availability_changed_ch(fake2).recv_nowait()
 
     await fallback_adapter.aclose()
+
+
+async def test_stt_hedge() -> None:
+    fake1 = FakeSTT(fake_transcript="fake1")
+    fake2 = FakeSTT(fake_transcript="fake2")
+
+    fallback_adapter = FallbackAdapterTester([fake1, fake2], hedge_percentile=95)
+
+    # the first requests are the samples of the hedge delay
+    for _ in range(10):
+        assert (await fallback_adapter.recognize([])).alternatives[0].text == "fake1"
+
+    fake1.update_options(fake_timeout=0.5)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    ev = await fallback_adapter.recognize([])
+    assert ev.alternatives[0].text == "fake2"
+    assert loop.time() - start < 0.25
+    assert fake2.recognize_ch.recv_nowait()
+
+    # the primary STT was slow, not down
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
+
+    # the hedged request spent the budget earned by the previous requests
+    ev = await fallback_adapter.recognize([])
+    assert ev.alternatives[0].text == "fake1"
+    assert loop.time() - start > 0.5
+    with pytest.raises(ChanEmpty):
+        fake2.recognize_ch.recv_nowait()
+
+    await fallback_adapter.aclose()
+
+
+@pytest.mark.parametrize("hedge_fails", [False, True])
+async def test_stt_hedge_primary_failed(hedge_fails: bool) -> None:
+    fake1 = FakeSTT(fake_transcript="fake1")
+    fake2 = FakeSTT(fake_transcript="fake2")
+
+    fallback_adapter = FallbackAdapterTester(
+        [fake1, fake2], max_retry_per_stt=0, hedge_percentile=95
+    )
+    for _ in range(10):
+        await fallback_adapter.recognize([])
+
+    # the primary STT fails while the hedged request is pending
+    fake1.update_options(fake_timeout=0.1, fake_exception=APIConnectionError("fake1 failed"))
+    fake2.update_options(
+        fake_timeout=0.3,
+        fake_exception=APIConnectionError("fake2 failed") if hedge_fails else None,
+    )
+    if hedge_fails:
+        with pytest.raises(APIConnectionError):
+            await fallback_adapter.recognize([])
+    else:
+        assert (await fallback_adapter.recognize([])).alternatives[0].text == "fake2"
+
+    # the error of the primary STT is only counted once
+    stats = fallback_adapter._status[0].stats
+    assert stats._errors.size() == 11
+    assert stats.error_rate == pytest.approx(1 / 11)
+    assert not fallback_adapter.availability_changed_ch(fake1).recv_nowait().available
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
+
+    await fallback_adapter.aclose()
+
+
+async def test_stt_dynamic_ranking() -> None:
+    fake1 = FakeSTT(fake_transcript="fake1", fake_timeout=0.1)
+    fake2 = FakeSTT(fake_transcript="fake2")
+
+    # always explore the other STT to measure both of them
+    fallback_adapter = FallbackAdapterTester([fake1, fake2], dynamic_ranking=True, exploration=1.0)
+    for transcript in ["fake2", "fake1"]:
+        assert (await fallback_adapter.recognize([])).alternatives[0].text == transcript
+
+    # the fastest STT is tried first, without being marked as unavailable
+    fallback_adapter._exploration = 0.0
+    for _ in range(3):
+        assert (await fallback_adapter.recognize([])).alternatives[0].text == "fake2"
+
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
+
+    await fallback_adapter.aclose()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+
+from livekit import rtc
+from livekit.agents import utils
+from livekit.agents.stt import (
+    STT,
+    SpeechData,
+    SpeechEvent,
+    SpeechEventType,
+    StreamAdapter,
+    STTCapabilities,
+)
+from livekit.agents.types import APIConnectOptions
+from livekit.agents.utils.audio import AudioBuffer
+from livekit.agents.vad import VAD, VADCapabilities, VADEvent, VADEventType, VADStream
+
+SAMPLE_RATE = 16000
+FRAME_DURATION = 0.1
+
+
+def _frame(value: int) -> rtc.AudioFrame:
+    samples = int(SAMPLE_RATE * FRAME_DURATION)
+    return rtc.AudioFrame(
+        data=value.to_bytes(2, "little", signed=True) * samples,
+        sample_rate=SAMPLE_RATE,
+        num_channels=1,
+        samples_per_channel=samples,
+    )
+
+
+class _ThresholdVAD(VAD):
+    """frames with a non-zero value are speech"""
+
+    def __init__(self) -> None:
+        super().__init__(capabilities=VADCapabilities(update_interval=FRAME_DURATION))
+
+    def stream(self) -> VADStream:
+        return _ThresholdVADStream(self)
+
+
+class _ThresholdVADStream(VADStream):
+    async def _main_task(self) -> None:
+        speech_frames: list[rtc.AudioFrame] = []
+        async for frame in self._input_ch:
+            if not isinstance(frame, rtc.AudioFrame):
+                continue
+
+            speaking = frame.data[0] != 0
+            if speaking and not speech_frames:
+                speech_frames.append(frame)
+                self._event_ch.send_nowait(self._event(VADEventType.START_OF_SPEECH, [frame]))
+            elif speaking:
+                speech_frames.append(frame)
+                self._event_ch.send_nowait(
+                    self._event(
+                        VADEventType.INFERENCE_DONE,
+                        [frame],
+                        speech_duration=len(speech_frames) * FRAME_DURATION,
+                    )
+                )
+            elif speech_frames:
+                self._event_ch.send_nowait(self._event(VADEventType.END_OF_SPEECH, speech_frames))
+                speech_frames = []
+
+    def _event(
+        self, type: VADEventType, frames: list[rtc.AudioFrame], speech_duration: float = 0.0
+    ) -> VADEvent:
+        return VADEvent(
+            type=type,
+            samples_index=0,
+            timestamp=0.0,
+            speech_duration=speech_duration,
+            silence_duration=0.0,
+            frames=frames,
+            speaking=True,
+        )
+
+
+class _UtteranceSTT(STT):
+    """the transcript is the value of the samples and the number of frames"""
+
+    def __init__(self, *, delays: dict[int, float]) -> None:
+        super().__init__(capabilities=STTCapabilities(streaming=False, interim_results=False))
+        self.delays = delays
+        self.running = 0
+        self.max_running = 0
+
+    async def _recognize_impl(
+        self, buffer: AudioBuffer, *, language: str | None, conn_options: APIConnectOptions
+    ) -> SpeechEvent:
+        frame = utils.merge_frames(buffer)
+        value = frame.data[0]
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(value, 0.0))
+        finally:
+            self.running -= 1
+
+        frames = round(frame.duration / FRAME_DURATION)
+        return SpeechEvent(
+            type=SpeechEventType.FINAL_TRANSCRIPT,
+            alternatives=[SpeechData(text=f"{value}x{frames}", language=language or "")],
+        )
+
+
+async def _transcribe(
+    adapter: StreamAdapter, utterances: list[tuple[int, int]], frame_interval: float = 0.0
+) -> list[SpeechEvent]:
+    stream = adapter.stream()
+    for value, frames in utterances:
+        for _ in range(frames):
+            stream.push_frame(_frame(value))
+            await asyncio.sleep(frame_interval)
+        stream.push_frame(_frame(0))
+
+    stream.end_input()
+    events = [ev async for ev in stream]
+    await stream.aclose()
+    return events
+
+
+def _transcripts(events: list[SpeechEvent], type: SpeechEventType) -> list[str]:
+    return [ev.alternatives[0].text for ev in events if ev.type == type]
+
+
+async def test_stream_adapter_concurrent_recognition():
+    # the first utterance is the slowest to recognize
+    stt = _UtteranceSTT(delays={1: 0.3, 2: 0.1, 3: 0.0})
+    adapter = StreamAdapter(stt=stt, vad=_ThresholdVAD())
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    events = await _transcribe(adapter, [(1, 3), (2, 2), (3, 4)])
+    elapsed = loop.time() - start
+
+    assert _transcripts(events, SpeechEventType.FINAL_TRANSCRIPT) == ["1x3", "2x2", "3x4"]
+    assert stt.max_running == 3
+    assert elapsed < 0.35
+
+
+async def test_stream_adapter_partial_recognition():
+    stt = _UtteranceSTT(delays={})
+    adapter = StreamAdapter(stt=stt, vad=_ThresholdVAD(), partial_interval=0.5)
+    assert adapter.capabilities.interim_results
+
+    events = await _transcribe(adapter, [(1, 12)], frame_interval=0.01)
+
+    interims = _transcripts(events, SpeechEventType.INTERIM_TRANSCRIPT)
+    assert interims == ["1x5", "1x10"]
+    assert _transcripts(events, SpeechEventType.FINAL_TRANSCRIPT) == ["1x12"]
+    # the interim transcripts are emitted before the end of speech
+    types = [ev.type for ev in events]
+    assert types.index(SpeechEventType.INTERIM_TRANSCRIPT) < types.index(
+        SpeechEventType.END_OF_SPEECH
+    )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import functools
+import random
+from pathlib import Path
+
+from livekit.agents import tokenize
+from livekit.agents.voice import io
+from livekit.agents.voice.transcription._speaking_rate import SpeakingRateDetector
+from livekit.agents.voice.transcription.synchronizer import (
+    _SegmentSynchronizerImpl,
+    _TextSyncOptions,
+)
+
+
+class _NullTextOutput(io.TextOutput):
+    def __init__(self) -> None:
+        super().__init__(next_in_chain=None)
+
+    async def capture_text(self, text: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+async def test_pushed_hyphens_incremental():
+    text = (Path(__file__).parent / "long_transcript.txt").read_text()
+    split_words = functools.partial(tokenize.basic.split_words, ignore_punctuation=False)
+    opts = _TextSyncOptions(
+        speed=1.0,
+        hyphenate_word=tokenize.basic.hyphenate_word,
+        split_words=split_words,
+        sentence_tokenizer=tokenize.basic.SentenceTokenizer(retain_format=True),
+        speaking_rate_detector=SpeakingRateDetector(),
+    )
+    expected = sum(len(tokenize.basic.hyphenate_word(word)) for word, _, _ in split_words(text))
+
+    rng = random.Random(0)
+    impl = _SegmentSynchronizerImpl(opts, next_in_chain=_NullTextOutput())
+    cursor = 0
+    while cursor < len(text):
+        # words are split across pushes like an LLM stream would do
+        size = rng.randint(1, 12)
+        impl.push_text(text[cursor : cursor + size])
+        cursor += size
+
+    impl.end_text_input()
+    assert impl._text_data.pushed_hyphens == expected
+    assert impl._text_data.pending_text == ""
+    assert opts.count_hyphens.cache_info().hits > 0  # type: ignore[attr-defined]
+
+    await impl.aclose()
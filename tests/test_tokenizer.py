@@ -1,7 +1,15 @@
+import asyncio
+import functools
+import itertools
+import random
+import re
+import time
+from pathlib import Path
+
 import pytest
 
 from livekit.agents import tokenize
-from livekit.agents.tokenize import basic
+from livekit.agents.tokenize import _basic_hyphenator, _basic_sent, basic
 from livekit.agents.tokenize._basic_paragraph import split_paragraphs
 from livekit.plugins import nltk
 
@@ -212,6 +220,58 @@ def test_hyphenate_word():
         assert hyphenated == HYPHENATOR_EXPECTED[i]
 
 
+@functools.cache
+def _pattern_trie() -> dict:
+    tree: dict = {}
+    for pattern in _basic_hyphenator.PATTERNS.split():
+        t = tree
+        for c in re.sub("[0-9]", "", pattern):
+            t = t.setdefault(c, {})
+        t[None] = [int(d or 0) for d in re.split("[.a-z]", pattern)]
+    return tree
+
+
+def _trie_hyphenate_word(word: str) -> list[str]:
+    # reference implementation, walks a trie of the patterns from every offset of the word
+    tree = _pattern_trie()
+    if len(word) <= 4:
+        return [word]
+    if word.lower() in _basic_hyphenator.hyphenator.exceptions:
+        points = _basic_hyphenator.hyphenator.exceptions[word.lower()]
+    else:
+        work = "." + word.lower() + "."
+        points = [0] * (len(work) + 1)
+        for i in range(len(work)):
+            t = tree
+            for c in work[i:]:
+                if c not in t:
+                    break
+                t = t[c]
+                for j, p_j in enumerate(t.get(None, [])):
+                    points[i + j] = max(points[i + j], p_j)
+        points[1] = points[2] = points[-2] = points[-3] = 0
+
+    pieces = [""]
+    for c, p in zip(word, points[2:]):
+        pieces[-1] += c
+        if p % 2:
+            pieces.append("")
+    return pieces
+
+
+def test_hyphenate_word_matches_trie():
+    long_transcript = (Path(__file__).parent / "long_transcript.txt").read_text()
+    words = set(re.findall(r"\S+", TEXT + long_transcript))
+    rng = random.Random(42)
+    words.update(
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz.'-") for _ in range(rng.randint(1, 16)))
+        for _ in range(2000)
+    )
+
+    for word in words:
+        assert basic.hyphenate_word(word) == _trie_hyphenate_word(word), word
+
+
 REPLACE_TEXT = (
     "This is a test. Hello world, I'm creating this agents..     framework. Once again "
     "framework.  A.B.C"
@@ -315,3 +375,207 @@ def test_split_paragraphs(test_case):
     input_text, expected_output = test_case
     result = split_paragraphs(input_text)
     assert result == expected_output, f"Failed for input: {input_text}"
+
+
+async def test_streamed_sent_tokenizer_early_flush():
+    opts = tokenize.EarlyFlushOptions(clause_boundary=True, max_words=None, max_delay=None)
+    stream = basic.SentenceTokenizer(early_flush=opts).stream()
+    for word in "Sure, Dr. Smith can see you tomorrow. He is very good at his job.".split(" "):
+        stream.push_text(word + " ")
+
+    stream.flush()
+    stream.push_text("Of course: anytime. ")
+    stream.end_input()
+
+    tokens = [ev.token async for ev in stream]
+    assert tokens == [
+        "Sure,",
+        "Dr. Smith can see you tomorrow.",
+        "He is very good at his job.",
+        "Of course:",
+        "anytime.",
+    ]
+
+
+async def test_streamed_sent_tokenizer_early_flush_words_and_delay():
+    opts = tokenize.EarlyFlushOptions(clause_boundary=False, max_words=3, max_delay=None)
+    stream = basic.SentenceTokenizer(early_flush=opts).stream()
+    stream.push_text("I think that we should leave now, it is getting late. ")
+    stream.end_input()
+    assert [ev.token async for ev in stream] == [
+        "I think that",
+        "we should leave now, it is getting late.",
+    ]
+
+    opts = tokenize.EarlyFlushOptions(clause_boundary=False, max_words=None, max_delay=0.05)
+    stream = basic.SentenceTokenizer(early_flush=opts).stream()
+    stream.push_text("Hello there my")
+    await asyncio.sleep(0.1)
+    stream.push_text(" friend, how are you doing today?")
+    stream.end_input()
+    assert [ev.token async for ev in stream] == [
+        "Hello there",
+        "my friend, how are you doing today?",
+    ]
+
+
+# sentence end candidates that never split
+DOTTED_TEXT = (
+    "Upgrade from v1.2 to v1.3 and see livekit.io, e.g. the U.S. docs. "
+    "Pi is 3.14 and e is 2.71 while J. K. Rowling wrote it. Done."
+)
+
+
+async def _collect_stream(stream: tokenize.SentenceStream, text: str, pattern: list[int]):
+    i = 0
+    for chunk_size in itertools.cycle(pattern):
+        if i >= len(text):
+            break
+        stream.push_text(text[i : i + chunk_size])
+        i += chunk_size
+
+    stream.end_input()
+    return [ev.token async for ev in stream]
+
+
+@pytest.mark.parametrize("retain_format", [False, True])
+@pytest.mark.parametrize("pattern", [[1], [1, 2, 4], [7, 13]])
+async def test_streamed_sent_tokenizer_incremental(retain_format: bool, pattern: list[int]):
+    with open(Path(__file__).parent / "long_transcript.txt") as f:
+        text = f.read() + TEXT + DOTTED_TEXT
+
+    tokenizer = basic.SentenceTokenizer(retain_format=retain_format)
+    # without the boundary hint, the whole buffer is re-tokenized on every push
+    reference = tokenizer.stream()
+    reference._boundary_re = None
+
+    assert await _collect_stream(tokenizer.stream(), text, pattern) == await _collect_stream(
+        reference, text, pattern
+    )
+
+
+async def test_streamed_sent_tokenizer_unpunctuated():
+    calls = 0
+
+    def _split_sentences(text: str) -> list[tuple[str, int, int]]:
+        nonlocal calls
+        calls += 1
+        return _basic_sent.split_sentences(text)
+
+    stream = tokenize.BufferedSentenceStream(
+        tokenizer=_split_sentences,
+        min_token_len=20,
+        min_ctx_len=10,
+        boundary_chars=_basic_sent.STOP_CHARS,
+        boundary_lookahead=_basic_sent.LOOKAHEAD,
+    )
+    text = " ".join(f"item{i}" for i in range(5000)) + "."
+    tokens = await _collect_stream(stream, text + " Done.", [4])
+    assert tokens == [text, "Done."]
+    assert calls < 10
+
+
+@pytest.mark.parametrize("unit", ["v1.2 ", "3.14 ", "livekit.io/a.b "])
+async def test_streamed_sent_tokenizer_dotted(unit: str):
+    tokenized = 0
+
+    def _split_sentences(text: str) -> list[tuple[str, int, int]]:
+        nonlocal tokenized
+        tokenized += len(text)
+        return _basic_sent.split_sentences(text)
+
+    stream = tokenize.BufferedSentenceStream(
+        tokenizer=_split_sentences,
+        min_token_len=20,
+        min_ctx_len=10,
+        boundary_chars=_basic_sent.STOP_CHARS,
+        boundary_lookahead=_basic_sent.LOOKAHEAD,
+    )
+    text = unit * 4000
+    tokens = await _collect_stream(stream, text + "Done.", [3])
+    assert "".join(tokens).replace(" ", "") == (text + "Done.").replace(" ", "")
+    # only the end of the buffer is tokenized while no split is found
+    assert tokenized < 50 * len(text)
+
+
+@pytest.mark.benchmark
+async def test_streamed_sent_tokenizer_dotted_scaling():
+    tokenizer = basic.SentenceTokenizer()
+    for unit in ["v1.2 ", "3.14 ", "livekit.io/a.b "]:
+        durations = []
+        for n in (2000, 8000):
+            text = unit * (n // len(unit))
+            start = time.perf_counter()
+            await _collect_stream(tokenizer.stream(), text, [3])
+            durations.append(time.perf_counter() - start)
+
+        # 4x the text, linear scaling
+        assert durations[1] / durations[0] < 8, (
+            f"{unit!r}: {durations[0] * 1e3:.1f}ms -> {durations[1] * 1e3:.1f}ms"
+        )
+
+
+@pytest.fixture
+def punkt_tokenizer(monkeypatch: pytest.MonkeyPatch):
+    # punkt parameters without the punkt_tab data files
+    from nltk.tokenize import punkt
+
+    from livekit.plugins.nltk import sentence_tokenizer
+
+    params = punkt.PunktParameters()
+    params.abbrev_types = {"dr", "mr", "mrs", "e.g", "i.e", "st"}
+    punkt_tokenizer = punkt.PunktSentenceTokenizer(params)
+    monkeypatch.setattr(sentence_tokenizer, "_punkt_tokenizer", lambda language: punkt_tokenizer)
+    return punkt_tokenizer
+
+
+@pytest.mark.parametrize("pattern", [[1], [1, 2, 4], [7, 13]])
+async def test_nltk_streamed_sent_tokenizer_incremental(punkt_tokenizer, pattern: list[int]):
+    text = (
+        (Path(__file__).parent / "long_transcript.txt").read_text()
+        + TEXT
+        + 'He said "hi." Then Dr. Smith left. What? No! Really?! Yes... ok. (See e.g. the docs.)'
+    )
+
+    tokenizer = nltk.SentenceTokenizer(min_sentence_len=1)
+    tokens = await _collect_stream(tokenizer.stream(), text, pattern)
+    expected = tokenizer.tokenize(text)
+    # the remaining sentences are merged on flush
+    assert tokens[:-1] == expected[: len(tokens) - 1]
+    assert tokens[-1] == " ".join(expected[len(tokens) - 1 :])
+
+
+@pytest.mark.benchmark
+async def test_nltk_streamed_sent_tokenizer_latency(punkt_tokenizer):
+    # LLM token sized pushes
+    text = (Path(__file__).parent / "long_transcript.txt").read_text() * 4
+    unpunctuated = " ".join(f"item{i}" for i in range(2000))
+    for name, pieces in [
+        ("punctuated", re.findall(r"\S{1,4}|\s+", text)),
+        ("unpunctuated", re.findall(r"\S{1,4}|\s+", unpunctuated)),
+    ]:
+        results = {}
+        for label, stream in [
+            ("nltk", nltk.SentenceTokenizer().stream()),
+            (
+                "nltk (buffered)",
+                tokenize.BufferedSentenceStream(
+                    tokenizer=punkt_tokenizer.tokenize, min_token_len=20, min_ctx_len=10
+                ),
+            ),
+            ("basic", basic.SentenceTokenizer().stream()),
+        ]:
+            latencies = []
+            for piece in pieces:
+                start = time.perf_counter()
+                stream.push_text(piece)
+                latencies.append(time.perf_counter() - start)
+            stream.end_input()
+
+            results[label] = sum(latencies) / len(latencies)
+
+        if name == "unpunctuated":
+            # punkt never runs without a sentence end candidate
+            assert results["nltk (buffered)"] / results["nltk"] > 5, ", ".join(
+                f"{label}: {latency * 1e6:.1f}us" for label, latency in results.items()
+            )
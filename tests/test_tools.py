@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable
+
+import pytest
+
+from livekit.agents import utils
+from livekit.agents.llm import (
+    FunctionCall,
+    FunctionToolCall,
+    StopResponse,
+    ToolContext,
+    ToolError,
+    ToolExecutor,
+    ToolLatencyHistogram,
+    function_tool,
+)
+from livekit.agents.metrics import ToolMetrics
+from livekit.agents.voice import Agent, AgentSession, SpeechHandle
+from livekit.agents.voice.generation import (
+    BACKGROUND_TOOL_OUTPUT,
+    _PythonOutput,
+    perform_tool_executions,
+)
+
+from .fake_llm import FakeLLM
+
+
+async def test_tool_timeout():
+    @function_tool(timeout=0.1)
+    async def slow_lookup() -> str:
+        await asyncio.sleep(5)
+        return "done"
+
+    executor = ToolExecutor()
+    collected: list[ToolMetrics] = []
+    with pytest.raises(ToolError):
+        await asyncio.create_task(
+            executor.execute(slow_lookup, (), {}, on_metrics=collected.append)
+        )
+
+    assert len(collected) == 1
+    assert collected[0].timed_out
+    assert collected[0].duration < 1.0
+
+
+async def test_tool_max_concurrency():
+    running = 0
+    max_running = 0
+
+    @function_tool(max_concurrency=2)
+    async def crm_lookup(idx: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return idx
+
+    executor = ToolExecutor()
+    results = await asyncio.gather(
+        *[asyncio.create_task(executor.execute(crm_lookup, (i,), {})) for i in range(6)]
+    )
+
+    assert results == list(range(6))
+    assert max_running == 2
+
+    histogram = executor.latency_histograms()["crm_lookup"]
+    assert histogram.count == 6
+    # each call sleeps 50ms, it can take longer on a loaded machine
+    assert histogram.percentile(50) >= 0.1
+
+
+def test_tool_latency_histogram():
+    histogram = ToolLatencyHistogram()
+    for duration in (0.01, 0.07, 0.08, 0.3, 12.0):
+        histogram.observe(duration)
+
+    assert histogram.count == 5
+    assert histogram.percentile(20) == 0.05
+    assert histogram.percentile(50) == 0.1
+    assert histogram.percentile(80) == 0.5
+    assert histogram.percentile(100) == 30.0
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Any]] = []
+        self.userdata = None
+
+    def emit(self, event: str, ev: Any) -> None:
+        self.events.append((event, ev))
+
+
+def _execute_non_blocking(
+    tool: Any, background_tasks: set[asyncio.Task[Any]], outputs: list[_PythonOutput]
+) -> asyncio.Task[None]:
+    function_ch = utils.aio.Chan[FunctionCall]()
+    function_ch.send_nowait(FunctionCall(call_id="call_1", name="fetch_weather", arguments="{}"))
+    function_ch.close()
+
+    exe_task, tool_output = perform_tool_executions(
+        session=_FakeSession(),  # type: ignore[arg-type]
+        speech_handle=SpeechHandle.create(),
+        tool_ctx=ToolContext([tool]),
+        tool_choice="auto",
+        function_stream=function_ch,
+        on_background_output=outputs.append,
+        background_tasks=background_tasks,
+    )
+    assert tool_output.background_tasks is background_tasks
+    return exe_task
+
+
+async def test_non_blocking_tool():
+    release = asyncio.Event()
+
+    @function_tool(blocking=False)
+    async def fetch_weather() -> str:
+        await release.wait()
+        return "sunny"
+
+    background_tasks: set[asyncio.Task[Any]] = set()
+    outputs: list[_PythonOutput] = []
+    # the tool execution doesn't wait for the non-blocking tool
+    await asyncio.wait_for(_execute_non_blocking(fetch_weather, background_tasks, outputs), 1)
+    assert len(background_tasks) == 1
+    assert not outputs
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(*background_tasks), 1)
+    await asyncio.sleep(0)
+    assert not background_tasks
+    assert [out.output for out in outputs] == ["sunny"]
+
+
+async def test_non_blocking_tool_cancelled():
+    @function_tool(blocking=False)
+    async def fetch_weather() -> str:
+        await asyncio.sleep(5)
+        return "sunny"
+
+    background_tasks: set[asyncio.Task[Any]] = set()
+    outputs: list[_PythonOutput] = []
+    await _execute_non_blocking(fetch_weather, background_tasks, outputs)
+
+    await utils.aio.cancel_and_wait(*background_tasks)
+    assert not outputs
+
+
+async def _wait_until(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    async def _wait() -> None:
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_wait(), timeout)
+
+
+def _tool_outputs(chat_ctx: Any) -> list[str]:
+    return [item.output for item in chat_ctx.items if item.type == "function_call_output"]
+
+
+async def _start_session(tool: Any) -> tuple[AgentSession, Agent, FakeLLM]:
+    fake_llm = FakeLLM(
+        fake_response="ok",
+        fake_tool_calls=[FunctionToolCall(name="fetch_weather", arguments="{}", call_id="call_1")],
+    )
+    session: AgentSession = AgentSession(llm=fake_llm)
+    agent = Agent(instructions="test", tools=[tool])
+    await session.start(agent)
+    session.generate_reply(user_input="what's the weather?")
+
+    # the follow-up step starts without waiting for the tool, with a placeholder output
+    await _wait_until(lambda: len(_tool_outputs(agent.chat_ctx)) == 1)
+    assert _tool_outputs(fake_llm.chat_ctxs[1]) == [BACKGROUND_TOOL_OUTPUT]
+    return session, agent, fake_llm
+
+
+async def test_non_blocking_tool_reply():
+    release = asyncio.Event()
+
+    @function_tool(blocking=False)
+    async def fetch_weather() -> str:
+        await release.wait()
+        return "sunny"
+
+    session, agent, fake_llm = await _start_session(fetch_weather)
+
+    # the placeholder is replaced by the output and a reply is generated
+    release.set()
+    await _wait_until(lambda: fake_llm.chat_count == 3)
+    assert _tool_outputs(fake_llm.chat_ctxs[2]) == ["sunny"]
+    assert [item.type for item in agent.chat_ctx.items if item.type != "message"] == [
+        "function_call",
+        "function_call_output",
+    ]
+    await session.aclose()
+
+
+async def test_non_blocking_tool_done_before_placeholder():
+    @function_tool(blocking=False)
+    async def fetch_weather() -> str:
+        return "sunny"
+
+    # the output is recorded once the follow-up step adds the placeholder to the chat_ctx
+    session, agent, fake_llm = await _start_session(fetch_weather)
+    await _wait_until(lambda: fake_llm.chat_count == 3)
+    assert _tool_outputs(agent.chat_ctx) == ["sunny"]
+    await session.aclose()
+
+
+async def test_non_blocking_tool_stop_response():
+    release = asyncio.Event()
+
+    @function_tool(blocking=False)
+    async def fetch_weather() -> str:
+        await release.wait()
+        raise StopResponse()
+
+    session, agent, fake_llm = await _start_session(fetch_weather)
+
+    release.set()
+    await asyncio.sleep(0.1)
+    # no output to record and no reply
+    assert fake_llm.chat_count == 2
+    assert _tool_outputs(agent.chat_ctx) == [BACKGROUND_TOOL_OUTPUT]
+    await session.aclose()
+
+
+async def test_non_blocking_tool_session_closed():
+    cancelled = asyncio.Event()
+
+    @function_tool(blocking=False)
+    async def fetch_weather() -> str:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "sunny"
+
+    session, agent, fake_llm = await _start_session(fetch_weather)
+
+    # the tools still running are cancelled when the agent is drained
+    await session.aclose()
+    assert cancelled.is_set()
+    assert fake_llm.chat_count == 2
+    assert _tool_outputs(agent.chat_ctx) == [BACKGROUND_TOOL_OUTPUT]
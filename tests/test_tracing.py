@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from livekit.agents.debug import Tracing, TracingHandle
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracing():
+    yield
+    Tracing.configure(enabled=True, max_events=1000)
+    Tracing._instance = None
+
+
+def test_events_ring_buffer():
+    handle = TracingHandle(max_events=3)
+    for i in range(5):
+        handle.log_event(f"event_{i}", None)
+
+    info = handle._export()
+    assert [ev["name"] for ev in info["events"]] == ["event_2", "event_3", "event_4"]
+    assert info["dropped_events"] == 2
+
+    handle._set_max_events(1)
+    info = handle._export()
+    assert [ev["name"] for ev in info["events"]] == ["event_4"]
+    assert info["dropped_events"] == 4
+
+
+def test_graph_ring_buffer():
+    graph = TracingHandle().add_graph(
+        title="load", x_label="time", y_label="load", max_data_points=4
+    )
+    for i in range(10):
+        graph.plot(i, i * 2)
+
+    assert list(graph._data) == [(6, 12), (7, 14), (8, 16), (9, 18)]
+    assert graph._dropped == 6
+
+
+def test_configure_max_events():
+    Tracing.with_handle("global")
+    Tracing.configure(max_events=2)
+
+    for i in range(4):
+        Tracing.log_event(f"event_{i}")
+
+    info = Tracing.with_handle("global")._export()
+    assert [ev["name"] for ev in info["events"]] == ["event_2", "event_3"]
+    assert info["dropped_events"] == 2
+
+
+def test_disabled_tracing():
+    Tracing.configure(enabled=False)
+    assert not Tracing.enabled()
+
+    graph = Tracing.add_graph(title="load", x_label="time", y_label="load")
+    for i in range(100):
+        Tracing.log_event("event", {"i": i})
+        Tracing.store_kv("key", "value")
+        graph.plot(i, i)
+
+    info = Tracing.with_handle("global")._export()
+    assert info["events"] == [] and info["kv"] == {} and info["graph"][0]["data"] == []
+
+
+@pytest.mark.benchmark
+def test_graph_plot_throughput():
+    graph = TracingHandle().add_graph(
+        title="load", x_label="time", y_label="load", max_data_points=100_000
+    )
+    for i in range(100_000):
+        graph.plot(i, i)
+
+    # plotting a full graph doesn't move the whole buffer
+    start = time.perf_counter()
+    for i in range(100_000):
+        graph.plot(i, i)
+    elapsed = time.perf_counter() - start
+    assert graph._dropped == 100_000
+    assert graph._data[0] == (0, 0) and len(graph._data) == 100_000
+    assert elapsed < 1.0, f"100k plots on a full graph: {elapsed * 1e3:.1f}ms"
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from livekit.agents.metrics import TTSMetrics
+from livekit.agents.tts import CachingAdapter
+from livekit.agents.utils.aio.channel import ChanEmpty
+
+from .fake_tts import FakeTTS
+
+
+async def _synthesize(tts: CachingAdapter, text: str) -> float:
+    duration = 0.0
+    async with tts.synthesize(text) as stream:
+        async for audio in stream:
+            duration += audio.frame.duration
+    return duration
+
+
+async def _stream(tts: CachingAdapter, segments: list[str]) -> list[float]:
+    durations: list[float] = []
+    segment_duration = 0.0
+    async with tts.stream() as stream:
+        for segment in segments:
+            for word in segment.split(" "):
+                stream.push_text(word + " ")
+            stream.flush()
+        stream.end_input()
+
+        async for audio in stream:
+            segment_duration += audio.frame.duration
+            if audio.is_final:
+                durations.append(round(segment_duration, 2))
+                segment_duration = 0.0
+
+    return durations
+
+
+async def test_cached_synthesize():
+    fake_tts = FakeTTS(fake_audio_duration=0.5)
+    tts = CachingAdapter(fake_tts)
+    metrics: list[TTSMetrics] = []
+    tts.on("metrics_collected", metrics.append)
+
+    assert round(await _synthesize(tts, "One moment please"), 2) == 0.5
+    fake_tts.synthesize_ch.recv_nowait()
+
+    # whitespace is normalized
+    assert round(await _synthesize(tts, " One  moment please"), 2) == 0.5
+    try:
+        fake_tts.synthesize_ch.recv_nowait()
+        raise AssertionError("the second request should be served by the cache")
+    except ChanEmpty:
+        pass
+
+    assert [m.cache_hit for m in metrics] == [False, True]
+
+
+async def test_cached_stream():
+    fake_tts = FakeTTS(fake_audio_duration=0.5)
+    tts = CachingAdapter(fake_tts)
+
+    assert await _stream(tts, ["Hello there", "One moment please"]) == [0.5, 0.5]
+    fake_tts.stream_ch.recv_nowait()
+
+    # the cached segment is served from the cache, the other one by the wrapped TTS
+    assert await _stream(tts, ["One moment please", "Something new"]) == [0.5, 0.5]
+    fake_tts.stream_ch.recv_nowait()
+
+    # fully cached, the wrapped stream isn't even created
+    assert await _stream(tts, ["Hello there", "One moment please"]) == [0.5, 0.5]
+    try:
+        fake_tts.stream_ch.recv_nowait()
+        raise AssertionError("no wrapped stream should be created")
+    except ChanEmpty:
+        pass
+
+
+async def test_disk_cache(tmp_path):
+    fake_tts = FakeTTS(fake_audio_duration=0.5)
+    tts = CachingAdapter(fake_tts, disk_cache_dir=str(tmp_path))
+    await tts.warm_cache(["Welcome to the restaurant"])
+    fake_tts.synthesize_ch.recv_nowait()
+
+    # another process sharing the same directory
+    other_tts = CachingAdapter(fake_tts, disk_cache_dir=str(tmp_path))
+    assert round(await _synthesize(other_tts, "Welcome to the restaurant"), 2) == 0.5
+    try:
+        fake_tts.synthesize_ch.recv_nowait()
+        raise AssertionError("the audio should be read from the disk store")
+    except ChanEmpty:
+        pass
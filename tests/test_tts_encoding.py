@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import io
+import random
+
+import av
+import numpy as np
+import pytest
+
+from livekit.agents import utils
+from livekit.agents.metrics import TTSMetrics
+from livekit.agents.tts import AudioEncoding, TTSCapabilities
+from livekit.plugins import elevenlabs, openai
+
+from .fake_tts import FakeTTS
+from .test_tts_fallback import FallbackAdapterTester
+
+
+def _encode_mp3(duration: float, sample_rate: int = 22050) -> bytes:
+    buf = io.BytesIO()
+    with av.open(buf, mode="w", format="mp3") as container:
+        stream = container.add_stream("mp3", rate=sample_rate)
+        samples = np.sin(np.arange(int(duration * sample_rate)) / 10) * 10000
+        frame = av.AudioFrame.from_ndarray(
+            samples.astype(np.int16).reshape(1, -1), format="s16", layout="mono"
+        )
+        frame.sample_rate = sample_rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+    return buf.getvalue()
+
+
+class _EncodingTTS(FakeTTS):
+    def __init__(self, encodings: tuple[AudioEncoding, ...], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._capabilities = TTSCapabilities(streaming=True, encodings=encodings)
+        self.applied: list[AudioEncoding] = []
+
+    def _set_encoding(self, encoding: AudioEncoding) -> None:
+        self.applied.append(encoding)
+
+
+async def test_negotiate_encoding():
+    tts = _EncodingTTS(encodings=("mp3", "mulaw", "pcm"))
+    assert tts.encoding is None
+    assert tts.negotiate_encoding() == "pcm"
+    assert tts.encoding == "pcm"
+
+    # already selected
+    assert tts.negotiate_encoding() == "pcm"
+    assert tts.applied == ["pcm"]
+
+    with pytest.raises(ValueError):
+        tts.set_encoding("opus")
+
+    assert _EncodingTTS(encodings=("mp3", "mulaw")).negotiate_encoding() == "mulaw"
+    assert FakeTTS().negotiate_encoding() is None
+
+    # plugins reading `encoding` directly don't override _set_encoding
+    tts = FakeTTS()
+    tts._capabilities = TTSCapabilities(streaming=True, encodings=("mp3", "pcm"))
+    assert tts.negotiate_encoding() == "pcm"
+    assert tts.encoding == "pcm"
+
+
+async def test_fallback_adapter_negotiate_encoding():
+    primary = _EncodingTTS(encodings=("mp3", "pcm"))
+    secondary = _EncodingTTS(encodings=("opus", "mp3"))
+    fallback = FallbackAdapterTester([primary, secondary])
+
+    assert fallback.negotiate_encoding() == "pcm"
+    assert secondary.encoding == "opus"
+
+    await fallback.aclose()
+
+
+async def test_chunked_stream_decode_time():
+    tts = FakeTTS(fake_audio_duration=0.1)
+    metrics: list[TTSMetrics] = []
+    tts.on("metrics_collected", metrics.append)
+
+    async with tts.synthesize("hello") as stream:
+        stream._decode_time = 0.25
+        await stream.collect()
+
+    assert metrics[0].decode_time == 0.25
+
+
+def test_decode_mulaw():
+    pcm = utils.codecs.decode_mulaw(b"\xff\x7f\x00\x80")
+    assert np.frombuffer(pcm, dtype="<i2").tolist() == [0, 0, -32124, 32124]
+
+
+async def test_raw_audio_decoder_pcm():
+    data = random.Random(0).randbytes(4800)
+    decoder = utils.codecs.RawAudioDecoder(sample_rate=24000)
+
+    # the chunks are split in the middle of samples
+    for i in range(0, len(data), 333):
+        decoder.push(data[i : i + 333])
+    decoder.end_input()
+
+    frames = [frame async for frame in decoder]
+    assert b"".join(bytes(f.data) for f in frames) == data
+    assert all(f.sample_rate == 24000 for f in frames)
+    assert decoder.decode_time >= 0.0
+
+
+async def test_raw_audio_decoder_mulaw_resample():
+    data = random.Random(0).randbytes(8000)  # 1s of 8kHz μ-law
+    decoder = utils.codecs.RawAudioDecoder(
+        sample_rate=8000, encoding="mulaw", output_sample_rate=16000
+    )
+    for i in range(0, len(data), 160):
+        decoder.push(data[i : i + 160])
+    decoder.end_input()
+
+    frames = [frame async for frame in decoder]
+    assert all(f.sample_rate == 16000 for f in frames)
+    assert sum(f.samples_per_channel for f in frames) == pytest.approx(16000, abs=160)
+
+
+async def test_audio_stream_decoder_decode_time():
+    decoder = utils.codecs.AudioStreamDecoder(sample_rate=48000)
+    decoder.push(_encode_mp3(1.0))
+    decoder.end_input()
+
+    frames = [frame async for frame in decoder]
+    assert frames
+    assert decoder.decode_time > 0.0
+
+
+async def test_elevenlabs_negotiate_encoding():
+    tts = elevenlabs.TTS(api_key="test")
+    assert tts.negotiate_encoding() == "pcm"
+    assert tts._opts.encoding == "pcm_22050"
+    assert tts.sample_rate == 22050
+
+    tts.set_encoding("mp3")
+    assert tts._opts.encoding == "mp3_22050_32"
+
+    # the encoding was chosen by the user
+    assert elevenlabs.TTS(api_key="test", encoding="mp3_44100_128").negotiate_encoding() is None
+
+
+async def test_openai_negotiate_encoding():
+    tts = openai.TTS(api_key="test")
+    assert tts.negotiate_encoding() == "pcm"
+    assert tts._opts.response_format == "pcm"
+    assert tts.sample_rate == 48000
+
+    assert openai.TTS(api_key="test", response_format="mp3").negotiate_encoding() is None
@@ -23,6 +23,10 @@ class FallbackAdapterTester(FallbackAdapter):
         max_retry_per_tts: int = 1,  # only retry once by default
         no_fallback_after_audio_duration: float | None = 3.0,
         sample_rate: int | None = None,
+        hedge_percentile: float | None = None,
+        max_hedge_fraction: float = 0.1,
+        dynamic_ranking: bool = False,
+        exploration: float = 0.05,
     ) -> None:
         super().__init__(
             tts,
@@ -30,6 +34,10 @@ class FallbackAdapterTester(FallbackAdapter):
             max_retry_per_tts=max_retry_per_tts,
             no_fallback_after_audio_duration=no_fallback_after_audio_duration,
             sample_rate=sample_rate,
+            hedge_percentile=hedge_percentile,
+            max_hedge_fraction=max_hedge_fraction,
+            dynamic_ranking=dynamic_ranking,
+            exploration=exploration,
         )
 
         self.on("tts_availability_changed", self._on_tts_availability_changed)
@@ -302,3 +310,105 @@ async def test_timeout():
                 await input_task
 
     await fallback_adapter.aclose()
+
+
+async def test_hedge() -> None:
+    fake1 = FakeTTS(fake_audio_duration=1.0)
+    fake2 = FakeTTS(fake_audio_duration=2.0)
+
+    fallback_adapter = FallbackAdapterTester([fake1, fake2], hedge_percentile=95)
+
+    # the first requests are the samples of the hedge delay
+    for _ in range(10):
+        frame = await fallback_adapter.synthesize("hello test").collect()
+        assert frame.duration == 1.0
+
+    fake1.update_options(fake_timeout=0.5)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    frame = await fallback_adapter.synthesize("hello test").collect()
+    assert frame.duration == 2.0
+    assert loop.time() - start < 0.25
+
+    # the slow request was cancelled
+    streams = []
+    while not fake1.synthesize_ch.empty():
+        streams.append(fake1.synthesize_ch.recv_nowait())
+    assert len(streams) == 11 and streams[-1].done
+    assert fake2.synthesize_ch.recv_nowait()
+
+    # the primary TTS was slow, not down
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
+
+    # the hedged request spent the budget earned by the previous requests
+    frame = await fallback_adapter.synthesize("hello test").collect()
+    assert frame.duration == 1.0
+    with pytest.raises(ChanEmpty):
+        fake2.synthesize_ch.recv_nowait()
+
+    await fallback_adapter.aclose()
+
+
+async def test_hedge_failed_after_winning() -> None:
+    fake1 = FakeTTS(fake_audio_duration=1.0)
+    fake2 = FakeTTS(fake_audio_duration=2.0)
+
+    fallback_adapter = FallbackAdapterTester(
+        [fake1, fake2],
+        max_retry_per_tts=0,
+        no_fallback_after_audio_duration=None,
+        hedge_percentile=95,
+    )
+    for _ in range(10):
+        await fallback_adapter.synthesize("hello test").collect()
+
+    # the hedge produces audio first, then fails mid-stream
+    fake1.update_options(fake_timeout=0.2)
+    fake2.update_options(fake_exception=APIConnectionError("fake2 failed"))
+
+    frame = await fallback_adapter.synthesize("hello test").collect()
+    assert frame.duration == 3.0
+
+    # the cancelled primary TTS was retried after the hedge failed
+    streams = []
+    while not fake1.synthesize_ch.empty():
+        streams.append(fake1.synthesize_ch.recv_nowait())
+    assert len(streams) == 12
+
+    assert not fallback_adapter.availability_changed_ch(fake2).recv_nowait().available
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
+
+    await fallback_adapter.aclose()
+
+
+async def test_dynamic_ranking() -> None:
+    fake1 = FakeTTS(fake_audio_duration=1.0, fake_timeout=0.1)
+    fake2 = FakeTTS(fake_audio_duration=2.0)
+
+    # always explore the other TTS to measure both of them
+    fallback_adapter = FallbackAdapterTester([fake1, fake2], dynamic_ranking=True, exploration=1.0)
+    for duration in [2.0, 1.0]:
+        frame = await fallback_adapter.synthesize("hello test").collect()
+        assert frame.duration == duration
+
+    # the fastest TTS is tried first, without being marked as unavailable
+    fallback_adapter._exploration = 0.0
+    for _ in range(3):
+        frame = await fallback_adapter.synthesize("hello test").collect()
+        assert frame.duration == 2.0
+
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
+
+    # errors are accounted in the ranking
+    fake2.update_options(
+        fake_exception=APIConnectionError("fake2 failed"), fake_audio_duration=None
+    )
+    frame = await fallback_adapter.synthesize("hello test").collect()
+    assert frame.duration == 1.0
+    assert fallback_adapter._status[1].stats.error_rate > 0
+
+    await fallback_adapter.aclose()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from livekit import rtc
+from livekit.agents import tokenize
+from livekit.agents.tts import (
+    TTS,
+    ChunkedStream,
+    StreamAdapter,
+    SynthesizedAudio,
+    TTSCapabilities,
+)
+from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions
+
+SENTENCES = [
+    "The first sentence is the slowest one.",
+    "The second sentence is a bit faster.",
+    "The third sentence is even faster.",
+    "The fourth sentence is the fastest.",
+]
+
+
+class _SlowTTS(TTS):
+    def __init__(self, *, ttfb: dict[str, float], audio_duration: float = 0.2) -> None:
+        super().__init__(
+            capabilities=TTSCapabilities(streaming=False), sample_rate=24000, num_channels=1
+        )
+        self.ttfb = ttfb
+        self.audio_duration = audio_duration
+        self.running = 0
+        self.max_running = 0
+
+    def synthesize(
+        self, text: str, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
+    ) -> ChunkedStream:
+        return _SlowChunkedStream(tts=self, input_text=text, conn_options=conn_options)
+
+
+class _SlowChunkedStream(ChunkedStream):
+    async def _run(self) -> None:
+        tts = self._tts
+        assert isinstance(tts, _SlowTTS)
+        tts.running += 1
+        tts.max_running = max(tts.max_running, tts.running)
+        try:
+            await asyncio.sleep(tts.ttfb.get(self.input_text, 0.0))
+            for _ in range(int(tts.audio_duration * 100)):
+                self._event_ch.send_nowait(
+                    SynthesizedAudio(
+                        request_id=self.input_text,
+                        frame=rtc.AudioFrame(
+                            data=b"\x00\x00" * 240,
+                            samples_per_channel=240,
+                            sample_rate=24000,
+                            num_channels=1,
+                        ),
+                    )
+                )
+        finally:
+            tts.running -= 1
+
+
+async def _stream(tts: StreamAdapter) -> list[SynthesizedAudio]:
+    async with tts.stream() as stream:
+        stream.push_text(" ".join(SENTENCES))
+        stream.end_input()
+        return [audio async for audio in stream]
+
+
+def _segments(events: list[SynthesizedAudio]) -> list[str]:
+    return [ev.request_id for ev in events if ev.is_final]
+
+
+async def test_stream_adapter_lookahead():
+    ttfb = {text: 0.2 - i * 0.05 for i, text in enumerate(SENTENCES)}
+    tts = _SlowTTS(ttfb=ttfb)
+    adapter = StreamAdapter(tts=tts, sentence_tokenizer=tokenize.basic.SentenceTokenizer())
+
+    start = time.perf_counter()
+    events = await _stream(adapter)
+    elapsed = time.perf_counter() - start
+
+    # emitted in order even though the later sentences finished first
+    assert _segments(events) == SENTENCES
+    assert [ev.request_id for ev in events] == sorted(
+        [ev.request_id for ev in events], key=SENTENCES.index
+    )
+    assert tts.max_running == 3
+    assert elapsed < sum(ttfb.values()) * 0.8
+
+
+async def test_stream_adapter_sequential():
+    tts = _SlowTTS(ttfb=dict.fromkeys(SENTENCES, 0.02))
+    adapter = StreamAdapter(
+        tts=tts, sentence_tokenizer=tokenize.basic.SentenceTokenizer(), lookahead=0
+    )
+
+    assert _segments(await _stream(adapter)) == SENTENCES
+    assert tts.max_running == 1
+
+
+async def test_stream_adapter_max_buffered_audio():
+    # the first sentence is slow, the audio of the second one stays buffered
+    tts = _SlowTTS(ttfb={SENTENCES[0]: 0.3}, audio_duration=0.5)
+    adapter = StreamAdapter(
+        tts=tts,
+        sentence_tokenizer=tokenize.basic.SentenceTokenizer(),
+        lookahead=3,
+        max_buffered_audio=0.5,
+    )
+
+    async with adapter.stream() as stream:
+        for sentence in SENTENCES:
+            stream.push_text(sentence + " ")
+            await asyncio.sleep(0.05)
+        stream.end_input()
+
+        assert _segments([audio async for audio in stream]) == SENTENCES
+
+    # the third sentence waited for the first one to be emitted
+    assert tts.max_running == 2
+
+
+async def test_stream_adapter_interrupted():
+    tts = _SlowTTS(ttfb=dict.fromkeys(SENTENCES, 5.0))
+    adapter = StreamAdapter(tts=tts, sentence_tokenizer=tokenize.basic.SentenceTokenizer())
+
+    stream = adapter.stream()
+    stream.push_text(" ".join(SENTENCES))
+    stream.end_input()
+    await asyncio.sleep(0.1)
+    assert tts.running == 3
+
+    await stream.aclose()
+    assert tts.running == 0
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from livekit.agents import WorkerLoadOptions, WorkerOptions, ipc, utils
+from livekit.agents.debug import tracing
+from livekit.agents.utils.hw import memory_limit, process_tree_pss
+from livekit.agents.worker import _DefaultLoadCalc
+
+
+def _running_job(loop_lag: float, **stats) -> SimpleNamespace:
+    return SimpleNamespace(
+        id="THEXEC_test",
+        status=ipc.job_executor.JobStatus.RUNNING,
+        started=True,
+        running_job=SimpleNamespace(job=SimpleNamespace(id="job", room=SimpleNamespace(name="r"))),
+        stats=ipc.proto.ProcStats(loop_lag_p99=loop_lag, **stats),
+    )
+
+
+def _fake_worker(
+    *,
+    load_options: WorkerLoadOptions | None = None,
+    processes: list[SimpleNamespace] | None = None,
+    pending_inferences: int | None = None,
+) -> SimpleNamespace:
+    opts = WorkerOptions(entrypoint_fnc=lambda _: None)  # type: ignore
+    opts.load_options = load_options or WorkerLoadOptions()
+
+    inference_executor = None
+    if pending_inferences is not None:
+        inference_executor = SimpleNamespace(pending_requests=pending_inferences)
+
+    return SimpleNamespace(
+        _opts=opts,
+        _proc_pool=SimpleNamespace(processes=processes or []),
+        _inference_executor=inference_executor,
+        _worker_load=0.0,
+    )
+
+
+@pytest.fixture
+def load_calc(monkeypatch: pytest.MonkeyPatch) -> _DefaultLoadCalc:
+    # without the sampling thread
+    calc = object.__new__(_DefaultLoadCalc)
+    calc._m_avg = utils.MovingAverage(5)
+    calc._memory_usage = 0.0
+    calc._lock = threading.Lock()
+    monkeypatch.setattr(_DefaultLoadCalc, "_instance", calc)
+    return calc
+
+
+def test_load_signals(load_calc: _DefaultLoadCalc):
+    load_calc._m_avg.add_sample(0.3)
+    load_calc._memory_usage = 0.2
+
+    worker = _fake_worker(
+        processes=[
+            _running_job(0.1),
+            _running_job(0.25),
+            SimpleNamespace(running_job=None, stats=ipc.proto.ProcStats(loop_lag_p99=2.0)),  # idle
+        ],
+        pending_inferences=4,
+    )
+
+    signals = _DefaultLoadCalc.get_signals(worker)  # type: ignore
+    assert signals == pytest.approx({"cpu": 0.3, "memory": 0.2, "loop_lag": 0.5, "inference": 0.25})
+    # the most loaded signal
+    assert _DefaultLoadCalc.get_load(worker) == pytest.approx(0.5)  # type: ignore
+
+
+def test_load_weights(load_calc: _DefaultLoadCalc):
+    load_calc._m_avg.add_sample(0.5)
+    load_calc._memory_usage = 0.9
+
+    worker = _fake_worker(
+        load_options=WorkerLoadOptions(memory_weight=0.0, cpu_weight=1.2, max_loop_lag=1.0),
+        processes=[_running_job(3.0)],
+    )
+    assert _DefaultLoadCalc.get_signals(worker)["loop_lag"] == 1.0  # type: ignore
+    assert _DefaultLoadCalc.get_load(worker) == pytest.approx(1.0)  # type: ignore
+
+    worker._opts.load_options.loop_lag_weight = 0.0
+    assert _DefaultLoadCalc.get_load(worker) == pytest.approx(0.6)  # type: ignore
+
+
+async def test_load_debug_route(load_calc: _DefaultLoadCalc):
+    load_calc._m_avg.add_sample(0.4)
+    worker = _fake_worker(pending_inferences=32)
+    worker._worker_load = 1.0
+
+    async with TestClient(TestServer(tracing._create_tracing_app(worker))) as client:  # type: ignore
+        resp = await client.get("/load/")
+        data = await resp.json()
+
+    assert data["load"] == 1.0
+    assert data["signals"]["cpu"] == pytest.approx({"usage": 0.4, "weight": 1.0, "load": 0.4})
+    assert data["signals"]["inference"]["usage"] == 1.0
+
+
+async def test_runners_debug_route(load_calc: _DefaultLoadCalc):
+    worker = _fake_worker(processes=[_running_job(0.2, cpu_usage=0.9, tasks=12)])
+
+    async with TestClient(TestServer(tracing._create_tracing_app(worker))) as client:  # type: ignore
+        resp = await client.get("/runners/")
+        data = await resp.json()
+
+    stats = data["runners"][0]["stats"]
+    assert stats["cpu_usage"] == 0.9
+    assert stats["loop_lag_p99"] == 0.2
+    assert stats["tasks"] == 12
+
+
+def test_process_tree_pss():
+    pss = process_tree_pss()
+    assert 0 < pss < memory_limit()